@@ -36,7 +36,7 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=[
-        "mcp>=0.1.0",
+        "mcp>=1.15.0",
         "websockets>=11.0",
         "playwright>=1.40.0",
         "aiofiles>=23.0.0",
@@ -355,6 +355,11 @@ def install(target: str, force: bool, extension: bool):
     is_flag=True,
     help="Skip confirmation prompts (legacy uninstall only)",
 )
+@click.option(
+    "--background",
+    is_flag=True,
+    help="Finish deleting data and Playwright cache after exiting (legacy uninstall only)",
+)
 def uninstall(
     target: str,
     clean_all: bool,
@@ -364,6 +369,7 @@ def uninstall(
     playwright: bool,
     dry_run: bool,
     yes: bool,
+    background: bool,
 ):
     """Remove MCP Browser configuration from AI coding tools.
 
@@ -389,6 +395,7 @@ def uninstall(
       --backup:        Create backup before removal (default: True)
       --dry-run:       Preview without making changes
       -y, --yes:       Skip confirmation prompts
+      --background:    Delete data and Playwright cache after exiting
 
     \b
     After uninstallation:
@@ -413,6 +420,7 @@ def uninstall(
             playwright=playwright,
             dry_run=dry_run,
             yes=yes,
+            background=background,
         )
         return
 
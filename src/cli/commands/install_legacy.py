@@ -1,11 +1,15 @@
 """Install command implementation for Claude Code/Desktop integration."""
 
 import json
+import os
 import shutil
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
 import click
 from rich.panel import Panel
@@ -13,6 +17,18 @@ from rich.table import Table
 
 from ..utils import console
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# ioctl request that makes a file share another file's blocks (Linux reflink)
+FICLONE = 0x40049409
+
 
 def detect_installation_type() -> Literal["pipx", "pip", "dev"]:
     """Detect how mcp-browser was installed.
@@ -289,12 +305,12 @@ def find_extension_directories() -> List[Path]:
 
     # Check current directory for extension
     local_extension = Path.cwd() / "mcp-browser-extension"
-    if local_extension.exists() and local_extension.is_dir():
+    if local_extension.is_dir():
         directories.append(local_extension)
 
     # Check mcp-browser-extensions/chrome in current directory
     local_mcp_extension = Path.cwd() / "mcp-browser-extensions" / "chrome"
-    if local_mcp_extension.exists() and local_mcp_extension.is_dir():
+    if local_mcp_extension.is_dir():
         directories.append(local_mcp_extension)
 
     return directories
@@ -311,11 +327,11 @@ def get_data_directories() -> List[Path]:
 
     # Check global .mcp-browser directory
     global_mcp = home / ".mcp-browser"
-    if global_mcp.exists() and global_mcp.is_dir():
+    if global_mcp.is_dir():
         # Add subdirectories individually
         for subdir in ["data", "logs", "config"]:
             subdir_path = global_mcp / subdir
-            if subdir_path.exists() and subdir_path.is_dir():
+            if subdir_path.is_dir():
                 directories.append(subdir_path)
 
         # Also check for the parent directory itself
@@ -323,7 +339,7 @@ def get_data_directories() -> List[Path]:
 
     # Check local .mcp-browser directory
     local_mcp = Path.cwd() / ".mcp-browser"
-    if local_mcp.exists() and local_mcp.is_dir():
+    if local_mcp.is_dir():
         directories.append(local_mcp)
 
     return directories
@@ -338,8 +354,6 @@ def get_playwright_cache_dir() -> Optional[Path]:
     if sys.platform == "darwin" or sys.platform == "linux":
         cache_dir = Path.home() / ".cache" / "ms-playwright"
     elif sys.platform == "win32":
-        import os
-
         local_appdata = os.environ.get("LOCALAPPDATA")
         if local_appdata:
             cache_dir = Path(local_appdata) / "ms-playwright"
@@ -348,7 +362,7 @@ def get_playwright_cache_dir() -> Optional[Path]:
     else:
         return None
 
-    if cache_dir.exists() and cache_dir.is_dir():
+    if cache_dir.is_dir():
         return cache_dir
 
     return None
@@ -364,19 +378,100 @@ def get_directory_size(path: Path) -> int:
         Total size in bytes
     """
     total = 0
-    try:
-        for item in path.rglob("*"):
-            if item.is_file():
-                try:
-                    total += item.stat().st_size
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
+    stack: List[Union[str, Path]] = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # is_dir()/is_file() come from the cached dirent, so
+                    # only the size lookup costs a stat call per file
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
 
     return total
 
 
+def rmtree_parallel(path: Path) -> None:
+    """Remove a directory tree, deleting its top-level subdirectories concurrently.
+
+    Caches such as Playwright's hold one large tree per browser, so removing
+    those side by side overlaps their unlink calls.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        OSError: If any part of the tree could not be removed, or if path is
+            a symlink
+    """
+    if os.path.islink(path):
+        # scandir would follow the link and empty its target; let rmtree
+        # refuse it before anything is deleted
+        shutil.rmtree(path)
+        return
+
+    with os.scandir(path) as entries:
+        subdirs = [
+            entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+        ]
+
+    if len(subdirs) > 1:
+        workers = min(32, len(subdirs), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Iterating the results re-raises the first worker error
+            list(pool.map(shutil.rmtree, subdirs))
+
+    shutil.rmtree(path)
+
+
+def remove_in_background(path: Path) -> Path:
+    """Move a directory aside and delete it from a detached process.
+
+    The rename is a single atomic call, so the directory disappears from its
+    original location at once; the detached process reclaims the space after
+    the CLI has exited.
+
+    A symlink is unlinked in place; only the link is removed, never the
+    directory it points to.
+
+    Args:
+        path: Directory to remove
+
+    Returns:
+        Temporary path the directory is being deleted from, or path itself
+        for a symlink
+
+    Raises:
+        OSError: If the directory could not be moved aside
+    """
+    if path.is_symlink():
+        path.unlink()
+        return path
+
+    doomed = path.with_name(f".{path.name}.removing-{os.getpid()}-{time.time_ns()}")
+    path.rename(doomed)
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)",
+            str(doomed),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return doomed
+
+
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human-readable string.
 
@@ -386,11 +481,33 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 10 more bits, so the bit length picks it without a loop
+    exponent = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    if exponent <= 0:
+        return f"{size_bytes:.1f} B"
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {SIZE_UNITS[exponent]}"
+
+
+def unique_directories(directories: List[Path]) -> List[Path]:
+    """Drop paths that resolve to a directory already in the list.
+
+    Entries are keyed on (device, inode), so a symlink such as
+    ./.mcp-browser -> ~/.mcp-browser is kept once, under its first path.
+
+    Args:
+        directories: Candidate directories in discovery order
+
+    Returns:
+        Existing directories with duplicates removed, order preserved
+    """
+    unique: Dict[Tuple[int, int], Path] = {}
+    for directory in directories:
+        try:
+            st = directory.stat()
+        except OSError:
+            continue
+        unique.setdefault((st.st_dev, st.st_ino), directory)
+    return list(unique.values())
 
 
 def get_cleanup_summary(
@@ -404,37 +521,69 @@ def get_cleanup_summary(
         include_playwright: Whether to include Playwright cache
 
     Returns:
-        Dictionary with files, directories, and total_size keys
+        Dictionary with directories, per-directory sizes, and total_size keys
     """
-    directories = []
-    total_size = 0
+    candidates: List[Path] = []
 
     if include_extensions:
-        ext_dirs = find_extension_directories()
-        for ext_dir in ext_dirs:
-            directories.append(ext_dir)
-            total_size += get_directory_size(ext_dir)
+        candidates.extend(find_extension_directories())
 
     if include_data:
-        data_dirs = get_data_directories()
-        for data_dir in data_dirs:
-            if data_dir not in directories:  # Avoid duplicates
-                directories.append(data_dir)
-                total_size += get_directory_size(data_dir)
+        candidates.extend(get_data_directories())
 
     if include_playwright:
         pw_cache = get_playwright_cache_dir()
         if pw_cache:
-            directories.append(pw_cache)
-            total_size += get_directory_size(pw_cache)
+            candidates.append(pw_cache)
+
+    directories = unique_directories(candidates)
+
+    sizes = {directory: get_directory_size(directory) for directory in directories}
+
+    # ~/.mcp-browser/data etc. are listed alongside ~/.mcp-browser itself;
+    # only top-level directories count toward the total
+    listed = set(directories)
+    total_size = sum(
+        size
+        for directory, size in sizes.items()
+        if listed.isdisjoint(directory.parents)
+    )
 
     return {
         "directories": [str(d) for d in directories],
+        "sizes": {str(d): size for d, size in sizes.items()},
         "total_size": total_size,
         "formatted_size": format_size(total_size),
     }
 
 
+def clone_or_copy(
+    src: Union[str, os.PathLike], dst: Union[str, os.PathLike]
+) -> Union[str, os.PathLike]:
+    """Copy a file, sharing its blocks via reflink where the filesystem allows.
+
+    On copy-on-write filesystems (btrfs, XFS) the clone costs no data copy;
+    anywhere else, including across filesystems, it falls back to copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path
+    """
+    if FCNTL_AVAILABLE and sys.platform == "linux":
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+
+    return shutil.copy2(src, dst)
+
+
 def create_backup(directories: List[Path], backup_path: Path) -> bool:
     """Create timestamped backup of directories before removal.
 
@@ -457,12 +606,18 @@ def create_backup(directories: List[Path], backup_path: Path) -> bool:
             rel_path = directory.name
             backup_dest = backup_path / rel_path
 
-            # Use shutil.copytree for directory copy
+            # Reflink-aware copy; backups must not share inodes with the
+            # originals, so hard links are never used
             try:
                 if directory.is_dir():
-                    shutil.copytree(directory, backup_dest, dirs_exist_ok=True)
+                    shutil.copytree(
+                        directory,
+                        backup_dest,
+                        copy_function=clone_or_copy,
+                        dirs_exist_ok=True,
+                    )
                 else:
-                    shutil.copy2(directory, backup_dest)
+                    clone_or_copy(directory, backup_dest)
 
                 console.print(f"  [dim]Backed up: {directory} → {backup_dest}[/dim]")
             except (OSError, PermissionError) as e:
@@ -495,7 +650,7 @@ def remove_extension_directories(dry_run: bool = False) -> Tuple[int, List[str]]
                 console.print(f"  [dim]Would remove: {directory}[/dim]")
                 count += 1
             else:
-                shutil.rmtree(directory)
+                rmtree_parallel(directory)
                 console.print(f"  [green]✓[/green] Removed: {directory}")
                 count += 1
         except (OSError, PermissionError) as e:
@@ -507,18 +662,20 @@ def remove_extension_directories(dry_run: bool = False) -> Tuple[int, List[str]]
 
 
 def remove_data_directories(
-    dry_run: bool = False, backup: bool = True
+    dry_run: bool = False, backup: bool = True, background: bool = False
 ) -> Tuple[int, List[str]]:
     """Remove data directories with optional backup.
 
     Args:
         dry_run: If True, only show what would be removed
         backup: If True and not dry_run, create backup before removal
+        background: If True, move directories aside and delete them from a
+            detached process instead of waiting for the deletion
 
     Returns:
         Tuple of (count_removed, errors)
     """
-    directories = get_data_directories()
+    directories = unique_directories(get_data_directories())
     count = 0
     errors = []
 
@@ -536,6 +693,8 @@ def remove_data_directories(
 
         console.print(f"[green]✓[/green] Backup created at: {backup_path}\n")
 
+    listed = set(directories)
+
     for directory in directories:
         try:
             if dry_run:
@@ -544,7 +703,13 @@ def remove_data_directories(
             else:
                 # Remove subdirectories first, then parent if it's empty
                 if directory.exists():
-                    shutil.rmtree(directory)
+                    if background:
+                        # A listed parent is moved aside whole, taking this
+                        # directory with it
+                        if listed.isdisjoint(directory.parents):
+                            remove_in_background(directory)
+                    else:
+                        rmtree_parallel(directory)
                     console.print(f"  [green]✓[/green] Removed: {directory}")
                     count += 1
         except (OSError, PermissionError) as e:
@@ -555,11 +720,15 @@ def remove_data_directories(
     return count, errors
 
 
-def remove_playwright_cache(dry_run: bool = False) -> Tuple[int, List[str]]:
+def remove_playwright_cache(
+    dry_run: bool = False, background: bool = False
+) -> Tuple[int, List[str]]:
     """Remove Playwright browser cache.
 
     Args:
         dry_run: If True, only show what would be removed
+        background: If True, move the cache aside and delete it from a
+            detached process instead of waiting for the deletion
 
     Returns:
         Tuple of (count_removed, errors)
@@ -575,7 +744,10 @@ def remove_playwright_cache(dry_run: bool = False) -> Tuple[int, List[str]]:
             console.print(f"  [dim]Would remove: {cache_dir}[/dim]")
             return 1, errors
         else:
-            shutil.rmtree(cache_dir)
+            if background:
+                remove_in_background(cache_dir)
+            else:
+                rmtree_parallel(cache_dir)
             console.print(f"  [green]✓[/green] Removed: {cache_dir}")
             return 1, errors
     except (OSError, PermissionError) as e:
@@ -810,6 +982,11 @@ def install(target: str, force: bool, extension: bool):
     is_flag=True,
     help="Skip confirmation prompts",
 )
+@click.option(
+    "--background",
+    is_flag=True,
+    help="Finish deleting data and Playwright cache after exiting",
+)
 def uninstall(
     target: str,
     clean_global: bool,
@@ -819,6 +996,7 @@ def uninstall(
     playwright: bool,
     dry_run: bool,
     yes: bool,
+    background: bool,
 ):
     """🗑️ Remove MCP Browser configuration from Claude Code/Desktop.
 
@@ -854,6 +1032,7 @@ def uninstall(
       --backup:        Create backup before removal (default: True)
       --dry-run:       Preview without making changes
       -y, --yes:       Skip confirmation prompts
+      --background:    Delete data and Playwright cache after exiting
 
     \b
     After uninstallation:
@@ -906,12 +1085,7 @@ def uninstall(
             table.add_column("Size", style="yellow", justify="right")
 
             for directory in summary["directories"]:
-                dir_path = Path(directory)
-                if dir_path.exists():
-                    size = get_directory_size(dir_path)
-                    table.add_row(directory, format_size(size))
-                else:
-                    table.add_row(directory, "[dim]N/A[/dim]")
+                table.add_row(directory, format_size(summary["sizes"][directory]))
 
             console.print(table)
             console.print(f"\n[bold]Total size:[/bold] {summary['formatted_size']}\n")
@@ -968,11 +1142,9 @@ def uninstall(
     if clean_extensions or clean_data or clean_playwright:
         console.print()
 
-        # Confirm unless --yes flag is set or it's a dry-run
+        # Confirm unless --yes flag is set or it's a dry-run; the phase 1
+        # summary already lists (and has sized) every directory
         if not dry_run and not yes:
-            summary = get_cleanup_summary(
-                clean_extensions, clean_data, clean_playwright
-            )
             if summary["directories"]:
                 if not confirm_removal(summary["directories"], "remove these items"):
                     console.print("\n[yellow]⚠ Cleanup cancelled by user[/yellow]")
@@ -991,14 +1163,14 @@ def uninstall(
         # Remove data directories
         if clean_data:
             console.print("\n[bold]Removing data directories...[/bold]")
-            count, errors = remove_data_directories(dry_run, backup)
+            count, errors = remove_data_directories(dry_run, backup, background)
             cleanup_count += count
             cleanup_errors.extend(errors)
 
         # Remove Playwright cache
         if clean_playwright:
             console.print("\n[bold]Removing Playwright cache...[/bold]")
-            count, errors = remove_playwright_cache(dry_run)
+            count, errors = remove_playwright_cache(dry_run, background)
             cleanup_count += count
             cleanup_errors.extend(errors)
 
@@ -21,6 +21,7 @@ from ..utils import (
     console,
 )
 from .init import init_project_extension_interactive
+from .install_legacy import get_directory_size
 
 
 def get_playwright_cache_dir():
@@ -50,14 +51,7 @@ def get_playwright_cache_dir():
 
 def get_directory_size_mb(path: Path) -> float:
     """Get directory size in megabytes."""
-    total = 0
-    try:
-        for entry in path.rglob("*"):
-            if entry.is_file():
-                total += entry.stat().st_size
-    except (OSError, PermissionError):
-        pass
-    return total / (1024 * 1024)
+    return get_directory_size(path) / (1024 * 1024)
 
 
 @click.command()
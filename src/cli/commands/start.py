@@ -10,7 +10,7 @@ import click
 from rich.panel import Panel
 
 from ..._version import __version__
-from ..utils import console
+from ..utils import console, install_event_loop_policy
 from ..utils.daemon import (
     get_server_status,
     remove_project_server,
@@ -185,6 +185,7 @@ def start(ctx, port, background, daemon):
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    install_event_loop_policy()
     try:
         asyncio.run(server.run_server())
     except KeyboardInterrupt:
@@ -2,7 +2,7 @@
 
 from .browser_client import BrowserClient, find_active_port
 from .display import console, show_version_info
-from .server import BrowserMCPServer
+from .server import BrowserMCPServer, install_event_loop_policy
 from .validation import (
     CONFIG_FILE,
     DATA_DIR,
@@ -24,6 +24,7 @@ __all__ = [
     "LOG_DIR",
     "DATA_DIR",
     "BrowserMCPServer",
+    "install_event_loop_policy",
     "BrowserClient",
     "find_active_port",
 ]
@@ -21,9 +21,32 @@ from ...services.dom_interaction_service import DOMInteractionService
 from ...services.storage_service import StorageConfig
 from .validation import CONFIG_FILE, LOG_DIR
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def install_event_loop_policy() -> bool:
+    """Use uvloop for the server's event loop when it is installed.
+
+    Must be called before asyncio.run(). The daemon is almost entirely
+    WebSocket I/O, which uvloop's transports handle with less per-send
+    overhead than the default selector loop.
+
+    Returns:
+        True if uvloop was installed as the event loop policy
+    """
+    if not UVLOOP_AVAILABLE or sys.platform == "win32":
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 class BrowserMCPServer:
     """Main server orchestrating all services.
 
@@ -346,6 +346,60 @@
         ...options
       });
       element.dispatchEvent(event);
+    },
+
+    // Set a form field value and fire the events frameworks listen for
+    setFieldValue(element, value) {
+      if (element.tagName.toLowerCase() === 'select') {
+        element.value = value;
+        this.triggerEvent(element, 'change');
+        return;
+      }
+
+      element.focus();
+      element.value = '';
+
+      // Set value directly (char-by-char typing causes issues with autocomplete sites like Google)
+      element.value = value;
+
+      // Trigger events using native input setter to work with React/Vue
+      const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value')?.set;
+      const nativeTextAreaValueSetter = Object.getOwnPropertyDescriptor(window.HTMLTextAreaElement.prototype, 'value')?.set;
+
+      const setter = element.tagName.toLowerCase() === 'textarea' ? nativeTextAreaValueSetter : nativeInputValueSetter;
+      if (setter) {
+        setter.call(element, value);
+      }
+
+      // Trigger input and change events
+      element.dispatchEvent(new Event('input', { bubbles: true }));
+      element.dispatchEvent(new Event('change', { bubbles: true }));
+      element.blur();
+    },
+
+    // Schedule form submission; returns how it will be submitted.
+    // Callers must sendResponse BEFORE the scheduled submit fires, because
+    // navigation destroys the content script context.
+    scheduleSubmit(form) {
+      // Priority: button[type="submit"] > input[type="submit"] > button (any)
+      const submitButton = form.querySelector('button[type="submit"], input[type="submit"]')
+        || form.querySelector('button');
+
+      setTimeout(() => {
+        try {
+          if (submitButton) {
+            submitButton.click();
+          } else {
+            form.submit();
+          }
+        } catch (e) {
+          // Page may have started navigating - that's OK
+        }
+      }, 50);
+
+      return submitButton
+        ? { method: 'button_click', buttonText: submitButton.textContent?.trim() }
+        : { method: 'form_submit' };
     }
   };
 
@@ -572,41 +626,59 @@
             fillElement.scrollIntoView({ behavior: 'smooth', block: 'center' });
             await new Promise(resolve => setTimeout(resolve, 300));
 
-            if (fillElement.tagName.toLowerCase() === 'select') {
-              fillElement.value = actualRequest.params.value;
-              domHelpers.triggerEvent(fillElement, 'change');
-            } else {
-              fillElement.focus();
-              fillElement.value = '';
+            domHelpers.setFieldValue(fillElement, actualRequest.params.value);
 
-              // Set value directly (char-by-char typing causes issues with autocomplete sites like Google)
-              fillElement.value = actualRequest.params.value;
+            sendResponse({
+              success: true,
+              elementInfo: domHelpers.getElementInfo(fillElement)
+            });
+            break;
 
-              // Trigger events using native input setter to work with React/Vue
-              const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value')?.set;
-              const nativeTextAreaValueSetter = Object.getOwnPropertyDescriptor(window.HTMLTextAreaElement.prototype, 'value')?.set;
+          case 'fill_form':
+            // Fill all fields (and optionally submit) in one round-trip
+            const fieldResults = [];
+            let firstFilled = null;
 
-              const setter = fillElement.tagName.toLowerCase() === 'textarea' ? nativeTextAreaValueSetter : nativeInputValueSetter;
-              if (setter) {
-                setter.call(fillElement, actualRequest.params.value);
+            for (const { selector: fieldSelector, value: fieldValue } of actualRequest.params.fields || []) {
+              const field = domHelpers.getElement({ selector: fieldSelector });
+              if (!field) {
+                fieldResults.push({ selector: fieldSelector, ok: false, error: 'Element not found' });
+                continue;
               }
+              if (!['input', 'textarea', 'select'].includes(field.tagName.toLowerCase())) {
+                fieldResults.push({ selector: fieldSelector, ok: false, error: 'Element is not a form field' });
+                continue;
+              }
+              domHelpers.setFieldValue(field, fieldValue);
+              firstFilled = firstFilled || field;
+              fieldResults.push({ selector: fieldSelector, ok: true, error: null });
+            }
 
-              // Trigger input and change events
-              fillElement.dispatchEvent(new Event('input', { bubbles: true }));
-              fillElement.dispatchEvent(new Event('change', { bubbles: true }));
-              fillElement.blur();
+            const allFilled = fieldResults.every(r => r.ok);
+            const batchForm = actualRequest.params.submit && allFilled
+              ? (firstFilled?.closest('form') || document.querySelector('form'))
+              : null;
+
+            if (actualRequest.params.submit && allFilled && !batchForm) {
+              sendResponse({ success: false, results: fieldResults, submitted: false, error: 'No form found on page' });
+              break;
             }
 
+            // Respond first: submission may navigate away from this page
             sendResponse({
-              success: true,
-              elementInfo: domHelpers.getElementInfo(fillElement)
+              success: allFilled,
+              results: fieldResults,
+              submitted: !!batchForm,
+              willNavigate: !!batchForm
             });
+            if (batchForm) {
+              domHelpers.scheduleSubmit(batchForm);
+            }
             break;
 
           case 'submit':
             // Find form - either from selector or auto-detect
             let formToSubmit = null;
-            let submitButton = null;
 
             const formElement = domHelpers.getElement(actualRequest.params);
             if (formElement) {
@@ -624,37 +696,11 @@
               break;
             }
 
-            // Try to find and click a submit button for better form handling
-            // Priority: button[type="submit"] > input[type="submit"] > button (any)
-            submitButton = formToSubmit.querySelector('button[type="submit"], input[type="submit"]')
-              || formToSubmit.querySelector('button');
-
-            if (submitButton) {
-              const buttonText = submitButton.textContent?.trim();
-              // CRITICAL: Send response FIRST, then click
-              // Form submission causes page navigation which destroys the content script
-              // context before sendResponse can complete. By sending first, we ensure
-              // the response reaches the background script before navigation.
-              sendResponse({ success: true, method: 'button_click', buttonText, willNavigate: true });
-              // Small delay to ensure response is fully sent before navigation
-              setTimeout(() => {
-                try {
-                  submitButton.click();
-                } catch (e) {
-                  // Page may have started navigating - that's OK
-                }
-              }, 50);
-            } else {
-              // Fallback to form.submit() - same pattern: respond first, then act
-              sendResponse({ success: true, method: 'form_submit', willNavigate: true });
-              setTimeout(() => {
-                try {
-                  formToSubmit.submit();
-                } catch (e) {
-                  // Page may have started navigating - that's OK
-                }
-              }, 50);
-            }
+            // CRITICAL: Send response FIRST, then submit
+            // Form submission causes page navigation which destroys the content script
+            // context before sendResponse can complete. scheduleSubmit delays the click
+            // slightly so the response reaches the background script before navigation.
+            sendResponse({ success: true, ...domHelpers.scheduleSubmit(formToSubmit), willNavigate: true });
             break;
 
           case 'get_element':
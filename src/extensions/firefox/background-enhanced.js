@@ -35,6 +35,21 @@ const STATUS_COLORS = {
   GREEN: '#4CAF50'   // Connected to server
 };
 
+// Sockets whose server accepts JSON in binary frames (connection_ack.acceptsBinaryJson).
+// Binary frames skip the server's UTF-8 text-frame validation.
+const binaryJsonSockets = new WeakSet();
+const jsonEncoder = new TextEncoder();
+
+/**
+ * Send a message as JSON, in a binary frame when the server accepts it
+ * @param {WebSocket} ws - Target socket
+ * @param {Object} message - Message to send
+ */
+function sendJson(ws, message) {
+  const json = JSON.stringify(message);
+  ws.send(binaryJsonSockets.has(ws) ? jsonEncoder.encode(json) : json);
+}
+
 /**
  * Set extension icon state based on connection status
  * Replaces badge-based status with colored icons
@@ -448,7 +463,7 @@ class WebSocketClient {
         };
 
         try {
-          ws.send(JSON.stringify(initMessage));
+          sendJson(ws, initMessage);
           console.log(`[WebSocketClient] Sent connection_init for port ${this.port}`);
         } catch (e) {
           console.error(`[WebSocketClient] Failed to send connection_init:`, e);
@@ -497,7 +512,7 @@ class WebSocketClient {
   async send(message) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN && this.connectionReady) {
       try {
-        this.ws.send(JSON.stringify(message));
+        sendJson(this.ws, message);
         // Animate icon to show outgoing message activity
         animateIconActivity('send');
         return true;
@@ -603,6 +618,9 @@ class WebSocketClient {
   async _handleConnectionAck(data) {
     console.log(`[WebSocketClient] Connection acknowledged for port ${this.port}`);
     this.connectionReady = true;
+    if (data.acceptsBinaryJson) {
+      binaryJsonSockets.add(this.ws);
+    }
 
     // Check for version mismatch
     if (data.serverVersion) {
@@ -705,11 +723,11 @@ class WebSocketClient {
 
     this.pendingGapRecovery = true;
     try {
-      this.ws.send(JSON.stringify({
+      sendJson(this.ws, {
         type: 'gap_recovery',
         fromSequence,
         toSequence
-      }));
+      });
     } catch (e) {
       console.error(`[WebSocketClient] Failed to request gap recovery:`, e);
       this.pendingGapRecovery = false;
@@ -750,7 +768,7 @@ class WebSocketClient {
       }
 
       try {
-        this.ws.send(JSON.stringify({ type: 'heartbeat', timestamp: Date.now() }));
+        sendJson(this.ws, { type: 'heartbeat', timestamp: Date.now() });
         // Note: Skip animation for heartbeats to avoid excessive visual noise
         // animateIconActivity('send');
       } catch (e) {
@@ -772,7 +790,7 @@ class WebSocketClient {
     while (this.messageQueue.length > 0) {
       const message = this.messageQueue.shift();
       try {
-        this.ws.send(JSON.stringify(message));
+        sendJson(this.ws, message);
       } catch (e) {
         console.error(`[WebSocketClient] Failed to send queued message:`, e);
         this.messageQueue.unshift(message);
@@ -1560,7 +1578,7 @@ class ConnectionManager {
   async _sendToConnection(connection, message) {
     if (connection.ws && connection.ws.readyState === WebSocket.OPEN && connection.connectionReady) {
       try {
-        connection.ws.send(JSON.stringify(message));
+        sendJson(connection.ws, message);
         return true;
       } catch (e) {
         console.error(`[ConnectionManager] Failed to send message to port ${connection.port}:`, e);
@@ -1595,6 +1613,9 @@ class ConnectionManager {
         if (data.type === 'connection_ack') {
           console.log(`[ConnectionManager] Connection acknowledged for port ${port}`);
           connection.connectionReady = true;
+          if (data.acceptsBinaryJson) {
+            binaryJsonSockets.add(ws);
+          }
 
           // Update project info if provided
           if (data.project_id) {
@@ -1808,10 +1829,10 @@ class ConnectionManager {
 
         // Send heartbeat
         try {
-          connection.ws.send(JSON.stringify({
+          sendJson(connection.ws, {
             type: 'heartbeat',
             timestamp: Date.now()
-          }));
+          });
           console.log(`[ConnectionManager] Heartbeat sent to port ${connection.port}`);
         } catch (e) {
           console.warn(`[ConnectionManager] Heartbeat failed for port ${connection.port}:`, e);
@@ -1837,7 +1858,7 @@ class ConnectionManager {
     while (connection.messageQueue.length > 0) {
       const message = connection.messageQueue.shift();
       try {
-        connection.ws.send(JSON.stringify(message));
+        sendJson(connection.ws, message);
       } catch (e) {
         console.error(`[ConnectionManager] Failed to send queued message to port ${connection.port}:`, e);
         connection.messageQueue.unshift(message);
@@ -1915,11 +1936,11 @@ class ConnectionManager {
     }, 30000);
 
     try {
-      connection.ws.send(JSON.stringify({
+      sendJson(connection.ws, {
         type: 'gap_recovery',
         fromSequence: fromSequence,
         toSequence: toSequence
-      }));
+      });
     } catch (e) {
       console.error(`[ConnectionManager] Failed to request gap recovery for port ${connection.port}:`, e);
       connection.pendingGapRecovery = false;
@@ -2158,11 +2179,11 @@ function requestGapRecovery(fromSequence, toSequence) {
   console.log(`[MCP Browser] Requesting gap recovery: sequences ${fromSequence} to ${toSequence}`);
 
   try {
-    client.ws.send(JSON.stringify({
+    sendJson(client.ws, {
       type: 'gap_recovery',
       fromSequence: fromSequence,
       toSequence: toSequence
-    }));
+    });
   } catch (e) {
     console.error('[MCP Browser] Failed to request gap recovery:', e);
     pendingGapRecovery = false;
@@ -2292,10 +2313,10 @@ function sendHeartbeat() {
 
     // Send heartbeat with timestamp
     try {
-      client.ws.send(JSON.stringify({
+      sendJson(client.ws, {
         type: 'heartbeat',
         timestamp: Date.now()
-      }));
+      });
       console.log('[MCP Browser] Heartbeat sent');
     } catch (e) {
       console.warn('[MCP Browser] Heartbeat failed:', e);
@@ -2636,10 +2657,13 @@ async function probePort(port) {
 
           // Handle connection_ack - server sends this first
           if (data.type === 'connection_ack') {
+            if (data.acceptsBinaryJson) {
+              binaryJsonSockets.add(ws);
+            }
             // Now request server info
             if (!serverInfoRequested) {
               serverInfoRequested = true;
-              ws.send(JSON.stringify({ type: 'server_info' }));
+              sendJson(ws, { type: 'server_info' });
             }
             return;
           }
@@ -2766,7 +2790,7 @@ async function connectToServer(port, serverInfo = null, retryAttempt = 0) {
         };
 
         try {
-          currentConnection.send(JSON.stringify(initMessage));
+          sendJson(currentConnection, initMessage);
           console.log(`[MCP Browser] Sent connection_init with lastSequence: ${lastSequenceReceived}`);
         } catch (e) {
           console.error('[MCP Browser] Failed to send connection_init:', e);
@@ -3053,6 +3077,14 @@ async function autoConnect() {
  * @param {Object} connection - Connection object that sent the message
  */
 function handleServerMessage(data, connection = null) {
+  // Server coalesces bursts of DOM commands into a single batch frame
+  if (data.type === 'dom_command_batch') {
+    for (const command of data.commands || []) {
+      handleServerMessage(command, connection);
+    }
+    return;
+  }
+
   console.log(`[MCP Browser] Handling server message:`, data.type);
 
   const port = connection?.port;
@@ -3096,12 +3128,12 @@ function handleServerMessage(data, connection = null) {
 
   // Send error back to CLI/server
   if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-    connection.ws.send(JSON.stringify({
+    sendJson(connection.ws, {
       type: 'error',
       error: 'no_registered_tab',
       message: 'No tab registered for control. Click the MCP Browser extension icon to register the current tab.',
       command: data.type
-    }));
+    });
   }
 }
 
@@ -3142,7 +3174,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
   // Show border for ALL control commands including navigate
   // Tab targeting has been fixed in handleServerMessage to be reliable
   const borderCommands = ['navigate', 'click', 'fill_field', 'scroll'];
-  const actionCommandTypes = ['click', 'fill', 'submit', 'scroll_to', 'check_checkbox', 'select_option'];
+  const actionCommandTypes = ['click', 'fill', 'fill_form', 'submit', 'scroll_to', 'check_checkbox', 'select_option'];
 
   // Check if should show border: either direct command or dom_command with action type
   const shouldShowBorder = borderCommands.includes(data.type) ||
@@ -3207,7 +3239,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             timestamp: new Date().toISOString()
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(tabInfo));
+            sendJson(connection.ws, tabInfo);
             console.log(`[MCP Browser] Sent tab info: ${tab.url}`);
           }
         });
@@ -3232,24 +3264,24 @@ async function executeCommandOnTab(tabId, data, connection = null) {
           // Send response back to server
           const clickResult = clickResults?.[0]?.result || { success: false, error: 'Script execution failed' };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'dom_command_response',
               requestId: data.requestId,
               success: clickResult.success,
               error: clickResult.error,
               selector: data.selector
-            }));
+            });
             console.log(`[MCP Browser] Sent click response: ${clickResult.success}`);
           }
         } catch (e) {
           console.error('[MCP Browser] Click failed:', e);
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'dom_command_response',
               requestId: data.requestId,
               success: false,
               error: e.message
-            }));
+            });
           }
         }
         break;
@@ -3277,25 +3309,25 @@ async function executeCommandOnTab(tabId, data, connection = null) {
           // Send response back to server
           const fillResult = fillResults?.[0]?.result || { success: false, error: 'Script execution failed' };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'dom_command_response',
               requestId: data.requestId,
               success: fillResult.success,
               error: fillResult.error,
               selector: data.selector
-            }));
+            });
             console.log(`[MCP Browser] Sent fill_field response: ${fillResult.success}`);
           }
         } catch (e) {
           console.error('[MCP Browser] Fill field failed:', e);
           // Send error response
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'dom_command_response',
               requestId: data.requestId,
               success: false,
               error: e.message
-            }));
+            });
           }
         }
         break;
@@ -3377,29 +3409,29 @@ async function executeCommandOnTab(tabId, data, connection = null) {
               url: `eval:${tabId}`,
               timestamp: new Date().toISOString()
             };
-            connection.ws.send(JSON.stringify(batchMessage));
+            sendJson(connection.ws, batchMessage);
             console.log(`[MCP Browser] Sent ${evalResult.capturedLogs.length} captured console logs from eval`);
           }
 
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'evaluate_js_response',
               requestId: data.requestId,
               success: evalResult.success,
               result: evalResult.result,
               error: evalResult.error,
               logsCaptures: evalResult.capturedLogs?.length || 0
-            }));
+            });
           }
         } catch (e) {
           console.error('[MCP Browser] Evaluate JS failed:', e);
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify({
+            sendJson(connection.ws, {
               type: 'evaluate_js_response',
               requestId: data.requestId,
               success: false,
               error: e.message
-            }));
+            });
           }
         }
         break;
@@ -3439,7 +3471,8 @@ async function executeCommandOnTab(tabId, data, connection = null) {
           // Execute extraction
           const contentResults = await chrome.scripting.executeScript({
             target: { tabId: tabId },
-            func: () => {
+            args: [data.options || {}],
+            func: (opts) => {
               try {
                 // Clone document for Readability
                 const documentClone = document.cloneNode(true);
@@ -3447,15 +3480,21 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                 const article = reader.parse();
 
                 if (article) {
+                  // Truncate in-page so oversized articles never cross the wire
+                  const text = article.textContent || '';
+                  const maxChars = opts.max_chars || text.length;
+                  const clipped = text.substring(0, maxChars);
                   return {
                     success: true,
                     content: {
                       title: article.title,
                       byline: article.byline,
                       excerpt: article.excerpt,
-                      content: article.textContent,
-                      htmlContent: article.content,
+                      content: clipped,
+                      textContent: clipped,
+                      htmlContent: opts.text_only ? null : article.content,
                       length: article.length,
+                      truncated: text.length > clipped.length,
                       siteName: article.siteName
                     },
                     url: window.location.href,
@@ -3487,7 +3526,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
 
           // Send to server via connection
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(response));
+            sendJson(connection.ws, response);
             console.log(`[MCP Browser] Sent content_extracted response for request ${data.requestId}`);
           } else {
             console.error(`[MCP Browser] No active connection to send response for request ${data.requestId}`);
@@ -3504,7 +3543,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             }
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(errorResponse));
+            sendJson(connection.ws, errorResponse);
           }
         }
         break;
@@ -3589,27 +3628,44 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                 });
               }
 
-              // Extract links
+              // Extract links (capped in-page; totalLinks keeps the real count)
               if (opts.include_links !== false) {
+                const maxLinks = opts.max_links || Infinity;
+                const maxHref = opts.max_href_length || Infinity;
+                let totalLinks = 0;
                 document.querySelectorAll('a[href]').forEach(link => {
                   const text = link.textContent?.trim() || '';
                   const ariaLabel = link.getAttribute('aria-label') || '';
                   // Skip empty links and javascript: links
                   if ((text || ariaLabel) && !link.href.startsWith('javascript:')) {
-                    result.links.push({
-                      href: link.href,
-                      text: text.substring(0, maxLen),
-                      ariaLabel: ariaLabel || null,
-                    });
+                    totalLinks++;
+                    if (result.links.length < maxLinks) {
+                      result.links.push({
+                        href: link.href.substring(0, maxHref),
+                        text: text.substring(0, maxLen),
+                        ariaLabel: ariaLabel ? ariaLabel.substring(0, maxLen) : null,
+                      });
+                    }
                   }
                 });
+                result.totalLinks = totalLinks;
               }
 
-              // Extract forms
+              // Extract forms (capped in-page; totalForms keeps the real count)
               if (opts.include_forms !== false) {
+                const maxForms = opts.max_forms || Infinity;
+                const fieldSelector = 'input, textarea, select, button[type="submit"]';
+                let totalForms = 0;
                 document.querySelectorAll('form').forEach(form => {
+                  if (result.forms.length >= maxForms) {
+                    // Past the cap: only count forms that would have been listed
+                    const visible = Array.from(form.querySelectorAll(fieldSelector))
+                      .some(field => field.type !== 'hidden');
+                    if (visible) totalForms++;
+                    return;
+                  }
                   const fields = [];
-                  form.querySelectorAll('input, textarea, select, button[type="submit"]').forEach(field => {
+                  form.querySelectorAll(fieldSelector).forEach(field => {
                     // Skip hidden fields
                     if (field.type === 'hidden') return;
 
@@ -3631,6 +3687,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                   });
 
                   if (fields.length > 0) {
+                    totalForms++;
                     result.forms.push({
                       id: form.id || null,
                       name: form.name || null,
@@ -3641,6 +3698,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                     });
                   }
                 });
+                result.totalForms = totalForms;
               }
 
               return { success: true, dom: result };
@@ -3657,7 +3715,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
           };
 
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(response));
+            sendJson(connection.ws, response);
             console.log(`[MCP Browser] Sent semantic_dom_extracted response`);
           }
         } catch (e) {
@@ -3668,7 +3726,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             response: { success: false, error: e.message }
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(errorResponse));
+            sendJson(connection.ws, errorResponse);
           }
         }
         break;
@@ -3748,7 +3806,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
           };
 
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(response));
+            sendJson(connection.ws, response);
             console.log(`[MCP Browser] Sent ascii_layout_extracted response for request ${data.requestId}`);
           } else {
             console.error(`[MCP Browser] No active connection to send ASCII layout for request ${data.requestId}`);
@@ -3761,7 +3819,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             response: { success: false, error: e.message }
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(errorResponse));
+            sendJson(connection.ws, errorResponse);
           }
         }
         break;
@@ -3781,7 +3839,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                 error: chrome.runtime.lastError.message
               };
               if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-                connection.ws.send(JSON.stringify(errorResponse));
+                sendJson(connection.ws, errorResponse);
               }
               return;
             }
@@ -3798,7 +3856,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             };
 
             if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-              connection.ws.send(JSON.stringify(response));
+              sendJson(connection.ws, response);
               console.log(`[MCP Browser] Sent screenshot_captured response for request ${data.requestId}`);
             } else {
               console.error(`[MCP Browser] No active connection to send screenshot for request ${data.requestId}`);
@@ -3813,7 +3871,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             error: e.message
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(errorResponse));
+            sendJson(connection.ws, errorResponse);
           }
         }
         break;
@@ -3841,7 +3899,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                 }
               };
               if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-                connection.ws.send(JSON.stringify(errorResponse));
+                sendJson(connection.ws, errorResponse);
               }
             } else if (response) {
               // Forward response back to server with requestId
@@ -3851,7 +3909,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
                 response: response
               };
               if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-                connection.ws.send(JSON.stringify(serverResponse));
+                sendJson(connection.ws, serverResponse);
                 console.log(`[MCP Browser] Sent dom_command_response for request ${data.requestId}`);
               }
             }
@@ -3867,7 +3925,7 @@ async function executeCommandOnTab(tabId, data, connection = null) {
             }
           };
           if (connection && connection.ws && connection.ws.readyState === WebSocket.OPEN) {
-            connection.ws.send(JSON.stringify(errorResponse));
+            sendJson(connection.ws, errorResponse);
           }
         }
         break;
@@ -3900,7 +3958,7 @@ async function sendToServer(message) {
   if (primaryPort) {
     const client = connectionManager.clients.get(primaryPort);
     if (client && client.ws && client.ws.readyState === WebSocket.OPEN && client.connectionReady) {
-      client.ws.send(JSON.stringify(message));
+      sendJson(client.ws, message);
       connectionStatus.messageCount++;
       return true;
     }
@@ -3937,7 +3995,7 @@ async function flushMessageQueue() {
   while (messageQueue.length > 0) {
     const message = messageQueue.shift();
     try {
-      client.ws.send(JSON.stringify(message));
+      sendJson(client.ws, message);
       connectionStatus.messageCount++;
     } catch (e) {
       console.error('[MCP Browser] Failed to send queued message:', e);
@@ -171,6 +171,29 @@ class BrowserState:
                     return conn
             return None
 
+    async def get_connection_or_any_active(
+        self, port: int
+    ) -> Optional[BrowserConnection]:
+        """Get the active connection for a port, falling back to any active one.
+
+        Equivalent to ``get_connection`` followed by ``get_any_active_connection``
+        but acquires the lock only once, which matters on the per-command path.
+
+        Args:
+            port: Port number (can be server port or client port)
+
+        Returns:
+            Matching active connection, else first active connection, else None
+        """
+        async with self._lock:
+            connection = self.connections.get(self.server_port_map.get(port, port))
+            if connection is not None and connection.is_active:
+                return connection
+            for conn in self.connections.values():
+                if conn.is_active:
+                    return conn
+            return None
+
     async def get_extension_connection(self) -> Optional[BrowserConnection]:
         """Get the active browser extension connection.
 
@@ -4,7 +4,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, Optional
 
 
 class ConsoleLevel(Enum):
@@ -128,11 +128,11 @@ class ConsoleMessage:
             metadata=data.get("metadata", {}),
         )
 
-    def matches_filter(self, level_filter: Optional[List[str]] = None) -> bool:
+    def matches_filter(self, level_filter: Optional[Collection[str]] = None) -> bool:
         """Check if message matches filter criteria.
 
         Args:
-            level_filter: Optional list of levels to include
+            level_filter: Optional levels to include (a set for O(1) lookups)
 
         Returns:
             True if message matches filter
@@ -111,6 +111,103 @@ class AppleScriptService:
     end tell
     """
 
+    # JavaScript snippets for DOM operations. The structure is fixed; the
+    # per-call arguments are spliced in as one JSON literal (``%s``), which
+    # also quotes selectors and values safely.
+    CLICK_JS = """
+        (function() {
+            try {
+                const args = %s;
+                const el = document.querySelector(args.selector);
+                if (!el) {
+                    return JSON.stringify({
+                        success: false,
+                        error: 'Element not found: ' + args.selector
+                    });
+                }
+                el.click();
+                return JSON.stringify({
+                    success: true,
+                    element: {
+                        tagName: el.tagName,
+                        id: el.id,
+                        className: el.className
+                    }
+                });
+            } catch(e) {
+                return JSON.stringify({
+                    success: false,
+                    error: 'Error: ' + e.message
+                });
+            }
+        })();
+        """
+
+    FILL_FIELD_JS = """
+        (function() {
+            try {
+                const args = %s;
+                const el = document.querySelector(args.selector);
+                if (!el) {
+                    return JSON.stringify({
+                        success: false,
+                        error: 'Element not found: ' + args.selector
+                    });
+                }
+                el.value = args.value;
+                el.dispatchEvent(new Event('input', { bubbles: true }));
+                el.dispatchEvent(new Event('change', { bubbles: true }));
+                return JSON.stringify({
+                    success: true,
+                    element: {
+                        tagName: el.tagName,
+                        value: el.value
+                    }
+                });
+            } catch(e) {
+                return JSON.stringify({
+                    success: false,
+                    error: 'Error: ' + e.message
+                });
+            }
+        })();
+        """
+
+    GET_ELEMENT_JS = """
+        (function() {
+            try {
+                const args = %s;
+                const el = document.querySelector(args.selector);
+                if (!el) {
+                    return JSON.stringify({
+                        success: false,
+                        error: 'Element not found: ' + args.selector
+                    });
+                }
+                return JSON.stringify({
+                    success: true,
+                    element: {
+                        tagName: el.tagName,
+                        id: el.id,
+                        className: el.className,
+                        text: el.textContent.substring(0, 100),
+                        value: el.value || '',
+                        attributes: {
+                            href: el.getAttribute('href'),
+                            src: el.getAttribute('src'),
+                            type: el.getAttribute('type')
+                        }
+                    }
+                });
+            } catch(e) {
+                return JSON.stringify({
+                    success: false,
+                    error: 'Error: ' + e.message
+                });
+            }
+        })();
+        """
+
     def __init__(self):
         """Initialize AppleScript service with platform detection."""
         self.is_macos = platform.system() == "Darwin"
@@ -391,34 +488,7 @@ Note: Console log capture requires the browser extension.
         Returns:
             {"success": bool, "error": str, "data": dict}
         """
-        # JavaScript to click element with error handling
-        js_code = f"""
-        (function() {{
-            try {{
-                const el = document.querySelector('{selector}');
-                if (!el) {{
-                    return JSON.stringify({{
-                        success: false,
-                        error: 'Element not found: {selector}'
-                    }});
-                }}
-                el.click();
-                return JSON.stringify({{
-                    success: true,
-                    element: {{
-                        tagName: el.tagName,
-                        id: el.id,
-                        className: el.className
-                    }}
-                }});
-            }} catch(e) {{
-                return JSON.stringify({{
-                    success: false,
-                    error: 'Error: ' + e.message
-                }});
-            }}
-        }})();
-        """
+        js_code = self.CLICK_JS % json.dumps({"selector": selector})
 
         result = await self.execute_javascript(js_code, browser)
 
@@ -453,40 +523,10 @@ Note: Console log capture requires the browser extension.
         Returns:
             {"success": bool, "error": str, "data": dict}
         """
-        # Escape value for JavaScript
-        escaped_value = (
-            value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+        js_code = self.FILL_FIELD_JS % json.dumps(
+            {"selector": selector, "value": value}
         )
 
-        js_code = f"""
-        (function() {{
-            try {{
-                const el = document.querySelector('{selector}');
-                if (!el) {{
-                    return JSON.stringify({{
-                        success: false,
-                        error: 'Element not found: {selector}'
-                    }});
-                }}
-                el.value = '{escaped_value}';
-                el.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                el.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                return JSON.stringify({{
-                    success: true,
-                    element: {{
-                        tagName: el.tagName,
-                        value: el.value
-                    }}
-                }});
-            }} catch(e) {{
-                return JSON.stringify({{
-                    success: false,
-                    error: 'Error: ' + e.message
-                }});
-            }}
-        }})();
-        """
-
         result = await self.execute_javascript(js_code, browser)
 
         if not result["success"]:
@@ -519,39 +559,7 @@ Note: Console log capture requires the browser extension.
         Returns:
             {"success": bool, "error": str, "data": dict}
         """
-        js_code = f"""
-        (function() {{
-            try {{
-                const el = document.querySelector('{selector}');
-                if (!el) {{
-                    return JSON.stringify({{
-                        success: false,
-                        error: 'Element not found: {selector}'
-                    }});
-                }}
-                return JSON.stringify({{
-                    success: true,
-                    element: {{
-                        tagName: el.tagName,
-                        id: el.id,
-                        className: el.className,
-                        text: el.textContent.substring(0, 100),
-                        value: el.value || '',
-                        attributes: {{
-                            href: el.getAttribute('href'),
-                            src: el.getAttribute('src'),
-                            type: el.getAttribute('type')
-                        }}
-                    }}
-                }});
-            }} catch(e) {{
-                return JSON.stringify({{
-                    success: false,
-                    error: 'Error: ' + e.message
-                }});
-            }}
-        }})();
-        """
+        js_code = self.GET_ELEMENT_JS % json.dumps({"selector": selector})
 
         result = await self.execute_javascript(js_code, browser)
 
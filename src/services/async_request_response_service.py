@@ -91,12 +91,12 @@ class AsyncRequestResponseService:
         try:
             # Send WebSocket message
             await websocket.send(json.dumps(message))
-            logger.debug(f"Sent {message_type} request {request_id}")
+            logger.debug("Sent %s request %s", message_type, request_id)
 
             # Wait for response with timeout
             try:
                 result: Any = await asyncio.wait_for(response_future, timeout=timeout)
-                logger.debug(f"Received response for request {request_id}")
+                logger.debug("Received response for request %s", request_id)
                 return result  # type: ignore[return-value]
             except asyncio.TimeoutError:
                 logger.warning(
@@ -130,7 +130,7 @@ class AsyncRequestResponseService:
             if not future.done():
                 future.set_result(response_data)
                 logger.debug(
-                    f"Completed request {request_id} (type: {pending['type']})"
+                    "Completed request %s (type: %s)", request_id, pending["type"]
                 )
                 return True
             else:
@@ -190,7 +190,7 @@ class AsyncRequestResponseService:
             # Remove if completed
             if future.done():
                 to_remove.append(request_id)
-                logger.debug(f"Cleaning up completed request {request_id}")
+                logger.debug("Cleaning up completed request %s", request_id)
 
             # Remove if expired (and cancel future)
             elif age > self._request_timeout:
@@ -230,7 +230,7 @@ class AsyncRequestResponseService:
             future = request_data["future"]
             if not future.done():
                 future.cancel()
-                logger.debug(f"Cancelled pending request {request_id}")
+                logger.debug("Cancelled pending request %s", request_id)
 
         # Clear pending requests
         self._pending_requests.clear()
@@ -184,6 +184,17 @@ class CapabilityDetector:
             "active_methods": active_methods,
         }
 
+    async def has_extension_connection(self) -> bool:
+        """Check whether any browser extension is connected.
+
+        This is the only part of the report that changes at runtime, so
+        callers caching the report use it to detect a stale copy.
+
+        Returns:
+            True if at least one extension connection exists
+        """
+        return await self._has_any_extension_connection()
+
     async def _has_any_extension_connection(self) -> bool:
         """Check if any browser extension is connected.
 
@@ -292,6 +303,10 @@ class BrowserController:
             ),
         )
 
+        # Platform support is fixed for the process lifetime, so the
+        # "no method available" response only needs to be built once
+        self._no_method_error_response = self._build_no_method_error()
+
         logger.info(
             f"BrowserController initialized: mode={self.mode}, "
             f"browser={self.preferred_browser}, fallback={self.fallback_enabled}"
@@ -1064,6 +1079,14 @@ class BrowserController:
     def _no_method_available_error(self) -> Dict[str, Any]:
         """Return error when no control method is available.
 
+        Returns:
+            Error response dictionary (a shallow copy of the cached response)
+        """
+        return dict(self._no_method_error_response)
+
+    def _build_no_method_error(self) -> Dict[str, Any]:
+        """Build the error response used when no control method is available.
+
         Returns:
             Error response dictionary
         """
@@ -1,17 +1,29 @@
 """Browser service for handling browser communication."""
 
 import asyncio
-import json
+import itertools
 import logging
+import secrets
 from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 from ..models import BrowserState, ConsoleMessage
 from .async_request_response_service import AsyncRequestResponseService
+from .websocket_service import _json_dumps
 
 logger = logging.getLogger(__name__)
 
+# Synthetic port window for connections without a (host, port) remote address
+_FALLBACK_PORT_BASE = 8875
+_FALLBACK_PORT_SLOTS = 20
+_FALLBACK_PORT_MASK = (1 << _FALLBACK_PORT_SLOTS) - 1
+
+# DOM command request IDs only need to be unique among this process's
+# in-flight requests: a per-process nonce plus a counter is enough.
+_PID_NONCE = secrets.token_hex(4)
+_REQ_SEQ = itertools.count()
+
 
 class BrowserService:
     """Service for handling browser connections and messages."""
@@ -35,6 +47,15 @@ class BrowserService:
         self._message_buffer: Dict[int, deque] = {}
         self._buffer_tasks: Dict[int, asyncio.Task] = {}
         self._buffer_interval = 2.5  # seconds
+        self._parse_offload_threshold = 256  # batch size parsed off the event loop
+        self._current_port = _FALLBACK_PORT_BASE  # for messages without an address
+        self._port_used_mask = 0  # bit i set => _FALLBACK_PORT_BASE + i in use
+
+        # Per-connection DOM command write coalescing
+        self._dom_send_queues: Dict[int, asyncio.Queue] = {}
+        self._dom_writer_tasks: Dict[int, asyncio.Task] = {}
+        self._dom_batch_window = 0.005  # seconds
+        self._dom_batch_max = 16
 
         # Async request/response service for WebSocket communication
         self._async_rr_service = (
@@ -73,6 +94,9 @@ class BrowserService:
             user_agent=connection_info.get("user_agent"),
         )
 
+        self._current_port = client_port
+        self._mark_port_used(client_port, True)
+
         # Initialize message buffer for this port
         if client_port not in self._message_buffer:
             self._message_buffer[client_port] = deque(maxlen=1000)
@@ -92,7 +116,7 @@ class BrowserService:
 
         # Send acknowledgment with server_port (user-facing port)
         await websocket.send(
-            json.dumps(
+            _json_dumps(
                 {
                     "type": "connection_ack",
                     "port": server_port,  # Return server port to client
@@ -119,8 +143,17 @@ class BrowserService:
                 self._buffer_tasks[port].cancel()
                 del self._buffer_tasks[port]
 
+            # Stop DOM command writer for this connection
+            self._stop_dom_writer(port)
+
             # Remove connection from state
             await self.browser_state.remove_connection(port)
+            self._mark_port_used(port, False)
+
+            if port == self._current_port:
+                self._current_port = next(
+                    iter(self.browser_state.connections), _FALLBACK_PORT_BASE
+                )
 
             logger.info(f"Browser disconnected on port {port}")
 
@@ -142,28 +175,37 @@ class BrowserService:
             # Create console message
             message = ConsoleMessage.from_websocket_data(data, port)
 
-            # Update browser state
-            await self.browser_state.update_connection_activity(port)
+            await self._record_console_message(port, message)
+
+        except Exception as e:
+            logger.error(f"Failed to handle console message: {e}")
+
+    async def _record_console_message(self, port: int, message: ConsoleMessage) -> None:
+        """Update connection state and buffer a parsed console message.
 
-            # Update URL if provided
-            if message.url:
-                await self.browser_state.update_connection_url(port, message.url)
+        Args:
+            port: Client port the message arrived on
+            message: Parsed console message
+        """
+        # Update browser state
+        await self.browser_state.update_connection_activity(port)
 
-            # Initialize buffer if not present
-            if port not in self._message_buffer:
-                self._message_buffer[port] = deque(maxlen=1000)
+        # Update URL if provided
+        if message.url:
+            await self.browser_state.update_connection_url(port, message.url)
 
-            # Add to buffer
-            self._message_buffer[port].append(message)
+        # Initialize buffer if not present
+        if port not in self._message_buffer:
+            self._message_buffer[port] = deque(maxlen=1000)
 
-            # Log high-priority messages immediately
-            if message.level.value in ["error", "warn", "warning"]:
-                logger.info(
-                    f"[{message.level.value.upper()}] from port {port}: {message.message[:100]}"
-                )
+        # Add to buffer
+        self._message_buffer[port].append(message)
 
-        except Exception as e:
-            logger.error(f"Failed to handle console message: {e}")
+        # Log high-priority messages immediately
+        if message.level.value in ["error", "warn", "warning"]:
+            logger.info(
+                f"[{message.level.value.upper()}] from port {port}: {message.message[:100]}"
+            )
 
     async def handle_batch_messages(self, data: Dict[str, Any]) -> None:
         """Handle batch of console messages.
@@ -179,11 +221,42 @@ class BrowserService:
             else self._get_current_port()
         )
 
-        for msg_data in messages:
-            msg_data["_remote_address"] = remote_address
-            await self.handle_console_message(msg_data)
+        if len(messages) > self._parse_offload_threshold:
+            # Parse very large batches in a worker thread so other websocket
+            # traffic is not starved while thousands of messages are decoded
+            parsed = await asyncio.to_thread(self._parse_console_batch, messages, port)
+            for message in parsed:
+                try:
+                    await self._record_console_message(port, message)
+                except Exception as e:
+                    logger.error(f"Failed to handle console message: {e}")
+        else:
+            for msg_data in messages:
+                msg_data["_remote_address"] = remote_address
+                await self.handle_console_message(msg_data)
+
+        logger.debug("Processed batch of %s messages from port %s", len(messages), port)
+
+    @staticmethod
+    def _parse_console_batch(
+        messages: List[Dict[str, Any]], port: int
+    ) -> List[ConsoleMessage]:
+        """Parse raw console message dicts, skipping malformed entries.
+
+        Args:
+            messages: Raw message dicts from the browser
+            port: Client port the batch arrived on
 
-        logger.debug(f"Processed batch of {len(messages)} messages from port {port}")
+        Returns:
+            List of parsed console messages
+        """
+        parsed = []
+        for msg_data in messages:
+            try:
+                parsed.append(ConsoleMessage.from_websocket_data(msg_data, port))
+            except Exception as e:
+                logger.error(f"Failed to handle console message: {e}")
+        return parsed
 
     async def handle_extension_init(self, data: Dict[str, Any]) -> None:
         """Handle extension initialization - mark connection as browser extension.
@@ -212,7 +285,7 @@ class BrowserService:
             data: DOM response data
         """
         # Forward to DOM interaction service if available
-        if hasattr(self, "dom_interaction_service"):
+        if self.dom_interaction_service is not None:
             await self.dom_interaction_service.handle_dom_response(data)
         else:
             logger.warning(
@@ -252,22 +325,15 @@ class BrowserService:
                 return extension_conn
             return await self.browser_state.get_any_active_connection()
 
-        # BrowserState.get_connection now automatically handles server→client port mapping
-        connection = await self.browser_state.get_connection(port)
+        # Single lock round-trip: server→client port mapping, then any active
+        connection = await self.browser_state.get_connection_or_any_active(port)
 
-        if connection and connection.is_active:
-            # If we found the connection but it's not an extension, prefer extension
-            if not connection.is_extension:
-                extension_conn = await self.browser_state.get_extension_connection()
-                if extension_conn:
-                    return extension_conn
-            return connection
-
-        # Fallback: prefer extension, then any active
-        extension_conn = await self.browser_state.get_extension_connection()
-        if extension_conn:
-            return extension_conn
-        return await self.browser_state.get_any_active_connection()
+        # If the connection found is not an extension, prefer the extension
+        if connection is None or not connection.is_extension:
+            extension_conn = await self.browser_state.get_extension_connection()
+            if extension_conn:
+                return extension_conn
+        return connection
 
     async def send_dom_command(
         self, port: int, command: Dict[str, Any], tab_id: Optional[int] = None
@@ -292,29 +358,126 @@ class BrowserService:
             return False
 
         try:
-            import uuid
-
-            request_id = str(uuid.uuid4())
+            request_id = f"{_PID_NONCE}{next(_REQ_SEQ):x}"
 
-            await connection.websocket.send(
-                json.dumps(
-                    {
-                        "type": "dom_command",
-                        "requestId": request_id,
-                        "tabId": tab_id,
-                        "command": command,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
+            await self._queue_dom_frame(
+                connection,
+                {
+                    "type": "dom_command",
+                    "requestId": request_id,
+                    "tabId": tab_id,
+                    "command": command,
+                    "timestamp": datetime.now().isoformat(),
+                },
             )
 
-            logger.debug(f"Sent DOM command to port {port}: {command.get('type')}")
+            logger.debug("Sent DOM command to port %s: %s", port, command.get("type"))
             return True
 
         except Exception as e:
             logger.error(f"Failed to send DOM command: {e}")
             return False
 
+    async def _queue_dom_frame(self, connection: Any, frame: Dict[str, Any]) -> None:
+        """Queue a DOM command frame for coalesced sending on a connection.
+
+        Frames queued within ``_dom_batch_window`` of each other are sent as a
+        single ``dom_command_batch`` message, reducing per-command socket writes.
+
+        Args:
+            connection: BrowserConnection to send on
+            frame: DOM command message
+
+        Raises:
+            Exception: If the underlying websocket send fails
+        """
+        port = connection.port
+        queue = self._dom_send_queues.get(port)
+        if queue is None:
+            queue = self._dom_send_queues[port] = asyncio.Queue()
+
+        task = self._dom_writer_tasks.get(port)
+        if task is None or task.done():
+            self._dom_writer_tasks[port] = asyncio.create_task(
+                self._dom_batch_writer(queue, connection.websocket)
+            )
+
+        sent = asyncio.get_running_loop().create_future()
+        await queue.put((frame, sent))
+        await sent
+
+    async def _dom_batch_writer(self, queue: asyncio.Queue, websocket: Any) -> None:
+        """Drain queued DOM frames, sending bursts as one batch message.
+
+        Args:
+            queue: Queue of (frame, future) pairs for one connection
+            websocket: WebSocket connection to write to
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._dom_batch_window
+
+            try:
+                while len(batch) < self._dom_batch_max:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                if len(batch) == 1:
+                    message = batch[0][0]
+                else:
+                    message = {
+                        "type": "dom_command_batch",
+                        "commands": [frame for frame, _ in batch],
+                    }
+
+                await websocket.send(_json_dumps(message))
+            except asyncio.CancelledError:
+                self._fail_dom_sends(
+                    batch, ConnectionError("Browser connection closed")
+                )
+                raise
+            except Exception as e:
+                self._fail_dom_sends(batch, e)
+            else:
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_result(None)
+
+    def _stop_dom_writer(self, port: int) -> None:
+        """Cancel the DOM command writer for a port and fail pending sends.
+
+        Args:
+            port: Client port number
+        """
+        task = self._dom_writer_tasks.pop(port, None)
+        if task and not task.done():
+            task.cancel()
+
+        queue = self._dom_send_queues.pop(port, None)
+        if queue is not None:
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            self._fail_dom_sends(pending, ConnectionError("Browser connection closed"))
+
+    @staticmethod
+    def _fail_dom_sends(batch: List[Any], error: Exception) -> None:
+        """Propagate a send failure to every waiter in a batch.
+
+        Args:
+            batch: List of (frame, future) pairs
+            error: Exception to set on pending futures
+        """
+        for _, sent in batch:
+            if not sent.done():
+                sent.set_exception(error)
+
     async def navigate_browser(self, port: int, url: str) -> bool:
         """Navigate browser to a URL.
 
@@ -333,7 +496,7 @@ class BrowserService:
 
         try:
             await connection.websocket.send(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "navigate",
                         "url": url,
@@ -351,7 +514,10 @@ class BrowserService:
             return False
 
     async def query_logs(
-        self, port: int, last_n: int = 100, level_filter: Optional[List[str]] = None
+        self,
+        port: int,
+        last_n: int = 100,
+        level_filter: Optional[Collection[str]] = None,
     ) -> List[ConsoleMessage]:
         """Query console logs for a port.
 
@@ -437,7 +603,11 @@ class BrowserService:
         return messages[-last_n:] if last_n else messages
 
     async def extract_content(
-        self, port: int, tab_id: Optional[int] = None, timeout: float = 10.0
+        self,
+        port: int,
+        tab_id: Optional[int] = None,
+        timeout: float = 10.0,
+        max_chars: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Extract readable content from a browser tab using Readability.
 
@@ -445,6 +615,8 @@ class BrowserService:
             port: Port number
             tab_id: Optional specific tab ID
             timeout: Timeout for extraction operation
+            max_chars: Optional cap on article text, applied in-page so the
+                full text and HTML never cross the websocket
 
         Returns:
             Dict containing extracted content or error information
@@ -482,6 +654,11 @@ class BrowserService:
             result = await self._async_rr_service.send_request(
                 websocket=connection.websocket,
                 message_type="extract_content",
+                payload=(
+                    {"options": {"max_chars": max_chars, "text_only": True}}
+                    if max_chars
+                    else None
+                ),
                 timeout=timeout,
                 tab_id=tab_id,
             )
@@ -715,13 +892,23 @@ class BrowserService:
     async def handle_screenshot_captured(self, data: Dict[str, Any]) -> None:
         """Handle screenshot captured response from extension.
 
+        The base64 image string is passed through by reference; it is never
+        copied or re-encoded here.
+
         Args:
             data: Response data including screenshot base64 data
         """
         request_id = data.get("requestId")
 
         if request_id:
-            success = await self._async_rr_service.handle_response(request_id, data)
+            image = data.get("data")
+            response = {
+                "success": data.get("success", image is not None),
+                "data": image,
+                "mimeType": data.get("mimeType", "image/png"),
+                "error": data.get("error"),
+            }
+            success = await self._async_rr_service.handle_response(request_id, response)
             if success:
                 logger.info(
                     f"Received screenshot_captured response for request {request_id}"
@@ -737,6 +924,10 @@ class BrowserService:
         # Shutdown async request/response service
         await self._async_rr_service.shutdown()
 
+        # Stop DOM command writers
+        for port in list(self._dom_writer_tasks):
+            self._stop_dom_writer(port)
+
         # Cancel all buffer tasks
         for port, task in list(self._buffer_tasks.items()):
             if not task.done():
@@ -764,7 +955,7 @@ class BrowserService:
         if self.storage_service and messages:
             try:
                 await self.storage_service.store_messages_batch(messages)
-                logger.debug(f"Flushed {len(messages)} messages for port {port}")
+                logger.debug("Flushed %s messages for port %s", len(messages), port)
             except Exception as e:
                 logger.error(f"Failed to store messages: {e}")
                 # Put messages back in buffer on failure
@@ -793,12 +984,25 @@ class BrowserService:
         Returns:
             Next available port number
         """
-        # Simple incrementing port assignment
-        used_ports = set(self._message_buffer.keys())
-        for port in range(8875, 8895):
-            if port not in used_ports:
-                return port
-        return 8875
+        # Lowest clear bit of the occupancy mask is the first free slot
+        free = ~self._port_used_mask & _FALLBACK_PORT_MASK
+        if not free:
+            return _FALLBACK_PORT_BASE
+        return _FALLBACK_PORT_BASE + (free & -free).bit_length() - 1
+
+    def _mark_port_used(self, port: int, used: bool) -> None:
+        """Update the fallback port occupancy mask.
+
+        Args:
+            port: Port number (ignored if outside the fallback window)
+            used: True to mark the port in use, False to release it
+        """
+        slot = port - _FALLBACK_PORT_BASE
+        if 0 <= slot < _FALLBACK_PORT_SLOTS:
+            if used:
+                self._port_used_mask |= 1 << slot
+            else:
+                self._port_used_mask &= ~(1 << slot)
 
     def _get_current_port(self) -> int:
         """Get current active port.
@@ -806,9 +1010,7 @@ class BrowserService:
         Returns:
             Current active port or default
         """
-        if self._message_buffer:
-            return next(iter(self._message_buffer.keys()))
-        return 8875
+        return self._current_port
 
     async def get_browser_stats(self) -> Dict[str, Any]:
         """Get browser statistics.
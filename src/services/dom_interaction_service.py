@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -281,32 +281,130 @@ class DOMInteractionService:
         form_data: Dict[str, Any],
         submit: bool = False,
         tab_id: Optional[int] = None,
+        sequential: bool = False,
     ) -> Dict[str, Any]:
         """Fill multiple form fields.
 
+        All fields (and the optional submit) are sent to the extension as a
+        single ``fill_form`` command, so the whole form costs one round-trip.
+        Extensions that predate ``fill_form`` fall back to per-field commands.
+
         Args:
             port: Browser port number
             form_data: Dictionary mapping selectors to values
             submit: Whether to submit form after filling
             tab_id: Optional specific tab ID
+            sequential: Fill fields one at a time in the per-field fallback,
+                for forms where one field's value depends on another
 
         Returns:
             Result dictionary with field results
         """
+        response = await self._send_dom_command(
+            port=port,
+            command_type="fill_form",
+            params={
+                "fields": [
+                    {"selector": selector, "value": value}
+                    for selector, value in form_data.items()
+                ],
+                "submit": submit,
+            },
+            tab_id=tab_id,
+        )
+
+        if response.get("error") == "Unknown command type":
+            return await self._fill_form_per_field(
+                port, form_data, submit, tab_id, sequential
+            )
+
+        field_results = response.get("results")
+        if field_results is None:
+            # Transport-level failure (no connection, timeout)
+            return {
+                "success": False,
+                "fields": {},
+                "errors": [response.get("error", "Unknown error")],
+                "submitted": False,
+            }
+
         results = {"success": True, "fields": {}, "errors": []}
+        for field in field_results:
+            selector = field.get("selector")
+            results["fields"][selector] = {
+                "success": field.get("ok", False),
+                "error": field.get("error"),
+            }
+            if not field.get("ok"):
+                results["errors"].append(f"{selector}: {field.get('error')}")
+                results["success"] = False
 
-        # Fill each field
-        for selector, value in form_data.items():
-            try:
-                result = await self.fill_field(
-                    port=port, selector=selector, value=value, tab_id=tab_id
-                )
-                results["fields"][selector] = result
-                if not result.get("success"):
-                    results["errors"].append(f"{selector}: {result.get('error')}")
-            except Exception as e:
-                results["errors"].append(f"{selector}: {str(e)}")
+        if not response.get("success") and response.get("error"):
+            results["errors"].append(response["error"])
+            results["success"] = False
+
+        if submit:
+            results["submitted"] = response.get("submitted", False)
+
+        return results
+
+    async def _fill_form_per_field(
+        self,
+        port: int,
+        form_data: Dict[str, Any],
+        submit: bool = False,
+        tab_id: Optional[int] = None,
+        sequential: bool = False,
+    ) -> Dict[str, Any]:
+        """Fill form fields with one command per field (legacy extensions).
+
+        Fields are filled concurrently unless ``sequential`` is set, so the
+        commands share the DOM write batch instead of paying one round-trip
+        each.
+
+        Args:
+            port: Browser port number
+            form_data: Dictionary mapping selectors to values
+            submit: Whether to submit form after filling
+            tab_id: Optional specific tab ID
+            sequential: Await each field before sending the next
+
+        Returns:
+            Result dictionary with field results
+        """
+        results: Dict[str, Any] = {"success": True, "fields": {}, "errors": []}
+        field_results: List[Union[Dict[str, Any], BaseException]]
+
+        if sequential:
+            field_results = []
+            for selector, value in form_data.items():
+                try:
+                    field_results.append(
+                        await self.fill_field(
+                            port=port, selector=selector, value=value, tab_id=tab_id
+                        )
+                    )
+                except Exception as e:
+                    field_results.append(e)
+        else:
+            field_results = await asyncio.gather(
+                *(
+                    self.fill_field(
+                        port=port, selector=selector, value=value, tab_id=tab_id
+                    )
+                    for selector, value in form_data.items()
+                ),
+                return_exceptions=True,
+            )
+
+        for selector, result in zip(form_data, field_results):
+            if isinstance(result, BaseException):
+                results["errors"].append(f"{selector}: {str(result)}")
                 results["success"] = False
+                continue
+            results["fields"][selector] = result
+            if not result.get("success"):
+                results["errors"].append(f"{selector}: {result.get('error')}")
 
         # Submit form if requested
         if submit and results["success"]:
@@ -426,18 +524,15 @@ class DOMInteractionService:
         self._pending_requests[request_id] = future
 
         try:
-            # Send DOM command via WebSocket
-            import json
-
-            await connection.websocket.send(
-                json.dumps(
-                    {
-                        "type": "dom_command",
-                        "requestId": request_id,
-                        "tabId": tab_id,
-                        "command": {"type": command_type, "params": params},
-                    }
-                )
+            # Send DOM command via the browser service's coalescing writer
+            await self.browser_service._queue_dom_frame(
+                connection,
+                {
+                    "type": "dom_command",
+                    "requestId": request_id,
+                    "tabId": tab_id,
+                    "command": {"type": command_type, "params": params},
+                },
             )
 
             # Wait for response with timeout
@@ -487,4 +582,4 @@ class DOMInteractionService:
             self._pending_requests.pop(request_id, None)
 
         if expired_requests:
-            logger.debug(f"Cleaned up {len(expired_requests)} expired DOM requests")
+            logger.debug("Cleaned up %s expired DOM requests", len(expired_requests))
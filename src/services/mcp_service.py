@@ -6,13 +6,18 @@ This module provides 5 consolidated MCP tools for browser control:
 - browser_screenshot: capture screenshots
 - browser_form: fill_form (multi-field), submit_form
 - browser_extract: content, semantic_dom
+
+plus browser_chain, which runs several of those calls in one request.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Sequence, cast
 
 from mcp.server import Server
-from mcp.types import ImageContent, TextContent, Tool
+from mcp.types import ImageContent, ListToolsResult, TextContent, Tool
 
 from .tools import (
     CapabilityToolService,
@@ -28,6 +33,380 @@ from .tools import (
 logger = logging.getLogger(__name__)
 
 
+# Shared by every tool schema; a single object reused by reference
+_PORT_PROP = {
+    "type": "integer",
+    "description": "Browser port (optional, auto-detected from running daemon)",
+}
+
+# Tool 1: browser_action - navigate, click, fill, select, wait
+_BROWSER_ACTION_TOOL = Tool(
+    name="browser_action",
+    description="Perform browser actions: navigate to URL, click elements, "
+    "fill single form field, select dropdown option, or wait for element",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["navigate", "click", "fill", "select", "wait"],
+                "description": "Action to perform",
+            },
+            "port": _PORT_PROP,
+            # navigate params
+            "url": {
+                "type": "string",
+                "description": "[navigate] URL to navigate to",
+            },
+            # click/fill/select/wait params
+            "selector": {
+                "type": "string",
+                "description": "[click/fill/select/wait] CSS selector for element",
+            },
+            "xpath": {
+                "type": "string",
+                "description": "[click/fill/select] XPath expression for element",
+            },
+            "text": {
+                "type": "string",
+                "description": "[click] Text content to match for clicking",
+            },
+            "index": {
+                "type": "integer",
+                "description": "[click/fill] Element index if multiple matches",
+                "default": 0,
+            },
+            # fill params
+            "value": {
+                "type": "string",
+                "description": "[fill] Value to fill in the field",
+            },
+            # select params
+            "option_value": {
+                "type": "string",
+                "description": "[select] Option value attribute to select",
+            },
+            "option_text": {
+                "type": "string",
+                "description": "[select] Option text content to select",
+            },
+            "option_index": {
+                "type": "integer",
+                "description": "[select] Option index to select",
+            },
+            # wait params
+            "timeout": {
+                "type": "integer",
+                "description": "[wait] Timeout in milliseconds",
+                "default": 5000,
+            },
+        },
+        "required": ["action"],
+    },
+)
+
+# Tool 2: browser_query - logs, element, capabilities
+_BROWSER_QUERY_TOOL = Tool(
+    name="browser_query",
+    description="Query browser state: get console logs, element info, or capabilities",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "enum": ["logs", "element", "capabilities"],
+                "description": "Type of query to perform",
+            },
+            "port": _PORT_PROP,
+            # logs params
+            "last_n": {
+                "type": "integer",
+                "description": "[logs] Number of recent logs to return",
+                "default": 100,
+            },
+            "level_filter": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["debug", "info", "log", "warn", "error"],
+                },
+                "description": "[logs] Filter by log levels",
+            },
+            # element params
+            "selector": {
+                "type": "string",
+                "description": "[element] CSS selector for the element",
+            },
+            "xpath": {
+                "type": "string",
+                "description": "[element] XPath expression for the element",
+            },
+            "text": {
+                "type": "string",
+                "description": "[element] Text content to match",
+            },
+        },
+        "required": ["query"],
+    },
+)
+
+# Tool 3: browser_screenshot - standalone for visual feedback
+_BROWSER_SCREENSHOT_TOOL = Tool(
+    name="browser_screenshot",
+    description="Capture a screenshot of browser viewport",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "port": _PORT_PROP,
+            "ports": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Optional list of browser ports to capture concurrently (overrides port)",
+            },
+            "url": {
+                "type": "string",
+                "description": "Optional URL to navigate to before screenshot",
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Return the image even if it is identical to the previous capture",
+                "default": False,
+            },
+        },
+        "required": [],
+    },
+)
+
+# Tool 4: browser_form - fill_form (multi-field), submit
+_BROWSER_FORM_TOOL = Tool(
+    name="browser_form",
+    description="Form operations: fill multiple fields at once or submit form",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["fill", "submit"],
+                "description": "Form action to perform",
+            },
+            "port": _PORT_PROP,
+            # fill params
+            "form_data": {
+                "type": "object",
+                "description": "[fill] Object mapping selectors to values",
+                "additionalProperties": {"type": "string"},
+            },
+            "submit": {
+                "type": "boolean",
+                "description": "[fill] Submit form after filling",
+                "default": False,
+            },
+            "sequential": {
+                "type": "boolean",
+                "description": "[fill] Fill fields strictly one after another (for dependent fields)",
+                "default": False,
+            },
+            # submit params
+            "selector": {
+                "type": "string",
+                "description": "[submit] CSS selector for form or form element",
+            },
+            "xpath": {
+                "type": "string",
+                "description": "[submit] XPath expression for form",
+            },
+        },
+        "required": ["action"],
+    },
+)
+
+# Tool 5: browser_extract - content, semantic_dom, ascii
+_BROWSER_EXTRACT_TOOL = Tool(
+    name="browser_extract",
+    description="Extract page content: readable article content, semantic DOM structure, or ASCII layout visualization",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "extract": {
+                "type": "string",
+                "enum": ["content", "semantic_dom", "ascii", "all"],
+                "description": "Type of extraction: content (readable article), semantic_dom (structure), ascii (layout visualization), or all (content and semantic_dom in parallel)",
+            },
+            "port": _PORT_PROP,
+            "ports": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Optional list of browser ports to extract from concurrently (overrides port)",
+            },
+            "tab_id": {
+                "type": "integer",
+                "description": "Optional specific tab ID to extract from",
+            },
+            # semantic_dom params
+            "include_headings": {
+                "type": "boolean",
+                "description": "[semantic_dom] Extract h1-h6 headings (default: true)",
+            },
+            "include_landmarks": {
+                "type": "boolean",
+                "description": "[semantic_dom] Extract ARIA landmarks (default: true)",
+            },
+            "include_links": {
+                "type": "boolean",
+                "description": "[semantic_dom] Extract links with text (default: true)",
+            },
+            "include_forms": {
+                "type": "boolean",
+                "description": "[semantic_dom] Extract forms and fields (default: true)",
+            },
+            "max_text_length": {
+                "type": "integer",
+                "description": "[semantic_dom] Max characters per text field (default: 100)",
+            },
+            # ascii params
+            "ascii_width": {
+                "type": "integer",
+                "description": "[ascii] ASCII canvas width in characters (default: 80)",
+                "default": 80,
+            },
+        },
+        "required": ["extract"],
+    },
+)
+
+# Tool 6: browser_chain - several tool calls, independent ones concurrently
+_BROWSER_CHAIN_TOOL = Tool(
+    name="browser_chain",
+    description="Run several browser tool calls in one request. Calls without "
+    "dependencies between them run concurrently; calls on the same port run "
+    "one at a time in list order",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "enum": [
+                                "browser_action",
+                                "browser_query",
+                                "browser_screenshot",
+                                "browser_form",
+                                "browser_extract",
+                            ],
+                            "description": "Tool to call",
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "description": "Arguments for the tool",
+                        },
+                        "depends_on": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "Indexes of earlier calls that must finish first",
+                        },
+                    },
+                    "required": ["name"],
+                },
+                "description": "Tool calls to run",
+            },
+        },
+        "required": ["calls"],
+    },
+)
+
+# Static tool catalog, built once at import time
+_TOOLS: list[Tool] = [
+    _BROWSER_ACTION_TOOL,
+    _BROWSER_QUERY_TOOL,
+    _BROWSER_SCREENSHOT_TOOL,
+    _BROWSER_FORM_TOOL,
+    _BROWSER_EXTRACT_TOOL,
+    _BROWSER_CHAIN_TOOL,
+]
+
+# Content hash of the catalog, sent as _meta.catalogVersion with tools/list so
+# clients can tell whether a cached copy is still current
+_CATALOG_ETAG = hashlib.sha256(
+    json.dumps(
+        [tool.model_dump(mode="json") for tool in _TOOLS], sort_keys=True
+    ).encode()
+).hexdigest()[:16]
+_LIST_TOOLS_RESULT = ListToolsResult(
+    tools=_TOOLS, _meta={"catalogVersion": _CATALOG_ETAG}
+)
+
+# Dispatch table value types: a tool handler, and a per-action sub-handler
+_ToolHandler = Callable[
+    [dict[str, Any]], Awaitable[Sequence[ImageContent | TextContent]]
+]
+_SubHandler = Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
+
+
+class _CoalescingStdout:
+    """Buffer stdio JSON-RPC frames and write them out in batches.
+
+    The MCP SDK writes and flushes stdout once per message, and each call
+    is a worker-thread hop plus a write(2). Frames are buffered here and
+    written together once FLUSH_BYTES accumulate or FLUSH_DELAY passes.
+    The SDK writes one complete newline-terminated message per call, so
+    flushes always land on message boundaries.
+    """
+
+    FLUSH_BYTES = 64 * 1024
+    FLUSH_DELAY = 0.001  # seconds
+
+    def __init__(self, stdout: Any) -> None:
+        """Wrap an anyio async text file.
+
+        Args:
+            stdout: anyio.AsyncFile opened for text writes
+        """
+        self._stdout = stdout
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    async def write(self, data: str) -> None:
+        """Buffer one frame."""
+        self._buffer.append(data)
+        self._buffered += len(data)
+
+    async def flush(self) -> None:
+        """Flush now if the buffer is large, otherwise schedule a short timer."""
+        if self._buffered >= self.FLUSH_BYTES:
+            await self._drain()
+        elif self._buffer and self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def aclose(self) -> None:
+        """Cancel the timer and write out anything still buffered."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self._drain()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.FLUSH_DELAY)
+        self._timer = None
+        await self._drain()
+
+    async def _drain(self) -> None:
+        # Take the buffer under the lock so overlapping drains keep order
+        async with self._lock:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+            await self._stdout.write(data)
+            await self._stdout.flush()
+
+
 class MCPService:
     """MCP server for browser tools with consolidated tool set.
 
@@ -37,8 +416,32 @@ class MCPService:
     - browser_screenshot: capture screenshots
     - browser_form: fill_form, submit_form
     - browser_extract: content, semantic_dom
+
+    browser_chain batches calls to the tools above.
     """
 
+    __slots__ = (
+        "browser_service",
+        "dom_interaction_service",
+        "browser_controller",
+        "capability_detector",
+        "port_resolver",
+        "navigation_tool_service",
+        "screenshot_tool_service",
+        "dom_tool_service",
+        "form_tool_service",
+        "log_query_tool_service",
+        "capability_tool_service",
+        "content_extraction_tool_service",
+        "_tool_map",
+        "_action_map",
+        "_query_map",
+        "_form_map",
+        "_extract_map",
+        "_port_locks",
+        "server",
+    )
+
     def __init__(
         self,
         browser_service=None,
@@ -83,6 +486,39 @@ class MCPService:
         self.content_extraction_tool_service = ContentExtractionToolService(
             browser_service=browser_service
         )
+        # Dispatch tables: tool name / action / query / form / extract -> handler
+        self._tool_map: dict[str, _ToolHandler] = {
+            "browser_action": self._handle_browser_action,
+            "browser_query": self._handle_browser_query,
+            "browser_screenshot": self._handle_screenshot,
+            "browser_form": self._handle_browser_form,
+            "browser_extract": self._handle_browser_extract,
+            "browser_chain": self._handle_browser_chain,
+        }
+        self._action_map: dict[str, _SubHandler] = {
+            "navigate": self._action_navigate,
+            "click": self._action_click,
+            "fill": self._action_fill,
+            "select": self._action_select,
+            "wait": self._action_wait,
+        }
+        self._query_map: dict[str, _SubHandler] = {
+            "logs": self._query_logs,
+            "element": self._query_element,
+            "capabilities": self._query_capabilities,
+        }
+        self._form_map: dict[str, _SubHandler] = {
+            "fill": self._form_fill,
+            "submit": self._form_submit,
+        }
+        self._extract_map: dict[str, _SubHandler] = {
+            "content": self._extract_content,
+            "semantic_dom": self._extract_semantic_dom,
+            "ascii": self._extract_ascii,
+            "all": self._extract_all,
+        }
+        # Serializes chained calls that target the same browser port
+        self._port_locks: dict[int | None, asyncio.Lock] = {}
         # Initialize server with version info
         self.server = Server(
             name="mcp-browser",
@@ -93,311 +529,68 @@ class MCPService:
         self._setup_tools()
 
     def _setup_tools(self) -> None:
-        """Set up consolidated MCP tools (5 tools instead of 13)."""
-
-        @self.server.list_tools()
-        async def handle_list_tools() -> list[Tool]:
-            """List available tools."""
-            return [
-                # Tool 1: browser_action - navigate, click, fill, select, wait
-                Tool(
-                    name="browser_action",
-                    description="Perform browser actions: navigate to URL, click elements, "
-                    "fill single form field, select dropdown option, or wait for element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "action": {
-                                "type": "string",
-                                "enum": ["navigate", "click", "fill", "select", "wait"],
-                                "description": "Action to perform",
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Browser port (optional, auto-detected from running daemon)",
-                            },
-                            # navigate params
-                            "url": {
-                                "type": "string",
-                                "description": "[navigate] URL to navigate to",
-                            },
-                            # click/fill/select/wait params
-                            "selector": {
-                                "type": "string",
-                                "description": "[click/fill/select/wait] CSS selector for element",
-                            },
-                            "xpath": {
-                                "type": "string",
-                                "description": "[click/fill/select] XPath expression for element",
-                            },
-                            "text": {
-                                "type": "string",
-                                "description": "[click] Text content to match for clicking",
-                            },
-                            "index": {
-                                "type": "integer",
-                                "description": "[click/fill] Element index if multiple matches",
-                                "default": 0,
-                            },
-                            # fill params
-                            "value": {
-                                "type": "string",
-                                "description": "[fill] Value to fill in the field",
-                            },
-                            # select params
-                            "option_value": {
-                                "type": "string",
-                                "description": "[select] Option value attribute to select",
-                            },
-                            "option_text": {
-                                "type": "string",
-                                "description": "[select] Option text content to select",
-                            },
-                            "option_index": {
-                                "type": "integer",
-                                "description": "[select] Option index to select",
-                            },
-                            # wait params
-                            "timeout": {
-                                "type": "integer",
-                                "description": "[wait] Timeout in milliseconds",
-                                "default": 5000,
-                            },
-                        },
-                        "required": ["action"],
-                    },
-                ),
-                # Tool 2: browser_query - logs, element, capabilities
-                Tool(
-                    name="browser_query",
-                    description="Query browser state: get console logs, element info, or capabilities",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "enum": ["logs", "element", "capabilities"],
-                                "description": "Type of query to perform",
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Browser port (optional, auto-detected from running daemon)",
-                            },
-                            # logs params
-                            "last_n": {
-                                "type": "integer",
-                                "description": "[logs] Number of recent logs to return",
-                                "default": 100,
-                            },
-                            "level_filter": {
-                                "type": "array",
-                                "items": {
-                                    "type": "string",
-                                    "enum": ["debug", "info", "log", "warn", "error"],
-                                },
-                                "description": "[logs] Filter by log levels",
-                            },
-                            # element params
-                            "selector": {
-                                "type": "string",
-                                "description": "[element] CSS selector for the element",
-                            },
-                            "xpath": {
-                                "type": "string",
-                                "description": "[element] XPath expression for the element",
-                            },
-                            "text": {
-                                "type": "string",
-                                "description": "[element] Text content to match",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                # Tool 3: browser_screenshot - standalone for visual feedback
-                Tool(
-                    name="browser_screenshot",
-                    description="Capture a screenshot of browser viewport",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "port": {
-                                "type": "integer",
-                                "description": "Browser port (optional, auto-detected from running daemon)",
-                            },
-                            "url": {
-                                "type": "string",
-                                "description": "Optional URL to navigate to before screenshot",
-                            },
-                        },
-                        "required": [],
-                    },
-                ),
-                # Tool 4: browser_form - fill_form (multi-field), submit
-                Tool(
-                    name="browser_form",
-                    description="Form operations: fill multiple fields at once or submit form",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "action": {
-                                "type": "string",
-                                "enum": ["fill", "submit"],
-                                "description": "Form action to perform",
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Browser port (optional, auto-detected from running daemon)",
-                            },
-                            # fill params
-                            "form_data": {
-                                "type": "object",
-                                "description": "[fill] Object mapping selectors to values",
-                                "additionalProperties": {"type": "string"},
-                            },
-                            "submit": {
-                                "type": "boolean",
-                                "description": "[fill] Submit form after filling",
-                                "default": False,
-                            },
-                            # submit params
-                            "selector": {
-                                "type": "string",
-                                "description": "[submit] CSS selector for form or form element",
-                            },
-                            "xpath": {
-                                "type": "string",
-                                "description": "[submit] XPath expression for form",
-                            },
-                        },
-                        "required": ["action"],
-                    },
-                ),
-                # Tool 5: browser_extract - content, semantic_dom, ascii
-                Tool(
-                    name="browser_extract",
-                    description="Extract page content: readable article content, semantic DOM structure, or ASCII layout visualization",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "extract": {
-                                "type": "string",
-                                "enum": ["content", "semantic_dom", "ascii"],
-                                "description": "Type of extraction: content (readable article), semantic_dom (structure), or ascii (layout visualization)",
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Browser port (optional, auto-detected from running daemon)",
-                            },
-                            "tab_id": {
-                                "type": "integer",
-                                "description": "Optional specific tab ID to extract from",
-                            },
-                            # semantic_dom params
-                            "include_headings": {
-                                "type": "boolean",
-                                "description": "[semantic_dom] Extract h1-h6 headings (default: true)",
-                            },
-                            "include_landmarks": {
-                                "type": "boolean",
-                                "description": "[semantic_dom] Extract ARIA landmarks (default: true)",
-                            },
-                            "include_links": {
-                                "type": "boolean",
-                                "description": "[semantic_dom] Extract links with text (default: true)",
-                            },
-                            "include_forms": {
-                                "type": "boolean",
-                                "description": "[semantic_dom] Extract forms and fields (default: true)",
-                            },
-                            "max_text_length": {
-                                "type": "integer",
-                                "description": "[semantic_dom] Max characters per text field (default: 100)",
-                            },
-                            # ascii params
-                            "ascii_width": {
-                                "type": "integer",
-                                "description": "[ascii] ASCII canvas width in characters (default: 80)",
-                                "default": 80,
-                            },
-                        },
-                        "required": ["extract"],
-                    },
-                ),
-            ]
-
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str, arguments: dict
-        ) -> list[TextContent | ImageContent]:
-            """Handle tool calls with routing to consolidated handlers."""
-
-            if name == "browser_action":
-                return await self._handle_browser_action(arguments)
-            elif name == "browser_query":
-                return await self._handle_browser_query(arguments)
-            elif name == "browser_screenshot":
-                return await self._handle_screenshot(arguments)
-            elif name == "browser_form":
-                return await self._handle_browser_form(arguments)
-            elif name == "browser_extract":
-                return await self._handle_browser_extract(arguments)
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        """Register the tool list and call handlers with the MCP server."""
+        self.server.list_tools()(self._list_tools)
+        self.server.call_tool()(self._call_tool)
+
+    async def _list_tools(self) -> ListToolsResult:
+        """List available tools, tagged with the catalog version."""
+        return _LIST_TOOLS_RESULT
+
+    async def _call_tool(
+        self, name: str, arguments: dict
+    ) -> Sequence[TextContent | ImageContent]:
+        """Handle tool calls with routing to consolidated handlers."""
+        handler = self._tool_map.get(name)
+        if handler is None:
+            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
 
     # ========================================================================
     # Consolidated Handler: browser_action (navigate, click, fill, select, wait)
     # ========================================================================
 
     async def _handle_browser_action(
-        self, arguments: Dict[str, Any]
-    ) -> List[TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
         """Handle browser_action tool - consolidated actions.
 
         Actions: navigate, click, fill, select, wait
         """
         action = arguments.get("action")
-
-        if action == "navigate":
-            return await self._action_navigate(arguments)
-        elif action == "click":
-            return await self._action_click(arguments)
-        elif action == "fill":
-            return await self._action_fill(arguments)
-        elif action == "select":
-            return await self._action_select(arguments)
-        elif action == "wait":
-            return await self._action_wait(arguments)
-        else:
+        handler = self._action_map.get(action) if isinstance(action, str) else None
+        if handler is None:
             return [
                 TextContent(
                     type="text",
                     text=f"Unknown action: {action}. Valid: navigate, click, fill, select, wait",
                 )
             ]
+        return await handler(arguments)
 
-    async def _action_navigate(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _action_navigate(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle navigation action."""
         url = arguments.get("url")
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
             return [TextContent(type="text", text=port_warning or "No port available")]
 
+        self.screenshot_tool_service.clear_frame_hash(port)
         return await self.navigation_tool_service.handle_navigate(port, url)
 
-    async def _action_click(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _action_click(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle click action."""
         return await self.dom_tool_service.handle_click(arguments)
 
-    async def _action_fill(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _action_fill(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle fill action (single field)."""
         return await self.dom_tool_service.handle_fill(arguments)
 
-    async def _action_select(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _action_select(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle select action (dropdown)."""
         return await self.dom_tool_service.handle_select(arguments)
 
-    async def _action_wait(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _action_wait(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle wait action."""
         return await self.dom_tool_service.handle_wait(arguments)
 
@@ -406,29 +599,24 @@ class MCPService:
     # ========================================================================
 
     async def _handle_browser_query(
-        self, arguments: Dict[str, Any]
-    ) -> List[TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
         """Handle browser_query tool - consolidated queries.
 
         Queries: logs, element, capabilities
         """
         query = arguments.get("query")
-
-        if query == "logs":
-            return await self._query_logs(arguments)
-        elif query == "element":
-            return await self._query_element(arguments)
-        elif query == "capabilities":
-            return await self._query_capabilities(arguments)
-        else:
+        handler = self._query_map.get(query) if isinstance(query, str) else None
+        if handler is None:
             return [
                 TextContent(
                     type="text",
                     text=f"Unknown query: {query}. Valid: logs, element, capabilities",
                 )
             ]
+        return await handler(arguments)
 
-    async def _query_logs(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _query_logs(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle logs query."""
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -444,24 +632,60 @@ class MCPService:
 
         return [TextContent(type="text", text=result["formatted_text"])]
 
-    async def _query_element(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _query_element(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle element query."""
         return await self.dom_tool_service.handle_get_element(arguments)
 
-    async def _query_capabilities(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _query_capabilities(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle capabilities query."""
         # Delegate to capability tool service
         result = await self.capability_tool_service.handle_get_capabilities()
         return [TextContent(type="text", text=result["formatted_text"])]
 
+    async def _fan_out_ports(
+        self,
+        handler: Callable[[dict[str, Any]], Awaitable[Sequence[Any]]],
+        arguments: dict[str, Any],
+    ) -> list[ImageContent | TextContent]:
+        """Run a single-port handler for every port in ``arguments["ports"]``.
+
+        The per-port calls are gathered, so sweeping M browsers costs the
+        slowest round-trip rather than the sum of all of them.
+
+        Args:
+            handler: Tool handler that serves one port
+            arguments: Tool arguments including a ``ports`` list
+
+        Returns:
+            Each port's content, preceded by a "Port N:" label
+        """
+        ports = arguments["ports"]
+        single = {k: v for k, v in arguments.items() if k != "ports"}
+        results = await asyncio.gather(
+            *(handler({**single, "port": port}) for port in ports),
+            return_exceptions=True,
+        )
+
+        contents: list[ImageContent | TextContent] = []
+        for port, result in zip(ports, results):
+            contents.append(TextContent(type="text", text=f"Port {port}:"))
+            if isinstance(result, BaseException):
+                contents.append(TextContent(type="text", text=f"Failed: {result}"))
+            else:
+                contents.extend(result)
+        return contents
+
     # ========================================================================
     # Standalone Handler: browser_screenshot
     # ========================================================================
 
     async def _handle_screenshot(
-        self, arguments: Dict[str, Any]
-    ) -> List[ImageContent | TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> list[ImageContent | TextContent]:
         """Handle screenshot capture via browser extension."""
+        if arguments.get("ports"):
+            return await self._fan_out_ports(self._handle_screenshot, arguments)
+
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
             return [TextContent(type="text", text=port_warning or "No port available")]
@@ -469,13 +693,22 @@ class MCPService:
         # Delegate to screenshot tool service
         url = arguments.get("url")
         result = await self.screenshot_tool_service.handle_screenshot(
-            port=port, url=url
+            port=port, url=url, force=arguments.get("force", False)
         )
 
-        if result.get("success"):
+        if result.get("unchanged"):
             return [
-                ImageContent(type="image", data=result["data"], mimeType="image/png")
+                TextContent(
+                    type="text",
+                    text=f"Screenshot unchanged since last capture on port {port} "
+                    f"(pass force=true to receive the image again)",
+                )
             ]
+        if result.get("success"):
+            # Hand the base64 string over by reference; drop the result dict
+            data = result["data"]
+            del result
+            return [ImageContent(type="image", data=data, mimeType="image/png")]
         else:
             error_msg = result.get("error", "Unknown error")
             return [
@@ -491,31 +724,28 @@ class MCPService:
     # ========================================================================
 
     async def _handle_browser_form(
-        self, arguments: Dict[str, Any]
-    ) -> List[TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
         """Handle browser_form tool - consolidated form operations.
 
         Actions: fill (multi-field), submit
         """
         action = arguments.get("action")
-
-        if action == "fill":
-            return await self._form_fill(arguments)
-        elif action == "submit":
-            return await self._form_submit(arguments)
-        else:
+        handler = self._form_map.get(action) if isinstance(action, str) else None
+        if handler is None:
             return [
                 TextContent(
                     type="text",
                     text=f"Unknown form action: {action}. Valid: fill, submit",
                 )
             ]
+        return await handler(arguments)
 
-    async def _form_fill(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _form_fill(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle form fill (multiple fields)."""
         return await self.form_tool_service.handle_fill_form(arguments)
 
-    async def _form_submit(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _form_submit(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle form submit."""
         return await self.form_tool_service.handle_submit_form(arguments)
 
@@ -524,29 +754,28 @@ class MCPService:
     # ========================================================================
 
     async def _handle_browser_extract(
-        self, arguments: Dict[str, Any]
-    ) -> List[TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> Sequence[ImageContent | TextContent]:
         """Handle browser_extract tool - consolidated extraction.
 
-        Extractions: content (readable article), semantic_dom (structure), ascii (layout)
+        Extractions: content (readable article), semantic_dom (structure), ascii (layout),
+        all (content and semantic_dom together)
         """
-        extract = arguments.get("extract")
+        if arguments.get("ports"):
+            return await self._fan_out_ports(self._handle_browser_extract, arguments)
 
-        if extract == "content":
-            return await self._extract_content(arguments)
-        elif extract == "semantic_dom":
-            return await self._extract_semantic_dom(arguments)
-        elif extract == "ascii":
-            return await self._extract_ascii(arguments)
-        else:
+        extract = arguments.get("extract")
+        handler = self._extract_map.get(extract) if isinstance(extract, str) else None
+        if handler is None:
             return [
                 TextContent(
                     type="text",
-                    text=f"Unknown extract type: {extract}. Valid: content, semantic_dom, ascii",
+                    text=f"Unknown extract type: {extract}. Valid: content, semantic_dom, ascii, all",
                 )
             ]
+        return await handler(arguments)
 
-    async def _extract_content(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _extract_content(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle content extraction using Readability."""
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -562,8 +791,8 @@ class MCPService:
         return [TextContent(type="text", text=result["formatted_text"])]
 
     async def _extract_semantic_dom(
-        self, arguments: Dict[str, Any]
-    ) -> List[TextContent]:
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
         """Handle semantic DOM extraction."""
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -582,9 +811,18 @@ class MCPService:
             max_text_length=arguments.get("max_text_length", 100),
         )
 
-        return [TextContent(type="text", text=result["formatted_text"])]
+        # One content block per section so large pages are not one giant string
+        sections = result.get("sections") or [result["formatted_text"]]
+        return [TextContent(type="text", text=section) for section in sections]
 
-    async def _extract_ascii(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _extract_all(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle content + semantic DOM extraction, run concurrently."""
+        content, dom = await asyncio.gather(
+            self._extract_content(arguments), self._extract_semantic_dom(arguments)
+        )
+        return content + dom
+
+    async def _extract_ascii(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle ASCII layout extraction."""
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -602,6 +840,94 @@ class MCPService:
 
         return [TextContent(type="text", text=result["formatted_text"])]
 
+    # ========================================================================
+    # Batch Handler: browser_chain
+    # ========================================================================
+
+    async def _handle_browser_chain(
+        self, arguments: dict[str, Any]
+    ) -> list[ImageContent | TextContent]:
+        """Handle browser_chain tool - run several tool calls in one request.
+
+        Calls are grouped into layers by their ``depends_on`` indexes, and
+        each layer is gathered. Calls sharing a port take that port's lock,
+        so one browser never sees overlapping commands.
+        """
+        calls = arguments.get("calls") or []
+        layers: list[list[int]] = []
+        depth: list[int] = []
+        for index, call in enumerate(calls):
+            name = call.get("name")
+            if name not in self._tool_map or name == "browser_chain":
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Step {index}: unknown tool {name}",
+                    )
+                ]
+            deps = call.get("depends_on") or []
+            if any(not isinstance(d, int) or not 0 <= d < index for d in deps):
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Step {index}: depends_on must list earlier steps",
+                    )
+                ]
+            level = max((depth[d] + 1 for d in deps), default=0)
+            depth.append(level)
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(index)
+
+        results: list[Any] = [None] * len(calls)
+        for layer in layers:
+            outcomes = await asyncio.gather(
+                *(self._run_chain_step(calls[i], results) for i in layer),
+                return_exceptions=True,
+            )
+            for index, outcome in zip(layer, outcomes):
+                results[index] = outcome
+
+        contents: list[ImageContent | TextContent] = []
+        for index, (call, result) in enumerate(zip(calls, results)):
+            contents.append(
+                TextContent(type="text", text=f"Step {index} ({call['name']}):")
+            )
+            if isinstance(result, BaseException):
+                contents.append(TextContent(type="text", text=f"Failed: {result}"))
+            else:
+                contents.extend(result)
+        return contents
+
+    async def _run_chain_step(
+        self, call: dict[str, Any], results: list[Any]
+    ) -> Sequence[ImageContent | TextContent]:
+        """Run one chained call under its port lock.
+
+        Args:
+            call: Chain entry with name, arguments and depends_on
+            results: Outcomes of the calls so far, by step index
+
+        Returns:
+            The tool's content blocks
+
+        Raises:
+            RuntimeError: If a call this one depends on failed
+        """
+        for dep in call.get("depends_on") or []:
+            if isinstance(results[dep], BaseException):
+                raise RuntimeError(f"skipped, step {dep} failed")
+
+        tool_arguments = call.get("arguments") or {}
+        # Lock on the browser the call will reach, so an explicit port and an
+        # auto-detected one that resolve alike are serialized together
+        port, _ = self.port_resolver.resolve_port(tool_arguments.get("port"))
+        lock = self._port_locks.get(port)
+        if lock is None:
+            lock = self._port_locks[port] = asyncio.Lock()
+        async with lock:
+            return await self._tool_map[call["name"]](tool_arguments)
+
     # ========================================================================
     # Server lifecycle methods
     # ========================================================================
@@ -613,21 +939,37 @@ class MCPService:
 
     async def run_stdio(self) -> None:
         """Run the MCP server with stdio transport."""
+        import sys
+        from io import TextIOWrapper
+
+        import anyio
         from mcp.server import NotificationOptions
         from mcp.server.stdio import stdio_server
 
-        async with stdio_server() as (read_stream, write_stream):
-            init_options = self.server.create_initialization_options(
-                notification_options=NotificationOptions(
-                    tools_changed=False, prompts_changed=False, resources_changed=False
-                ),
-                experimental_capabilities={},
-            )
+        # Same UTF-8 stdout the SDK would open, with coalesced writes
+        stdout = _CoalescingStdout(
+            anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+        )
+        # stdio_server only awaits write() and flush() on stdout, which
+        # _CoalescingStdout provides; it is not a full anyio.AsyncFile
+        sdk_stdout = cast("anyio.AsyncFile[str]", stdout)
+        try:
+            async with stdio_server(stdout=sdk_stdout) as (read_stream, write_stream):
+                init_options = self.server.create_initialization_options(
+                    notification_options=NotificationOptions(
+                        tools_changed=False,
+                        prompts_changed=False,
+                        resources_changed=False,
+                    ),
+                    experimental_capabilities={},
+                )
 
-            await self.server.run(
-                read_stream,
-                write_stream,
-                init_options,
-                raise_exceptions=False,
-                stateless=False,
-            )
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    init_options,
+                    raise_exceptions=False,
+                    stateless=False,
+                )
+        finally:
+            await stdout.aclose()
@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 import aiofiles
 
@@ -149,7 +149,7 @@ class StorageService:
         self,
         port: int,
         last_n: int = 100,
-        level_filter: Optional[List[str]] = None,
+        level_filter: Optional[Collection[str]] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
     ) -> List[ConsoleMessage]:
@@ -204,7 +204,7 @@ class StorageService:
     async def _query_all_ports(
         self,
         last_n: int = 100,
-        level_filter: Optional[List[str]] = None,
+        level_filter: Optional[Collection[str]] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
     ) -> List[ConsoleMessage]:
@@ -1,7 +1,10 @@
 """Capability detection tool service for MCP browser control."""
 
+import hashlib
+import json
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -9,8 +12,14 @@ logger = logging.getLogger(__name__)
 class CapabilityToolService:
     """MCP tool handler for capability detection and reporting."""
 
+    CAPABILITY_TTL = 30.0  # seconds a detected report is reused
+
     def __init__(self, capability_detector=None):
         self.capability_detector = capability_detector
+        # (etag, formatted text) of the last report; reports rarely change
+        self._report_cache: Optional[Tuple[str, str]] = None
+        # (detected at, extension connected, result) of the last detection
+        self._result_cache: Optional[Tuple[float, bool, Dict[str, Any]]] = None
 
     async def handle_get_capabilities(self) -> Dict[str, Any]:
         """Get browser control capabilities.
@@ -26,14 +35,25 @@ class CapabilityToolService:
             }
 
         try:
+            has_extension = await self.capability_detector.has_extension_connection()
+            cached = self._result_cache
+            if (
+                cached is not None
+                and cached[1] == has_extension
+                and time.monotonic() - cached[0] < self.CAPABILITY_TTL
+            ):
+                return cached[2]
+
             report = await self.capability_detector.get_capability_report()
-            formatted_text = self._format_capability_report(report)
+            formatted_text = self._get_formatted_report(report)
 
-            return {
+            result = {
                 "success": True,
                 "report": report,
                 "formatted_text": formatted_text,
             }
+            self._result_cache = (time.monotonic(), has_extension, result)
+            return result
 
         except Exception as e:
             logger.exception("Failed to get capabilities")
@@ -43,6 +63,26 @@ class CapabilityToolService:
                 "formatted_text": f"Capability check failed: {str(e)}",
             }
 
+    def _get_formatted_report(self, report: Dict) -> str:
+        """Return the formatted report, reusing the last one if unchanged.
+
+        Args:
+            report: Capability report from the detector
+
+        Returns:
+            Formatted markdown string
+        """
+        etag = hashlib.md5(
+            json.dumps(report, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        if self._report_cache is not None and self._report_cache[0] == etag:
+            return self._report_cache[1]
+
+        formatted_text = self._format_capability_report(report)
+        self._report_cache = (etag, formatted_text)
+        return formatted_text
+
     def _format_capability_report(self, report: Dict) -> str:
         """Format capability report for human-readable output.
 
@@ -5,15 +5,38 @@ Handles:
 - browser_extract_semantic_dom: Semantic DOM structure extraction
 """
 
+import asyncio
+import io
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Article text cap; also sent to the extension so it truncates in-page
+_MAX_ARTICLE_CHARS = 50000
+
+# Semantic DOM link and form caps, applied in-page by the extension and
+# re-applied here for extensions that predate them
+_MAX_LINKS = 50
+_MAX_HREF_LENGTH = 100
+_MAX_FORMS = 20
+
+# Per-element line templates for the semantic DOM formatters
+_HEADING_TPL = "%s- H%s: %s\n"
+_LANDMARK_TPL = "- [%s] %s\n"
+_LANDMARK_NOLABEL_TPL = "- [%s]\n"
+_LINK_TPL = "- %s\n"
+_HREF_TPL = "  → %s\n"
+_FIELD_TPL = "%s (%s): %s%s"
+_FIELD_NOLABEL_TPL = "%s (%s)%s"
+
 
 class ContentExtractionToolService:
     """MCP tool handler for content and semantic DOM extraction."""
 
+    # Element count above which formatting runs in a worker thread
+    SEMANTIC_DOM_OFFLOAD_THRESHOLD = 500
+
     def __init__(self, browser_service=None):
         """Initialize content extraction tool service.
 
@@ -41,7 +64,9 @@ class ContentExtractionToolService:
                 "formatted_text": "Content extraction failed: Browser service not available",
             }
 
-        result = await self.browser_service.extract_content(port=port, tab_id=tab_id)
+        result = await self.browser_service.extract_content(
+            port=port, tab_id=tab_id, max_chars=_MAX_ARTICLE_CHARS
+        )
 
         if result.get("success"):
             content = result.get("content", {})
@@ -81,7 +106,8 @@ class ContentExtractionToolService:
             max_text_length: Max characters per text field
 
         Returns:
-            Dict with formatted_text (structured output) and raw DOM
+            Dict with formatted_text (structured output), the same text split
+            into per-section blocks, and raw DOM
         """
         if not self.browser_service:
             return {
@@ -96,14 +122,22 @@ class ContentExtractionToolService:
             "include_links": include_links,
             "include_forms": include_forms,
             "max_text_length": max_text_length,
+            "max_links": _MAX_LINKS,
+            "max_href_length": _MAX_HREF_LENGTH,
+            "max_forms": _MAX_FORMS,
         }
 
         result = await self.browser_service.extract_semantic_dom(port, tab_id, options)
 
         if result.get("success"):
             dom = result.get("dom", {})
-            formatted = self._format_semantic_dom(dom, options)
-            return {"success": True, "formatted_text": formatted, "raw_dom": dom}
+            sections = await self._get_semantic_dom_sections(dom, options)
+            return {
+                "success": True,
+                "formatted_text": "\n".join(sections),
+                "sections": sections,
+                "raw_dom": dom,
+            }
         else:
             error = result.get("error", "Unknown error")
             return {
@@ -136,7 +170,14 @@ class ContentExtractionToolService:
         # Main text content
         text = content.get("textContent", "")
         if text:
-            lines.append(self._truncate_text(text, max_chars=50000))
+            # Slice and marker are separate lines so the slice is not copied
+            # again by a concat; the extension may already have truncated.
+            n = len(text)
+            total = (content.get("length") or n) if content.get("truncated") else n
+            lines.append(text[:_MAX_ARTICLE_CHARS])
+            omitted = total - min(n, _MAX_ARTICLE_CHARS)
+            if omitted > 0:
+                lines.append(f"\n[Truncated {omitted:,} chars]")
         else:
             lines.append("[No readable content extracted]")
 
@@ -170,19 +211,29 @@ class ContentExtractionToolService:
             lines.append(f"**Words:** {content['wordCount']:,}")
         return lines
 
-    def _truncate_text(self, text: str, max_chars: int) -> str:
-        """Truncate text with ellipsis if too long.
+    async def _get_semantic_dom_sections(
+        self, dom: Dict[str, Any], options: Dict[str, Any]
+    ) -> List[str]:
+        """Return formatted semantic DOM sections.
+
+        Large pages are formatted in a worker thread so the formatting does
+        not stall other MCP calls on the event loop.
 
         Args:
-            text: Text to truncate
-            max_chars: Maximum character length
+            dom: Semantic DOM data (headings, landmarks, links, forms)
+            options: Extraction options (what to include)
 
         Returns:
-            Truncated text with suffix if truncated
+            Formatted sections (see _format_semantic_dom_sections)
         """
-        if len(text) > max_chars:
-            return text[:max_chars] + f"\n\n[Truncated {len(text) - max_chars:,} chars]"
-        return text
+        element_count = sum(
+            len(dom.get(key, [])) for key in ("headings", "landmarks", "links", "forms")
+        )
+        if element_count > self.SEMANTIC_DOM_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(
+                self._format_semantic_dom_sections, dom, options
+            )
+        return self._format_semantic_dom_sections(dom, options)
 
     def _format_semantic_dom(self, dom: Dict[str, Any], options: Dict[str, Any]) -> str:
         """Format semantic DOM structure.
@@ -194,159 +245,202 @@ class ContentExtractionToolService:
         Returns:
             Formatted text output
         """
-        lines = []
+        return "\n".join(self._format_semantic_dom_sections(dom, options))
 
-        # Header
-        lines.append(f"# {dom.get('title', 'Untitled')}")
-        lines.append(f"URL: {dom.get('url', 'unknown')}")
-        lines.append("")
+    def _format_semantic_dom_sections(
+        self, dom: Dict[str, Any], options: Dict[str, Any]
+    ) -> List[str]:
+        """Format semantic DOM structure as one text block per section.
 
-        # Headings outline
-        if options.get("include_headings", True):
-            headings_output = self._format_headings(dom.get("headings", []))
-            if headings_output:
-                lines.extend(headings_output)
-
-        # Landmarks (sections)
-        if options.get("include_landmarks", True):
-            landmarks_output = self._format_landmarks(dom.get("landmarks", []))
-            if landmarks_output:
-                lines.extend(landmarks_output)
-
-        # Links
-        if options.get("include_links", True):
-            links_output = self._format_links(dom.get("links", []))
-            if links_output:
-                lines.extend(links_output)
-
-        # Forms
-        if options.get("include_forms", True):
-            forms_output = self._format_forms(dom.get("forms", []))
-            if forms_output:
-                lines.extend(forms_output)
+        Args:
+            dom: Semantic DOM data (headings, landmarks, links, forms)
+            options: Extraction options (what to include)
 
-        return "\n".join(lines)
+        Returns:
+            Formatted sections: page header, then outline, landmarks, links
+            and forms when included and non-empty
+        """
+        # Header
+        sections = [
+            f"# {dom.get('title', 'Untitled')}\nURL: {dom.get('url', 'unknown')}\n"
+        ]
 
-    def _format_headings(self, headings: List[Dict[str, Any]]) -> List[str]:
+        # Title/URL only: skip the section walk entirely
+        if not any(
+            options.get(option, True)
+            for option in (
+                "include_headings",
+                "include_landmarks",
+                "include_links",
+                "include_forms",
+            )
+        ):
+            return sections
+
+        # Blank or still-loading page: say so instead of walking empty sections
+        if not any(dom.get(key) for key in ("headings", "landmarks", "links", "forms")):
+            sections.append("[No semantic structure detected]\n")
+            return sections
+
+        for option, key, formatter in (
+            ("include_headings", "headings", self._format_headings),
+            ("include_landmarks", "landmarks", self._format_landmarks),
+            (
+                "include_links",
+                "links",
+                lambda links: self._format_links(links, total=dom.get("totalLinks")),
+            ),
+            (
+                "include_forms",
+                "forms",
+                lambda forms: self._format_forms(forms, total=dom.get("totalForms")),
+            ),
+        ):
+            if options.get(option, True):
+                output = formatter(dom.get(key, []))
+                if output:
+                    sections.append(output)
+
+        return sections
+
+    def _format_headings(self, headings: List[Dict[str, Any]]) -> str:
         """Format headings as indented outline.
 
         Args:
             headings: List of heading dictionaries
 
         Returns:
-            List of formatted heading lines
+            Formatted outline section, or "" if there are no headings
         """
         if not headings:
-            return []
+            return ""
 
-        lines = ["## Outline"]
+        buf = io.StringIO()
+        w = buf.write
+        w("## Outline\n")
         for h in headings:
-            level = h.get("level", 1)
-            text = h.get("text", "")[:100]
-            indent = "  " * (level - 1)
-            lines.append(f"{indent}- H{level}: {text}")
-        lines.append("")
+            get = h.get
+            level = get("level", 1)
+            w(_HEADING_TPL % ("  " * (level - 1), level, get("text", "")[:100]))
 
-        return lines
+        return buf.getvalue()
 
-    def _format_landmarks(self, landmarks: List[Dict[str, Any]]) -> List[str]:
+    def _format_landmarks(self, landmarks: List[Dict[str, Any]]) -> str:
         """Format ARIA landmarks as section list.
 
         Args:
             landmarks: List of landmark dictionaries
 
         Returns:
-            List of formatted landmark lines
+            Formatted landmarks section, or "" if there are no landmarks
         """
         if not landmarks:
-            return []
+            return ""
 
-        lines = ["## Sections"]
+        buf = io.StringIO()
+        w = buf.write
+        w("## Sections\n")
         for lm in landmarks:
-            role = lm.get("role", "unknown")
-            label = lm.get("label") or lm.get("tag", "")
+            get = lm.get
+            role = get("role", "unknown")
+            label = get("label") or get("tag", "")
             if label:
-                lines.append(f"- [{role}] {label}")
+                w(_LANDMARK_TPL % (role, label))
             else:
-                lines.append(f"- [{role}]")
-        lines.append("")
+                w(_LANDMARK_NOLABEL_TPL % role)
 
-        return lines
+        return buf.getvalue()
 
     def _format_links(
-        self, links: List[Dict[str, Any]], max_links: int = 50
-    ) -> List[str]:
+        self,
+        links: List[Dict[str, Any]],
+        max_links: int = _MAX_LINKS,
+        total: Optional[int] = None,
+    ) -> str:
         """Format links with text and href.
 
         Args:
             links: List of link dictionaries
             max_links: Maximum number of links to display
+            total: Links on the page when the extension already capped the list
 
         Returns:
-            List of formatted link lines
+            Formatted links section, or "" if there are no links
         """
         if not links:
-            return []
+            return ""
 
-        lines = [f"## Links ({len(links)})"]
+        total = max(total or 0, len(links))
+        shown = min(len(links), max_links)
 
-        for link in links[:max_links]:
-            text = (
-                link.get("text", "").strip()[:80]
-                or link.get("ariaLabel", "")
-                or "[no text]"
-            )
-            href = link.get("href", "")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## Links ({total})\n")
+
+        for link in links[:shown]:
+            get = link.get
+            text = get("text", "").strip()[:80] or get("ariaLabel", "") or "[no text]"
+            href = get("href", "")
 
-            lines.append(f"- {text}")
+            w(_LINK_TPL % text)
             if href and not href.startswith("javascript:"):
-                lines.append(f"  → {href[:100]}")
+                w(_HREF_TPL % href[:_MAX_HREF_LENGTH])
 
-        if len(links) > max_links:
-            lines.append(f"  ... +{len(links) - max_links} more")
+        if total > shown:
+            w(f"  ... +{total - shown} more\n")
 
-        lines.append("")
-        return lines
+        return buf.getvalue()
 
-    def _format_forms(self, forms: List[Dict[str, Any]]) -> List[str]:
+    def _format_forms(
+        self,
+        forms: List[Dict[str, Any]],
+        max_forms: int = _MAX_FORMS,
+        total: Optional[int] = None,
+    ) -> str:
         """Format forms with fields.
 
         Args:
             forms: List of form dictionaries
+            max_forms: Maximum number of forms to display
+            total: Forms on the page when the extension already capped the list
 
         Returns:
-            List of formatted form lines
+            Formatted forms section, or "" if there are no forms
         """
         if not forms:
-            return []
+            return ""
+
+        total = max(total or 0, len(forms))
+        shown = min(len(forms), max_forms)
 
-        lines = [f"## Forms ({len(forms)})"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## Forms ({total})\n")
 
-        for form in forms:
+        format_field = self._format_field
+        for form in forms[:shown]:
+            fget = form.get
             # Form name/identifier
-            name = (
-                form.get("name")
-                or form.get("id")
-                or form.get("ariaLabel")
-                or "[unnamed]"
-            )
-            lines.append(f"### {name}")
+            name = fget("name") or fget("id") or fget("ariaLabel") or "[unnamed]"
+            w(f"### {name}\n")
 
             # Form attributes
-            if form.get("action"):
-                lines.append(f"  Action: {form.get('action')}")
-            lines.append(f"  Method: {form.get('method', 'GET').upper()}")
+            action = fget("action")
+            if action:
+                w(f"  Action: {action}\n")
+            w(f"  Method: {fget('method', 'GET').upper()}\n")
 
             # Fields
-            fields = form.get("fields", [])
+            fields = fget("fields", [])
             if fields:
-                lines.append("  Fields:")
+                w("  Fields:\n")
                 for field in fields:
-                    field_line = self._format_field(field)
-                    lines.append(f"    - {field_line}")
+                    w(f"    - {format_field(field)}\n")
 
-        lines.append("")
-        return lines
+        if total > shown:
+            w(f"  ... +{total - shown} more\n")
+
+        return buf.getvalue()
 
     def _format_field(self, field: Dict[str, Any]) -> str:
         """Format a single form field.
@@ -357,20 +451,16 @@ class ContentExtractionToolService:
         Returns:
             Formatted field string
         """
-        ftype = field.get("type", "text")
-        fname = field.get("name") or field.get("id") or "[unnamed]"
-        label = (
-            field.get("label")
-            or field.get("ariaLabel")
-            or field.get("placeholder")
-            or ""
-        )
-        req = " (required)" if field.get("required") else ""
+        get = field.get
+        ftype = get("type", "text")
+        fname = get("name") or get("id") or "[unnamed]"
+        label = get("label") or get("ariaLabel") or get("placeholder") or ""
+        req = " (required)" if get("required") else ""
 
         if label:
-            return f"{fname} ({ftype}): {label}{req}"
+            return _FIELD_TPL % (fname, ftype, label, req)
         else:
-            return f"{fname} ({ftype}){req}"
+            return _FIELD_NOLABEL_TPL % (fname, ftype, req)
 
     async def handle_extract_ascii(
         self,
@@ -7,6 +7,9 @@ from mcp.types import TextContent
 
 logger = logging.getLogger(__name__)
 
+# Shared reply for every handler when no DOM service is wired in
+_NO_DOM_SERVICE = TextContent(type="text", text="DOM interaction service not available")
+
 
 class DOMToolService:
     """MCP tool handler for DOM interactions."""
@@ -36,9 +39,7 @@ class DOMToolService:
             List[TextContent] with click result
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -84,9 +85,7 @@ class DOMToolService:
             List[TextContent] with fill result
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         value = arguments.get("value")
         if value is None:
@@ -133,9 +132,7 @@ class DOMToolService:
             List[TextContent] with select result
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         selector = arguments.get("selector")
         if not selector:
@@ -186,9 +183,7 @@ class DOMToolService:
             List[TextContent] with wait result
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         selector = arguments.get("selector")
         if not selector:
@@ -239,9 +234,7 @@ class DOMToolService:
             List[TextContent] with element information
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -1,12 +1,15 @@
 """Form operations tool service for MCP browser control."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.types import TextContent
 
 logger = logging.getLogger(__name__)
 
+# Shared reply for every handler when no DOM service is wired in
+_NO_DOM_SERVICE = TextContent(type="text", text="DOM interaction service not available")
+
 
 class FormToolService:
     """MCP tool handler for form operations."""
@@ -29,22 +32,17 @@ class FormToolService:
                 - port: Browser daemon port (optional, auto-resolved)
                 - form_data: Dict mapping selectors to values
                 - submit: Whether to submit form after filling (default: False)
+                - sequential: Fill fields strictly in order (default: False)
 
         Returns:
             List[TextContent] with fill results
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
-        form_data = arguments.get("form_data")
-        if not form_data:
-            return [
-                TextContent(
-                    type="text", text="Error: 'form_data' is required for fill action"
-                )
-            ]
+        form_data, error = self._validate_form_data(arguments.get("form_data"))
+        if error:
+            return [TextContent(type="text", text=f"Error: {error}")]
 
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
@@ -53,7 +51,10 @@ class FormToolService:
         submit = arguments.get("submit", False)
 
         result = await self.dom_interaction_service.fill_form(
-            port=port, form_data=form_data, submit=submit
+            port=port,
+            form_data=form_data,
+            submit=submit,
+            sequential=arguments.get("sequential", False),
         )
 
         if result.get("success"):
@@ -72,6 +73,40 @@ class FormToolService:
                 )
             ]
 
+    @staticmethod
+    def _validate_form_data(
+        form_data: Any,
+    ) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+        """Validate and normalize form_data once, at the tool boundary.
+
+        Selectors must be non-empty strings. Scalar values are coerced to
+        strings, the form the content script assigns to ``element.value``.
+
+        Args:
+            form_data: Raw ``form_data`` tool argument
+
+        Returns:
+            Tuple of (normalized selector -> value mapping, error message);
+            exactly one of the two is None
+        """
+        if not form_data:
+            return None, "'form_data' is required for fill action"
+        if not isinstance(form_data, dict):
+            return None, "'form_data' must be an object mapping selectors to values"
+
+        normalized = {}
+        for selector, value in form_data.items():
+            if not isinstance(selector, str) or not selector.strip():
+                return None, f"Invalid selector in form_data: {selector!r}"
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            elif isinstance(value, (int, float)):
+                value = str(value)
+            elif not isinstance(value, str):
+                return None, f"Value for '{selector}' must be a string or number"
+            normalized[selector] = value
+        return normalized, None
+
     async def handle_submit_form(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Submit a form.
 
@@ -85,9 +120,7 @@ class FormToolService:
             List[TextContent] with submit result
         """
         if not self.dom_interaction_service:
-            return [
-                TextContent(type="text", text="DOM interaction service not available")
-            ]
+            return [_NO_DOM_SERVICE]
 
         port, port_warning = self.port_resolver.resolve_port(arguments.get("port"))
         if port is None:
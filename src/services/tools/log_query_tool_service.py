@@ -1,10 +1,16 @@
 """Log query tool service for MCP browser control."""
 
+import io
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
+
+from ...models import ConsoleLevel
 
 logger = logging.getLogger(__name__)
 
+# Bracketed level tag per console level, built once instead of per log line
+_LEVEL_TAG = {level: f"[{level.name}]" for level in ConsoleLevel}
+
 
 class LogQueryToolService:
     """MCP tool handler for console log queries."""
@@ -32,9 +38,14 @@ class LogQueryToolService:
                 "formatted_text": "Browser service not available",
             }
 
+        # Every buffered and stored message is checked against the filter
+        levels: Optional[Collection[str]] = (
+            frozenset(level_filter) if level_filter else None
+        )
+
         try:
             messages = await self.browser_service.query_logs(
-                port=port, last_n=last_n, level_filter=level_filter
+                port=port, last_n=last_n, level_filter=levels
             )
 
             if not messages:
@@ -69,12 +80,17 @@ class LogQueryToolService:
         Returns:
             Formatted string with timestamps, levels, and messages
         """
-        log_lines = []
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Console logs (last {len(messages)}):\n")
         for msg in messages:
-            timestamp = msg.timestamp.strftime("%H:%M:%S.%f")[:-3]
-            level = msg.level.value.upper()
-            log_lines.append(f"[{timestamp}] [{level}] {msg.message}")
+            # Integer formatting avoids strftime's locale handling per line
+            t = msg.timestamp
+            write(
+                f"\n[{t.hour:02d}:{t.minute:02d}:{t.second:02d}."
+                f"{t.microsecond // 1000:03d}] {_LEVEL_TAG[msg.level]} {msg.message}"
+            )
             if msg.stack_trace:
-                log_lines.append(f"  Stack: {msg.stack_trace[:200]}")
+                write(f"\n  Stack: {msg.stack_trace[:200]}")
 
-        return f"Console logs (last {len(messages)}):\n\n" + "\n".join(log_lines)
+        return buf.getvalue()
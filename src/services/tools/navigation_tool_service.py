@@ -10,6 +10,15 @@ from mcp.types import TextContent
 
 logger = logging.getLogger(__name__)
 
+# Response templates shared by the extension and WebSocket-only paths
+_NAV_OK_TPL = "Navigated to %s on port %s"
+_NAV_OK_APPLESCRIPT_TPL = (
+    "Navigated to %s using AppleScript fallback.\n"
+    "Note: Console log capture requires the browser extension."
+)
+_NAV_FAILED_TPL = "Navigation failed: %s"
+_NAV_NO_CONNECTION_TPL = "Navigation failed on port %s. No active connection."
+
 
 class NavigationToolService:
     """MCP tool handler for browser navigation operations.
@@ -61,15 +70,14 @@ class NavigationToolService:
                     return [
                         TextContent(
                             type="text",
-                            text=f"Navigated to {url} using AppleScript fallback.\n"
-                            f"Note: Console log capture requires the browser extension.",
+                            text=_NAV_OK_APPLESCRIPT_TPL % url,
                         )
                     ]
                 else:
                     return [
                         TextContent(
                             type="text",
-                            text=f"Navigated to {url} on port {port}",
+                            text=_NAV_OK_TPL % (url, port),
                         )
                     ]
             else:
@@ -77,7 +85,7 @@ class NavigationToolService:
                 return [
                     TextContent(
                         type="text",
-                        text=f"Navigation failed: {error_msg}",
+                        text=_NAV_FAILED_TPL % error_msg,
                     )
                 ]
 
@@ -95,13 +103,13 @@ class NavigationToolService:
             return [
                 TextContent(
                     type="text",
-                    text=f"Navigated to {url} on port {port}",
+                    text=_NAV_OK_TPL % (url, port),
                 )
             ]
         else:
             return [
                 TextContent(
                     type="text",
-                    text=f"Navigation failed on port {port}. No active connection.",
+                    text=_NAV_NO_CONNECTION_TPL % port,
                 )
             ]
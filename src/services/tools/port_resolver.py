@@ -6,17 +6,34 @@ It handles auto-detection from daemon registry and warns about common mistakes.
 
 import logging
 import os
-from typing import Optional, Tuple
+import time
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _daemon_helpers() -> Tuple[Any, Any]:
+    """Import the daemon registry helpers once and reuse them.
+
+    The import cannot live at module top: src.cli.utils imports the MCP
+    server, which imports this module.
+
+    Returns:
+        (is_process_running, read_service_registry)
+    """
+    from ...cli.utils.daemon import is_process_running, read_service_registry
+
+    return is_process_running, read_service_registry
+
+
 class PortResolver:
     """Utility for resolving and validating browser ports.
 
     Features:
     - Auto-detects port from running daemon registry
-    - Caches daemon port for performance
+    - Caches daemon port for performance (re-validated after a short TTL)
     - Warns if CDP port (9222) is used incorrectly
     - Provides helpful error messages
 
@@ -31,10 +48,13 @@ class PortResolver:
     """
 
     CDP_DEFAULT_PORT = 9222
+    DAEMON_PORT_TTL = 5.0  # seconds before the cached daemon is re-validated
 
     def __init__(self) -> None:
         """Initialize port resolver with empty cache."""
         self._cached_daemon_port: Optional[int] = None
+        self._cached_daemon_pid: Optional[int] = None
+        self._daemon_port_cached_at: float = 0.0
 
     def resolve_port(self, port: Optional[int]) -> Tuple[Optional[int], Optional[str]]:
         """Resolve port with validation and caching.
@@ -57,8 +77,31 @@ class PortResolver:
             # Detect CDP port mistake
             port, warning = resolver.resolve_port(9222)
         """
-        warning = None
+        # Fast paths: explicit non-CDP port, or a daemon port cached within TTL
+        if port is None:
+            cached = self._cached_daemon_port
+            if (
+                cached is not None
+                and time.monotonic() - self._daemon_port_cached_at
+                < self.DAEMON_PORT_TTL
+            ):
+                return cached, None
+        elif port != self.CDP_DEFAULT_PORT:
+            return port, None
+
+        return self._resolve_port_slow(port)
 
+    def _resolve_port_slow(
+        self, port: Optional[int]
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Resolve a port that needs a daemon lookup or a CDP-port warning.
+
+        Args:
+            port: None for auto-detection, or the CDP default port
+
+        Returns:
+            Tuple of (resolved_port, warning_message)
+        """
         # Warn if CDP port is used (common mistake)
         if port == self.CDP_DEFAULT_PORT:
             warning = (
@@ -66,26 +109,17 @@ class PortResolver:
                 f"not the mcp-browser daemon port. "
             )
             # Try to get the correct daemon port
-            daemon_port = self._cached_daemon_port or self._get_daemon_port()
+            daemon_port = self._lookup_daemon_port()
             if daemon_port:
-                self._cached_daemon_port = daemon_port
                 warning += f"Using daemon port {daemon_port} instead."
                 return daemon_port, warning
             else:
                 warning += "No running daemon found. Start with: mcp-browser start"
                 return None, warning
 
-        # If port provided, use it
-        if port is not None:
-            return port, None
-
         # No port provided - get from daemon registry
-        if self._cached_daemon_port:
-            return self._cached_daemon_port, None
-
-        daemon_port = self._get_daemon_port()
+        daemon_port = self._lookup_daemon_port()
         if daemon_port:
-            self._cached_daemon_port = daemon_port
             return daemon_port, None
 
         # No daemon running
@@ -94,22 +128,65 @@ class PortResolver:
             "No port specified and no running daemon found. Start with: mcp-browser start",
         )
 
-    def _get_daemon_port(self) -> Optional[int]:
-        """Get the port of the running mcp-browser daemon from registry.
+    def _lookup_daemon_port(self) -> Optional[int]:
+        """Get the daemon port, reading the registry only when the cache is stale.
+
+        Within DAEMON_PORT_TTL the cached port is returned as-is. After that,
+        the cached daemon PID is checked directly; the registry is re-read
+        only if that process has exited.
+
+        Returns:
+            Daemon port, or None if no daemon is running
+        """
+        if self._cached_daemon_port is not None:
+            now = time.monotonic()
+            if now - self._daemon_port_cached_at < self.DAEMON_PORT_TTL:
+                return self._cached_daemon_port
+            if self._is_daemon_alive(self._cached_daemon_pid):
+                self._daemon_port_cached_at = now
+                return self._cached_daemon_port
+
+        server = self._get_daemon_server()
+        if server is None:
+            self.clear_cache()
+            return None
+
+        self._cached_daemon_port, self._cached_daemon_pid = server
+        self._daemon_port_cached_at = time.monotonic()
+        return self._cached_daemon_port
+
+    def _is_daemon_alive(self, pid: Optional[int]) -> bool:
+        """Check whether the cached daemon process is still running.
+
+        Args:
+            pid: Daemon process ID
+
+        Returns:
+            True if the process is running
+        """
+        if pid is None:
+            return False
+        try:
+            is_process_running, _ = _daemon_helpers()
+            return is_process_running(pid)
+        except Exception:
+            return False
+
+    def _get_daemon_server(self) -> Optional[Tuple[int, int]]:
+        """Get the port and PID of the running mcp-browser daemon from registry.
 
         Returns:
-            Port number if daemon is running FOR THE CURRENT PROJECT, None otherwise
+            (port, pid) if daemon is running FOR THE CURRENT PROJECT, None otherwise
 
         Note:
-            This method imports CLI utilities lazily to avoid circular dependencies
-            and unnecessary imports when running in MCP stdio mode.
+            CLI utilities are imported lazily (once, via _daemon_helpers) to
+            avoid circular dependencies and unnecessary imports in MCP stdio mode.
 
             IMPORTANT: Returns the server matching the current working directory,
             not just the first running server found.
         """
         try:
-            from ...cli.utils.daemon import is_process_running, read_service_registry
-
+            is_process_running, read_service_registry = _daemon_helpers()
             registry = read_service_registry()
             current_cwd = os.path.normpath(os.path.abspath(os.getcwd()))
 
@@ -127,8 +204,8 @@ class PortResolver:
                     # Check if this server belongs to the current project
                     normalized_project = os.path.normpath(os.path.abspath(project_path))
                     if normalized_project == current_cwd:
-                        logger.debug(f"Found daemon for current project: port {port}")
-                        return port
+                        logger.debug("Found daemon for current project: port %s", port)
+                        return port, pid
 
             # Fallback: if no matching project, return first running server
             # (backwards compatibility, but log a warning)
@@ -144,11 +221,11 @@ class PortResolver:
                         f"No daemon for current project ({current_cwd}), "
                         f"using fallback port {port} from {server.get('project_path', 'unknown')}"
                     )
-                    return port
+                    return port, pid
 
             return None
         except Exception as e:
-            logger.debug(f"Could not read daemon registry: {e}")
+            logger.debug("Could not read daemon registry: %s", e)
             return None
 
     def clear_cache(self) -> None:
@@ -158,3 +235,5 @@ class PortResolver:
         Next resolve_port() call will re-query the registry.
         """
         self._cached_daemon_port = None
+        self._cached_daemon_pid = None
+        self._daemon_port_cached_at = 0.0
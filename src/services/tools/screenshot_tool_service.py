@@ -1,5 +1,6 @@
 """Screenshot tool service for MCP browser control."""
 
+import hashlib
 import logging
 from typing import Any, Dict, Optional
 
@@ -20,15 +21,26 @@ class ScreenshotToolService:
             browser_service: Service for WebSocket-based browser communication
         """
         self.browser_service = browser_service
+        # SHA-256 of the last frame returned per port, to skip resending it
+        self._frame_hashes: Dict[int, str] = {}
+
+    def clear_frame_hash(self, port: int) -> None:
+        """Forget the last frame for a port (e.g. after navigation).
+
+        Args:
+            port: Browser daemon port
+        """
+        self._frame_hashes.pop(port, None)
 
     async def handle_screenshot(
-        self, port: int, url: Optional[str] = None
+        self, port: int, url: Optional[str] = None, force: bool = False
     ) -> Dict[str, Any]:
         """Capture screenshot via browser extension.
 
         Args:
             port: Browser daemon port
             url: Optional URL to navigate to before screenshot
+            force: Return the image even if it matches the previous capture
 
         Returns:
             Dict with success status and base64 image data:
@@ -38,6 +50,9 @@ class ScreenshotToolService:
                 "error": None
             }
 
+            If the frame is identical to the last one returned for this
+            port (and force is False), "data" is None and "unchanged" is True.
+
             Or on failure:
             {
                 "success": False,
@@ -55,7 +70,8 @@ class ScreenshotToolService:
         try:
             # Navigate to URL if provided
             if url:
-                logger.debug(f"Navigating to {url} before screenshot on port {port}")
+                self.clear_frame_hash(port)
+                logger.debug("Navigating to %s before screenshot on port %s", url, port)
                 nav_success = await self.browser_service.navigate_browser(port, url)
                 if not nav_success:
                     return {
@@ -72,9 +88,21 @@ class ScreenshotToolService:
             result = await self.browser_service.capture_screenshot_via_extension(port)
 
             if result and result.get("success"):
+                # Pop so the frame is only referenced by `data` from here on
+                data = result.pop("data", None)
+                digest = hashlib.sha256((data or "").encode("ascii")).hexdigest()
+                if not force and self._frame_hashes.get(port) == digest:
+                    return {
+                        "success": True,
+                        "data": None,
+                        "unchanged": True,
+                        "error": None,
+                    }
+                self._frame_hashes[port] = digest
+
                 return {
                     "success": True,
-                    "data": result.get("data"),
+                    "data": data,
                     "error": None,
                 }
             else:
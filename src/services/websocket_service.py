@@ -2,23 +2,161 @@
 
 import asyncio
 import hashlib
+import itertools
 import json
 import logging
 import os
+import socket
+import sys
 from collections import deque
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set
 
 import websockets
 from websockets.server import WebSocketServerProtocol
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from .._version import __version__
+except ImportError:
+    __version__ = "unknown"
+
 logger = logging.getLogger(__name__)
 
 
+class _Server(Protocol):
+    """What the service uses of the server websockets.serve() returns.
+
+    That is the legacy WebSocketServer before websockets 14 and
+    websockets.asyncio.server.Server from 14 on; both provide these.
+    """
+
+    def close(self) -> None: ...
+
+    async def wait_closed(self) -> None: ...
+
+
+# Compact, non-ASCII-escaping fallback that matches orjson's output shape
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_dumps(message: Dict[str, Any]) -> str:
+    """Serialize a JSON text frame, using orjson when installed.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # types orjson rejects; let json report or handle them
+    return _JSON_ENCODER.encode(message)
+
+
+def _json_loads(message: Any) -> Any:
+    """Parse a JSON text frame, using orjson when installed.
+
+    Args:
+        message: Raw JSON str or bytes
+
+    Returns:
+        Decoded value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+# Heartbeat reply for JSON connections; only the timestamp varies
+_PONG_TEMPLATE = '{"type":"pong","timestamp":%d}'
+
+# Capabilities advertised in server_info and get_capabilities replies
+_CAPABILITIES = ("console_capture", "dom_interaction", "screenshots")
+
+# Extension replies relayed back to the other (CLI/MCP) connections
+_RESPONSE_MESSAGES = frozenset(
+    {
+        "content_extracted",
+        "dom_response",
+        "page_content",
+        "semantic_dom_extracted",
+        "ascii_layout_extracted",
+        "screenshot_captured",
+        "dom_command_response",
+        "tab_info_response",
+        "evaluate_js_response",
+        "error",  # Extension error responses (e.g., no_registered_tab)
+    }
+)
+
+# Browser control commands relayed to the extension
+_BROWSER_COMMANDS = frozenset(
+    {
+        "navigate",
+        "click",
+        "fill_field",
+        "scroll",
+        "get_page_content",
+        "dom_command",
+        "extract_content",
+        "extract_semantic_dom",
+        "extract_ascii_layout",
+        "capture_screenshot",
+        "get_tab_info",
+        "evaluate_js",
+    }
+)
+
+
 class WebSocketService:
     """WebSocket server with port auto-discovery."""
 
+    __slots__ = (
+        "start_port",
+        "end_port",
+        "host",
+        "max_queue",
+        "max_size",
+        "write_limit",
+        "compression",
+        "port",
+        "server",
+        "_connections",
+        "_message_handlers",
+        "_connection_handlers",
+        "message_buffer",
+        "current_sequence",
+        "_active_extension",
+        "_msgpack_connections",
+        "project_identity",
+        "_builtin_dispatch",
+    )
+
     def __init__(
-        self, start_port: int = 8851, end_port: int = 8899, host: str = "localhost"
+        self,
+        start_port: int = 8851,
+        end_port: int = 8899,
+        host: str = "localhost",
+        max_queue: Optional[int] = None,
+        max_size: Optional[int] = 2**20,
+        write_limit: int = 2**20,
+        compression: Optional[str] = None,
     ):
         """Initialize WebSocket service.
 
@@ -26,12 +164,23 @@ class WebSocketService:
             start_port: Starting port for auto-discovery (default: 8851)
             end_port: Ending port for auto-discovery (default: 8899)
             host: Host to bind to
+            max_queue: Incoming frames buffered per connection before
+                reads pause (default: None, unbounded)
+            max_size: Largest accepted message in bytes (default: 1 MiB)
+            write_limit: Outgoing buffer high-water mark in bytes
+                (default: 1 MiB)
+            compression: "deflate" to negotiate permessage-deflate
+                (default: None, since loopback traffic gains nothing from it)
         """
         self.start_port = start_port
         self.end_port = end_port
         self.host = host
+        self.max_queue = max_queue
+        self.max_size = max_size
+        self.write_limit = write_limit
+        self.compression = compression
         self.port: Optional[int] = None
-        self.server: Optional[websockets.WebSocketServer] = None
+        self.server: Optional[_Server] = None
         self._connections: Set[WebSocketServerProtocol] = set()
         self._message_handlers: Dict[str, Callable] = {}
         self._connection_handlers: Dict[str, Callable] = {}
@@ -44,12 +193,35 @@ class WebSocketService:
         # Only one browser extension can be registered at a time to prevent thrashing
         self._active_extension: Optional[WebSocketServerProtocol] = None
 
+        # Connections that negotiated the binary msgpack wire format
+        self._msgpack_connections: Set[WebSocketServerProtocol] = set()
+
         # Generate project identity
         self.project_identity = self._generate_project_identity()
         logger.info(
             f"Project identity: {self.project_identity['project_id']} ({self.project_identity['project_name']})"
         )
 
+        # Message types the server answers or relays itself; everything else
+        # goes to the registered message handlers
+        self._builtin_dispatch: Dict[str, Callable] = {
+            "connection_init": self.handle_connection_init,
+            "hello": self.handle_hello,
+            "gap_recovery": self.handle_gap_recovery,
+            "heartbeat": self._handle_heartbeat,
+            "server_info": self._handle_server_info,
+            "get_capabilities": self._handle_get_capabilities,
+            "get_logs": self._handle_query_logs,
+            "query_logs": self._handle_query_logs,
+            "get_server_status": self._handle_server_status,
+        }
+        self._builtin_dispatch.update(
+            dict.fromkeys(_RESPONSE_MESSAGES, self._relay_response)
+        )
+        self._builtin_dispatch.update(
+            dict.fromkeys(_BROWSER_COMMANDS, self._relay_browser_command)
+        )
+
     def _generate_project_identity(self) -> dict:
         """Generate stable identity for this project.
 
@@ -67,14 +239,49 @@ class WebSocketService:
             "project_path": project_path,
         }
 
-    def _get_version(self) -> str:
-        """Get the current version string."""
+    def _find_free_port(self, first_port: int) -> int:
+        """Find the first port in range that can be bound.
+
+        A plain socket bind is far cheaper than a failed websockets.serve()
+        call, so busy ports are skipped before the server is created. The
+        probe binds every address the host resolves to with the same
+        SO_REUSEADDR setting asyncio uses, so a port left in TIME_WAIT by a
+        restarted daemon is still reused.
+
+        Args:
+            first_port: Port to start probing from
+
+        Returns:
+            First bindable port between first_port and end_port
+
+        Raises:
+            RuntimeError: If every port in range is taken
+        """
         try:
-            from .._version import __version__
+            addrinfos = socket.getaddrinfo(
+                self.host, None, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+            )
+        except OSError:
+            addrinfos = [(socket.AF_INET, socket.SOCK_STREAM, 0, "", (self.host, 0))]
+        # Mirrors loop.create_server()'s reuse_address default
+        reuse_address = os.name == "posix" and sys.platform != "cygwin"
+
+        for port in range(first_port, self.end_port + 1):
+            try:
+                for family, sock_type, proto, _, sockaddr in addrinfos:
+                    with socket.socket(family, sock_type, proto) as s:
+                        if reuse_address:
+                            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                        if family == socket.AF_INET6:
+                            s.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+                        s.bind((sockaddr[0], port, *sockaddr[2:]))
+                return port
+            except OSError:
+                continue
 
-            return __version__
-        except ImportError:
-            return "unknown"
+        raise RuntimeError(
+            f"No available port found in range {self.start_port}-{self.end_port}"
+        )
 
     async def start(self) -> int:
         """Start WebSocket server with port auto-discovery.
@@ -85,33 +292,43 @@ class WebSocketService:
         Raises:
             RuntimeError: If no available port is found
         """
-        for port in range(self.start_port, self.end_port + 1):
-            try:
-                self.server = await websockets.serve(
-                    self._handle_connection,
-                    self.host,
-                    port,
-                    ping_interval=20,
-                    ping_timeout=10,
-                )
-                self.port = port
-                logger.info(f"WebSocket server started on {self.host}:{port}")
-                return port
-            except OSError as e:
-                if port == self.end_port:
-                    raise RuntimeError(
-                        f"No available port found in range {self.start_port}-{self.end_port}"
-                    ) from e
-                continue
-
-        raise RuntimeError("Failed to start WebSocket server")
+        port = self._find_free_port(self.start_port)
+        try:
+            self.server = await self._serve(port)
+        except OSError:
+            # Another process took the port between the probe and serve()
+            port = self._find_free_port(port + 1)
+            self.server = await self._serve(port)
+
+        self.port = port
+        logger.info(f"WebSocket server started on {self.host}:{port}")
+        return port
+
+    async def _serve(self, port: int) -> _Server:
+        """Create the WebSocket server on a known-free port."""
+        server: _Server = await websockets.serve(
+            self._handle_connection,
+            self.host,
+            port,
+            ping_interval=20,
+            ping_timeout=10,
+            max_queue=self.max_queue,
+            max_size=self.max_size,
+            write_limit=self.write_limit,
+            compression=self.compression,
+        )
+        return server
 
     async def stop(self) -> None:
         """Stop the WebSocket server."""
         if self.server:
-            # Close all connections
-            for conn in list(self._connections):
-                await conn.close()
+            # Close all connections concurrently; a failed close must not
+            # stop the others or the server shutdown
+            await asyncio.gather(
+                *(conn.close() for conn in tuple(self._connections)),
+                return_exceptions=True,
+            )
+            self._connections.clear()
 
             self.server.close()
             await self.server.wait_closed()
@@ -195,23 +412,89 @@ class WebSocketService:
                 logger.error(f"Error in connection_init handler: {e}")
 
         # Find messages the client missed
-        replay_messages = self._get_messages_after_sequence(last_sequence)
+        replay_messages = self._get_messages_after_sequence(last_sequence, limit=100)
 
         # Send connection acknowledgment with replay
         ack_message = {
             "type": "connection_ack",
-            "serverVersion": self._get_version(),
+            "serverVersion": __version__,
+            "acceptsBinaryJson": True,
             "project_id": self.project_identity["project_id"],
             "project_name": self.project_identity["project_name"],
             "currentSequence": self.current_sequence,
-            "replay": replay_messages[:100],  # Limit replay to 100 messages
+            "replay": replay_messages,  # Limited to 100 messages
+            "wireFormats": ["json", "msgpack"] if MSGPACK_AVAILABLE else ["json"],
         }
 
         await self.send_message(websocket, ack_message)
         logger.info(
-            f"Sent connection_ack with {len(replay_messages[:100])} replayed messages"
+            f"Sent connection_ack with {len(replay_messages)} replayed messages"
+        )
+
+    async def handle_hello(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Handle wire format negotiation.
+
+        Clients opt into binary msgpack frames by sending
+        ``{"type": "hello", "wire": "msgpack"}``. Connections that never send
+        a hello (older extensions) keep using JSON text frames.
+
+        Args:
+            message: The hello message
+            websocket: WebSocket connection
+        """
+        wire = (
+            "msgpack"
+            if message.get("wire") == "msgpack" and MSGPACK_AVAILABLE
+            else "json"
         )
 
+        # Acknowledge in the current format before switching
+        await self.send_message(websocket, {"type": "hello_ack", "wire": wire})
+
+        if wire == "msgpack":
+            self._msgpack_connections.add(websocket)
+        else:
+            self._msgpack_connections.discard(websocket)
+        logger.info(f"Negotiated {wire} wire format with {websocket.remote_address}")
+
+    def _decode(self, message: Any) -> Dict[str, Any]:
+        """Decode an incoming frame from JSON or msgpack.
+
+        Binary frames carry either msgpack or UTF-8 JSON. Every message is a
+        map, so a msgpack frame can never start with ``{``.
+
+        Args:
+            message: Raw frame (str for text frames, bytes for binary frames)
+
+        Returns:
+            Decoded message dictionary
+        """
+        if (
+            isinstance(message, bytes)
+            and MSGPACK_AVAILABLE
+            and not message.startswith(b"{")
+        ):
+            return msgpack.unpackb(message, raw=False)
+        return _json_loads(message)
+
+    def _encode(
+        self, websocket: WebSocketServerProtocol, message: Dict[str, Any]
+    ) -> Any:
+        """Encode an outgoing message in the connection's negotiated wire format.
+
+        Args:
+            websocket: Target WebSocket connection
+            message: Message to encode
+
+        Returns:
+            bytes for msgpack connections, JSON str otherwise
+        """
+        if websocket in self._msgpack_connections:
+            return msgpack.packb(message, use_bin_type=True)
+        return _json_dumps(message)
+
     async def handle_gap_recovery(
         self, message: dict, websocket: WebSocketServerProtocol
     ) -> None:
@@ -267,18 +550,21 @@ class WebSocketService:
 
         logger.info(f"Gap recovery complete: sent {len(recovery_messages)} messages")
 
-    def _get_messages_after_sequence(self, last_sequence: int) -> List[dict]:
+    def _get_messages_after_sequence(
+        self, last_sequence: int, limit: Optional[int] = None
+    ) -> List[dict]:
         """Get messages with sequence > last_sequence.
 
         Args:
             last_sequence: Last sequence number received by client
+            limit: Optional maximum number of messages to return
 
         Returns:
             List of messages that occurred after the given sequence
         """
-        return [
-            msg for msg in self.message_buffer if msg.get("sequence", 0) > last_sequence
-        ]
+        start = self._buffer_index(last_sequence + 1)
+        stop = None if limit is None else start + limit
+        return list(itertools.islice(self.message_buffer, start, stop))
 
     def _get_messages_in_range(
         self, from_seq: int, to_seq: int
@@ -292,15 +578,35 @@ class WebSocketService:
         Returns:
             List of messages in the sequence range
         """
-        return [
-            msg
-            for msg in self.message_buffer
-            if msg.get("sequence", 0) >= from_seq and msg.get("sequence", 0) <= to_seq
-        ]
+        start = self._buffer_index(from_seq)
+        stop = max(start, self._buffer_index(to_seq + 1))
+        return list(itertools.islice(self.message_buffer, start, stop))
+
+    def _buffer_index(self, sequence: int) -> int:
+        """Map a sequence number to its position in message_buffer.
+
+        _add_sequence numbers messages consecutively and appends them in
+        order, so the buffer always holds a contiguous run of sequences and
+        the position is plain arithmetic instead of a scan.
+
+        Args:
+            sequence: Sequence number
+
+        Returns:
+            Buffer index, clamped to [0, len(message_buffer)]
+        """
+        buffer = self.message_buffer
+        if not buffer:
+            return 0
+        index = sequence - buffer[0]["sequence"]
+        return min(max(index, 0), len(buffer))
 
     def _add_sequence(self, message: dict) -> dict:
         """Add sequence number to message and buffer it.
 
+        The message itself is buffered, not a copy: callers hand it off and
+        must not mutate it after sending.
+
         Args:
             message: Message to sequence
 
@@ -309,7 +615,7 @@ class WebSocketService:
         """
         self.current_sequence += 1
         message["sequence"] = self.current_sequence
-        self.message_buffer.append(message.copy())
+        self.message_buffer.append(message)
         return message
 
     async def _handle_connection(
@@ -326,8 +632,9 @@ class WebSocketService:
             path = websocket.path if hasattr(websocket, "path") else "/"
 
         self._connections.add(websocket)
+        remote_address = websocket.remote_address
         connection_info = {
-            "remote_address": websocket.remote_address,
+            "remote_address": remote_address,
             "path": path,
             "websocket": websocket,
             "server_port": self.port,  # Pass server listening port for mapping
@@ -342,13 +649,14 @@ class WebSocketService:
 
         try:
             async for message in websocket:
-                await self._handle_message(websocket, message)
+                await self._handle_message(websocket, message, remote_address)
         except websockets.exceptions.ConnectionClosed:
-            logger.debug(f"Connection closed from {websocket.remote_address}")
+            logger.debug("Connection closed from %s", remote_address)
         except Exception as e:
             logger.error(f"Error handling connection: {e}")
         finally:
             self._connections.discard(websocket)
+            self._msgpack_connections.discard(websocket)
 
             # Clear active extension if this was it
             if self._active_extension == websocket:
@@ -362,202 +670,186 @@ class WebSocketService:
                 except Exception as e:
                     logger.error(f"Error in disconnection handler: {e}")
 
-    async def _handle_message(
-        self, websocket: WebSocketServerProtocol, message: str
+    async def _handle_heartbeat(
+        self, message: dict, websocket: WebSocketServerProtocol
     ) -> None:
-        """Handle an incoming WebSocket message.
+        """Answer a heartbeat with a pong echoing its timestamp.
 
-        Args:
-            websocket: WebSocket connection
-            message: Raw message string
+        Integer timestamps on JSON connections are formatted straight into
+        the reply text; anything else goes through the regular encoder.
         """
-        try:
-            data = json.loads(message)
-            message_type = data.get("type", "unknown")
+        timestamp = message.get("timestamp", 0)
+        if type(timestamp) is int and websocket not in self._msgpack_connections:
+            try:
+                await websocket.send(_PONG_TEMPLATE % timestamp)
+            except Exception as e:
+                logger.error(f"Failed to send message: {e}")
+            return
 
-            # Handle connection initialization handshake
-            if message_type == "connection_init":
-                await self.handle_connection_init(data, websocket)
-                return
+        pong_response = {"type": "pong", "timestamp": timestamp}
+        await self.send_message(websocket, pong_response)
 
-            # Handle gap recovery request
-            if message_type == "gap_recovery":
-                await self.handle_gap_recovery(data, websocket)
-                return
+    async def _handle_server_info(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Reply with the project identity, port and server version."""
+        server_info = {
+            "type": "server_info_response",
+            "project_id": self.project_identity["project_id"],
+            "project_name": self.project_identity["project_name"],
+            "project_path": self.project_identity["project_path"],
+            "port": self.port,
+            "version": __version__,
+            "capabilities": list(_CAPABILITIES),
+        }
+        await self.send_message(websocket, server_info)
 
-            # Handle heartbeat - respond with pong immediately
-            if message_type == "heartbeat":
-                pong_response = {"type": "pong", "timestamp": data.get("timestamp", 0)}
-                await self.send_message(websocket, pong_response)
-                return
+    async def _handle_get_capabilities(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Reply with the capabilities of the WebSocket control path."""
+        capabilities_response = {
+            "type": "capabilities",
+            "capabilities": list(_CAPABILITIES),
+            "controlMethod": "websocket",
+        }
+        await self.send_message(websocket, capabilities_response)
 
-            # Handle server info request
-            if message_type == "server_info":
-                server_info = {
-                    "type": "server_info_response",
-                    "project_id": self.project_identity["project_id"],
-                    "project_name": self.project_identity["project_name"],
-                    "project_path": self.project_identity["project_path"],
-                    "port": self.port,
-                    "version": self._get_version(),
-                    "capabilities": [
-                        "console_capture",
-                        "dom_interaction",
-                        "screenshots",
-                    ],
-                }
-                await self.send_message(websocket, server_info)
-                return
+    async def _handle_query_logs(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Reply with console logs from the registered query_logs handler."""
+        # Try to get logs from registered handler
+        handler = self._message_handlers.get("query_logs")
+        logs = []
+        count = 0
 
-            # Handle get_capabilities request
-            if message_type == "get_capabilities":
-                capabilities_response = {
-                    "type": "capabilities",
-                    "capabilities": [
-                        "console_capture",
-                        "dom_interaction",
-                        "screenshots",
-                    ],
-                    "controlMethod": "websocket",
-                }
-                await self.send_message(websocket, capabilities_response)
-                return
+        if handler:
+            try:
+                # Call handler to get logs
+                # Handler should return list of ConsoleMessage objects
+                port = message.get("port", self.port)
+                # Support both lastN (camelCase from doctor test) and last_n (snake_case)
+                last_n = message.get("lastN", message.get("last_n", 100))
+                level_filter = message.get("level_filter")
+
+                result = await handler(
+                    port=port, last_n=last_n, level_filter=level_filter
+                )
 
-            # Handle get_logs/query_logs request (both message types supported)
-            if message_type in ["get_logs", "query_logs"]:
-                # Try to get logs from registered handler
-                handler = self._message_handlers.get("query_logs")
-                logs = []
-                count = 0
-
-                if handler:
-                    try:
-                        # Call handler to get logs
-                        # Handler should return list of ConsoleMessage objects
-                        port = data.get("port", self.port)
-                        # Support both lastN (camelCase from doctor test) and last_n (snake_case)
-                        last_n = data.get("lastN", data.get("last_n", 100))
-                        level_filter = data.get("level_filter")
-
-                        result = await handler(
-                            port=port, last_n=last_n, level_filter=level_filter
-                        )
-
-                        # Convert ConsoleMessage objects to dicts if needed
-                        if result:
-                            logs = [
-                                msg.to_dict() if hasattr(msg, "to_dict") else msg
-                                for msg in result
-                            ]
-                            count = len(logs)
-                    except Exception as e:
-                        logger.error(f"Error querying logs: {e}")
-
-                logs_response = {"type": "logs", "logs": logs, "count": count}
-                await self.send_message(websocket, logs_response)
-                return
+                # Convert ConsoleMessage objects to dicts if needed
+                if result:
+                    logs = [
+                        msg.to_dict() if hasattr(msg, "to_dict") else msg
+                        for msg in result
+                    ]
+                    count = len(logs)
+            except Exception as e:
+                logger.error(f"Error querying logs: {e}")
 
-            # Handle response messages from extension - broadcast back to other connections (CLI/MCP clients)
-            response_messages = [
-                "content_extracted",
-                "dom_response",
-                "page_content",
-                "semantic_dom_extracted",
-                "ascii_layout_extracted",
-                "screenshot_captured",
-                "dom_command_response",
-                "tab_info_response",
-                "evaluate_js_response",
-                "error",  # Extension error responses (e.g., no_registered_tab)
-            ]
-            if message_type in response_messages:
-                logger.info(f"Broadcasting response message: {message_type}")
-                other_connections = [c for c in self._connections if c != websocket]
-                for conn in other_connections:
-                    try:
-                        await conn.send(json.dumps(data))
-                        logger.debug(f"Sent {message_type} response to client")
-                    except Exception as e:
-                        logger.error(f"Failed to send response to client: {e}")
-                # Also call handler if registered (for MCP tool Future resolution)
-                handler = self._message_handlers.get(message_type)
-                if handler:
-                    await handler(data)
-                return
+        logs_response = {"type": "logs", "logs": logs, "count": count}
+        await self.send_message(websocket, logs_response)
 
-            # Handle browser control commands - broadcast to all connections (including browser extension)
-            browser_commands = [
-                "navigate",
-                "click",
-                "fill_field",
-                "scroll",
-                "get_page_content",
-                "dom_command",
-                "extract_content",
-                "extract_semantic_dom",
-                "extract_ascii_layout",
-                "capture_screenshot",
-                "get_tab_info",
-                "evaluate_js",
-            ]
-            # Handle server status query (returns server + extension connection status)
-            if message_type == "get_server_status":
-                # Check if active extension is connected (websockets ServerConnection uses .open property)
-                extension_connected = self._active_extension is not None and getattr(
-                    self._active_extension, "open", True
-                )
-                status_response = {
-                    "type": "server_status_response",
-                    "server_running": True,
-                    "extension_connected": extension_connected,
-                    "port": self._port,
-                    "project_id": self._project_id,
-                    "project_name": self._project_name,
-                    "active_connections": len(self._connections),
-                }
-                await self.send_message(websocket, status_response)
-                return
+    async def _relay_response(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Relay an extension response to the other (CLI/MCP) connections."""
+        message_type = message["type"]
+        logger.info(f"Broadcasting response message: {message_type}")
+        other_connections = [c for c in self._connections if c != websocket]
+        for conn in other_connections:
+            try:
+                await conn.send(self._encode(conn, message))
+                logger.debug("Sent %s response to client", message_type)
+            except Exception as e:
+                logger.error(f"Failed to send response to client: {e}")
+        # Also call handler if registered (for MCP tool Future resolution)
+        handler = self._message_handlers.get(message_type)
+        if handler:
+            await handler(message)
+
+    async def _handle_server_status(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Reply with server and extension connection status."""
+        # Check if active extension is connected (websockets ServerConnection uses .open property)
+        extension_connected = self._active_extension is not None and getattr(
+            self._active_extension, "open", True
+        )
+        status_response = {
+            "type": "server_status_response",
+            "server_running": True,
+            "extension_connected": extension_connected,
+            "port": self.port,
+            "project_id": self.project_identity["project_id"],
+            "project_name": self.project_identity["project_name"],
+            "active_connections": len(self._connections),
+        }
+        await self.send_message(websocket, status_response)
 
-            if message_type in browser_commands:
-                logger.info(f"Broadcasting browser command: {message_type}")
-                # Check if there are other connections besides the sender
-                logger.info(f"Total connections: {len(self._connections)}")
-                other_connections = [c for c in self._connections if c != websocket]
+    async def _relay_browser_command(
+        self, message: dict, websocket: WebSocketServerProtocol
+    ) -> None:
+        """Relay a browser control command to the extension connections."""
+        message_type = message["type"]
+        logger.info(f"Broadcasting browser command: {message_type}")
+        # Check if there are other connections besides the sender
+        logger.info(f"Total connections: {len(self._connections)}")
+        other_connections = [c for c in self._connections if c != websocket]
+        logger.info(f"Other connections (excluding sender): {len(other_connections)}")
+        if not other_connections:
+            logger.warning(
+                f"No browser extension connected to receive command: {message_type}"
+            )
+            # Send error back to sender
+            await self.send_message(
+                websocket,
+                {
+                    "type": "error",
+                    "message": "No browser extension connected. Please ensure the extension is installed and connected.",
+                    "command": message_type,
+                },
+            )
+            return
+        # Broadcast to all other connections (browser extensions)
+        logger.info(f"Broadcasting to {len(other_connections)} connections")
+        for conn in other_connections:
+            try:
+                await conn.send(self._encode(conn, message))
                 logger.info(
-                    f"Other connections (excluding sender): {len(other_connections)}"
+                    f"Sent {message_type} command to connection at {conn.remote_address}"
                 )
-                if not other_connections:
-                    logger.warning(
-                        f"No browser extension connected to receive command: {message_type}"
-                    )
-                    # Send error back to sender
-                    await self.send_message(
-                        websocket,
-                        {
-                            "type": "error",
-                            "message": "No browser extension connected. Please ensure the extension is installed and connected.",
-                            "command": message_type,
-                        },
-                    )
-                    return
-                # Broadcast to all other connections (browser extensions)
-                logger.info(f"Broadcasting to {len(other_connections)} connections")
-                for conn in other_connections:
-                    try:
-                        await conn.send(json.dumps(data))
-                        logger.info(
-                            f"Sent {message_type} command to connection at {conn.remote_address}"
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to send command to browser: {e}")
+            except Exception as e:
+                logger.error(f"Failed to send command to browser: {e}")
+
+    async def _handle_message(
+        self,
+        websocket: WebSocketServerProtocol,
+        message: str,
+        remote_address: Any = None,
+    ) -> None:
+        """Handle an incoming WebSocket message.
+
+        Args:
+            websocket: WebSocket connection
+            message: Raw message (JSON text or msgpack binary frame)
+            remote_address: Peer address captured when the connection opened;
+                read from the connection when not given
+        """
+        try:
+            data = self._decode(message)
+            message_type = data.get("type", "unknown")
+
+            builtin = self._builtin_dispatch.get(message_type)
+            if builtin:
+                await builtin(data, websocket)
                 return
 
             # Add connection info to data
             data["_websocket"] = websocket
-            data["_remote_address"] = websocket.remote_address
+            data["_remote_address"] = remote_address or websocket.remote_address
 
-            # Debug: Log all incoming message types that aren't response/browser commands
-            logger.info(f"Processing message type: {message_type}")
+            logger.debug("Processing message type: %s", message_type)
 
             # Find and call appropriate handler
             handler = self._message_handlers.get(
@@ -569,7 +861,7 @@ class WebSocketService:
             else:
                 logger.warning(f"No handler for message type: {message_type}")
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
@@ -590,7 +882,7 @@ class WebSocketService:
         try:
             if add_sequence:
                 message = self._add_sequence(message)
-            await websocket.send(json.dumps(message))
+            await websocket.send(self._encode(websocket, message))
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
 
@@ -609,19 +901,17 @@ class WebSocketService:
         if add_sequence:
             message = self._add_sequence(message)
 
-        message_str = json.dumps(message)
-        tasks = []
-
-        for websocket in self._connections:
-            tasks.append(websocket.send(message_str))
-
-        # Send to all connections concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Log any errors
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Failed to broadcast message: {result}")
+        # websockets.broadcast writes each frame without a coroutine or Future
+        # per connection; connections that are not open are skipped and send
+        # errors are logged by websockets instead of failing the fan-out.
+        msgpack_connections = self._msgpack_connections & self._connections
+        websockets.broadcast(
+            self._connections - msgpack_connections, _json_dumps(message)
+        )
+        if msgpack_connections:
+            websockets.broadcast(
+                msgpack_connections, msgpack.packb(message, use_bin_type=True)
+            )
 
     def get_connection_count(self) -> int:
         """Get the number of active connections.
@@ -371,9 +371,9 @@ class TestFillField:
                 "#input", "Value with 'quotes'", "Safari"
             )
 
-            # Verify escaping occurred in the JavaScript
+            # Arguments are passed as one JSON literal, quotes intact
             assert executed_js is not None
-            assert "\\'" in executed_js
+            assert '"value": "Value with \'quotes\'"' in executed_js
 
 
 class TestGetElement:
@@ -0,0 +1,60 @@
+"""Unit tests for capability report caching and formatting."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.tools.capability_tool_service import CapabilityToolService
+
+REPORT = {
+    "summary": "Extension connected",
+    "capabilities": ["screenshots"],
+    "methods": {"extension": {"available": True, "description": "WebSocket"}},
+}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_report_reuses_formatted_text():
+    """The report is only re-rendered when its content changes."""
+    detector = MagicMock()
+    detector.get_capability_report = AsyncMock(
+        side_effect=[REPORT, dict(REPORT), {**REPORT, "summary": "Changed"}]
+    )
+    detector.has_extension_connection = AsyncMock(return_value=True)
+    service = CapabilityToolService(detector)
+    service.CAPABILITY_TTL = 0  # re-run detection on every call
+
+    with patch.object(
+        service,
+        "_format_capability_report",
+        wraps=service._format_capability_report,
+    ) as fmt:
+        first = await service.handle_get_capabilities()
+        second = await service.handle_get_capabilities()
+        third = await service.handle_get_capabilities()
+
+    assert fmt.call_count == 2
+    assert first["formatted_text"] == second["formatted_text"]
+    assert "**Summary:** Changed" in third["formatted_text"]
+
+
+@pytest.mark.asyncio
+async def test_detection_cached_until_ttl_or_connection_change():
+    """Detection re-runs only after the TTL or when the extension (dis)connects."""
+    detector = MagicMock()
+    detector.get_capability_report = AsyncMock(return_value=REPORT)
+    detector.has_extension_connection = AsyncMock(return_value=True)
+    service = CapabilityToolService(detector)
+
+    await service.handle_get_capabilities()
+    await service.handle_get_capabilities()
+    assert detector.get_capability_report.await_count == 1
+
+    detector.has_extension_connection.return_value = False
+    await service.handle_get_capabilities()
+    assert detector.get_capability_report.await_count == 2
+
+    cached_at, connected, result = service._result_cache
+    service._result_cache = (cached_at - service.CAPABILITY_TTL, connected, result)
+    await service.handle_get_capabilities()
+    assert detector.get_capability_report.await_count == 3
@@ -0,0 +1,135 @@
+"""Unit tests for semantic DOM formatting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.services.tools.content_extraction_tool_service import (
+    ContentExtractionToolService,
+)
+
+DOM = {
+    "title": "Example",
+    "url": "https://example.com",
+    "headings": [{"level": 1, "text": "Welcome"}],
+    "landmarks": [],
+    "links": [{"text": "About", "href": "https://example.com/about"}],
+    "forms": [],
+}
+
+
+def test_semantic_dom_sections():
+    """Only non-empty sections are emitted, and they join to the full text."""
+    service = ContentExtractionToolService()
+
+    sections = service._format_semantic_dom_sections(DOM, {})
+
+    assert len(sections) == 3
+    assert sections[0] == "# Example\nURL: https://example.com\n"
+    assert sections[1].startswith("## Outline")
+    assert sections[2].startswith("## Links (1)")
+    assert service._format_semantic_dom(DOM, {}) == "\n".join(sections)
+
+
+def test_semantic_dom_sections_respect_options():
+    """Excluded sections are skipped."""
+    service = ContentExtractionToolService()
+
+    sections = service._format_semantic_dom_sections(
+        DOM, {"include_headings": False, "include_links": False}
+    )
+
+    assert sections == ["# Example\nURL: https://example.com\n"]
+
+
+@pytest.mark.asyncio
+async def test_semantic_dom_sections_follow_page_content():
+    """Re-extracting a page whose text changed returns the new text."""
+    service = ContentExtractionToolService()
+    renamed = {**DOM, "headings": [{"level": 1, "text": "Goodbye"}]}
+
+    first = await service._get_semantic_dom_sections(DOM, {})
+    second = await service._get_semantic_dom_sections(renamed, {})
+
+    assert "Welcome" in first[1]
+    assert "Goodbye" in second[1]
+
+
+def test_article_truncation_marker():
+    """Oversized text is cut and the omitted count reported once."""
+    service = ContentExtractionToolService()
+
+    text = service._format_article_content(
+        {"title": "Long", "textContent": "a" * 50010}
+    )
+    assert text.endswith("a" * 50000 + "\n\n[Truncated 10 chars]")
+
+    text = service._format_article_content(
+        {"title": "Clipped", "textContent": "b" * 100, "truncated": True, "length": 150}
+    )
+    assert text.endswith("b" * 100 + "\n\n[Truncated 50 chars]")
+
+
+@pytest.mark.asyncio
+async def test_large_semantic_dom_formatted_off_loop():
+    """Link-heavy pages are formatted in a worker thread."""
+    service = ContentExtractionToolService()
+    dom = {**DOM, "links": [{"text": "x", "href": "h"}] * 1000}
+
+    with patch(
+        "src.services.tools.content_extraction_tool_service.asyncio.to_thread",
+        wraps=asyncio.to_thread,
+    ) as to_thread:
+        sections = await service._get_semantic_dom_sections(dom, {})
+
+    to_thread.assert_called_once()
+    assert sections[2].startswith("## Links (1000)")
+
+
+def test_links_capped_by_extension_report_page_total():
+    """totalLinks from the extension drives the header and the '+N more' line."""
+    service = ContentExtractionToolService()
+    dom = {**DOM, "links": [{"text": "x", "href": "h"}] * 50, "totalLinks": 420}
+
+    links = service._format_semantic_dom_sections(dom, {})[2]
+
+    assert links.startswith("## Links (420)")
+    assert links.endswith("  ... +370 more\n")
+
+
+def test_forms_capped_by_extension_report_page_total():
+    """totalForms from the extension drives the forms header and overflow line."""
+    service = ContentExtractionToolService()
+    form = {"name": "f", "fields": [{"type": "text", "name": "q"}]}
+    dom = {**DOM, "forms": [form] * 20, "totalForms": 23}
+
+    forms = service._format_semantic_dom_sections(dom, {})[-1]
+
+    assert forms.startswith("## Forms (23)")
+    assert forms.count("### f") == 20
+    assert forms.endswith("  ... +3 more\n")
+
+
+def test_semantic_dom_header_only():
+    """With every section excluded only the title/URL header is rendered."""
+    service = ContentExtractionToolService()
+    options = dict.fromkeys(
+        ("include_headings", "include_landmarks", "include_links", "include_forms"),
+        False,
+    )
+
+    assert service._format_semantic_dom_sections(DOM, options) == [
+        "# Example\nURL: https://example.com\n"
+    ]
+
+
+def test_semantic_dom_empty_page():
+    """A page with no semantic elements gets an explicit marker."""
+    service = ContentExtractionToolService()
+    dom = {"title": "Blank", "url": "about:blank"}
+
+    assert service._format_semantic_dom_sections(dom, {}) == [
+        "# Blank\nURL: about:blank\n",
+        "[No semantic structure detected]\n",
+    ]
@@ -0,0 +1,77 @@
+"""Unit tests for DOM command write coalescing in BrowserService."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.browser_service import BrowserService
+
+
+async def _add_extension(browser_service, mock_ws):
+    """Register a mock extension connection and return it."""
+    conn = await browser_service.browser_state.add_connection(
+        port=57803, server_port=8851, websocket=mock_ws
+    )
+    conn.is_extension = True
+    mock_ws.closed = False
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_single_command_sent_unbatched():
+    """A lone DOM command is sent as a plain dom_command frame."""
+    browser_service = BrowserService()
+    mock_ws = AsyncMock()
+    await _add_extension(browser_service, mock_ws)
+
+    result = await browser_service.send_dom_command(8851, {"type": "click"})
+
+    assert result is True
+    assert mock_ws.send.call_count == 1
+    message = json.loads(mock_ws.send.call_args[0][0])
+    assert message["type"] == "dom_command"
+    assert message["command"] == {"type": "click"}
+
+    await browser_service.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_coalesced_into_batch():
+    """Commands issued within the batch window share one websocket write."""
+    browser_service = BrowserService()
+    mock_ws = AsyncMock()
+    await _add_extension(browser_service, mock_ws)
+
+    results = await asyncio.gather(
+        *(
+            browser_service.send_dom_command(8851, {"type": "fill", "index": i})
+            for i in range(5)
+        )
+    )
+
+    assert all(results)
+    assert mock_ws.send.call_count == 1
+    message = json.loads(mock_ws.send.call_args[0][0])
+    assert message["type"] == "dom_command_batch"
+    assert [c["command"]["index"] for c in message["commands"]] == list(range(5))
+
+    await browser_service.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_send_failure_reported_to_all_waiters():
+    """A failed batch write fails every command in the batch."""
+    browser_service = BrowserService()
+    mock_ws = AsyncMock()
+    mock_ws.send.side_effect = ConnectionError("socket closed")
+    await _add_extension(browser_service, mock_ws)
+
+    results = await asyncio.gather(
+        *(browser_service.send_dom_command(8851, {"type": "click"}) for _ in range(3))
+    )
+
+    assert results == [False, False, False]
+
+    await browser_service.cleanup()
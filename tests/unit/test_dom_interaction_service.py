@@ -0,0 +1,127 @@
+"""Unit tests for DOMInteractionService form filling."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.dom_interaction_service import DOMInteractionService
+
+
+@pytest.mark.asyncio
+async def test_fill_form_single_round_trip():
+    """All fields and the submit travel in one fill_form command."""
+    service = DOMInteractionService()
+    response = {
+        "success": True,
+        "results": [
+            {"selector": "#user", "ok": True, "error": None},
+            {"selector": "#pass", "ok": True, "error": None},
+        ],
+        "submitted": True,
+    }
+
+    with patch.object(
+        service, "_send_dom_command", AsyncMock(return_value=response)
+    ) as send:
+        result = await service.fill_form(
+            8851, {"#user": "alice", "#pass": "secret"}, submit=True
+        )
+
+    send.assert_awaited_once()
+    assert send.call_args.kwargs["command_type"] == "fill_form"
+    assert send.call_args.kwargs["params"]["fields"] == [
+        {"selector": "#user", "value": "alice"},
+        {"selector": "#pass", "value": "secret"},
+    ]
+    assert result["success"] is True
+    assert result["submitted"] is True
+    assert list(result["fields"]) == ["#user", "#pass"]
+
+
+@pytest.mark.asyncio
+async def test_fill_form_reports_field_errors():
+    """Per-field failures surface as errors and fail the fill."""
+    service = DOMInteractionService()
+    response = {
+        "success": False,
+        "results": [
+            {"selector": "#missing", "ok": False, "error": "Element not found"}
+        ],
+        "submitted": False,
+    }
+
+    with patch.object(service, "_send_dom_command", AsyncMock(return_value=response)):
+        result = await service.fill_form(8851, {"#missing": "x"})
+
+    assert result["success"] is False
+    assert result["errors"] == ["#missing: Element not found"]
+
+
+@pytest.mark.asyncio
+async def test_fill_form_falls_back_for_old_extension():
+    """Extensions without fill_form get per-field commands."""
+    service = DOMInteractionService()
+
+    with (
+        patch.object(
+            service,
+            "_send_dom_command",
+            AsyncMock(return_value={"success": False, "error": "Unknown command type"}),
+        ),
+        patch.object(
+            service, "_fill_form_per_field", AsyncMock(return_value={"success": True})
+        ) as per_field,
+    ):
+        result = await service.fill_form(8851, {"#user": "alice"})
+
+    per_field.assert_awaited_once_with(8851, {"#user": "alice"}, False, None, False)
+    assert result == {"success": True}
+
+
+@pytest.mark.asyncio
+async def test_per_field_fill_runs_concurrently():
+    """Per-field fallback issues all fills before any response arrives."""
+    service = DOMInteractionService()
+    started = []
+    release = asyncio.Event()
+
+    async def fake_fill_field(port, selector, value, tab_id=None):
+        started.append(selector)
+        await release.wait()
+        if selector == "#bad":
+            raise RuntimeError("boom")
+        return {"success": True}
+
+    with patch.object(service, "fill_field", side_effect=fake_fill_field):
+        task = asyncio.create_task(
+            service._fill_form_per_field(8851, {"#a": "1", "#bad": "2", "#c": "3"})
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert started == ["#a", "#bad", "#c"]
+        release.set()
+        result = await task
+
+    assert result["success"] is False
+    assert list(result["fields"]) == ["#a", "#c"]
+    assert result["errors"] == ["#bad: boom"]
+
+
+@pytest.mark.asyncio
+async def test_per_field_fill_reports_cancelled_field():
+    """A cancelled field fill is recorded as an error, not dereferenced."""
+    service = DOMInteractionService()
+
+    async def fake_fill_field(port, selector, value, tab_id=None):
+        if selector == "#gone":
+            raise asyncio.CancelledError()
+        return {"success": True}
+
+    with patch.object(service, "fill_field", side_effect=fake_fill_field):
+        result = await service._fill_form_per_field(8851, {"#a": "1", "#gone": "2"})
+
+    assert result["success"] is False
+    assert list(result["fields"]) == ["#a"]
+    assert len(result["errors"]) == 1
+    assert result["errors"][0].startswith("#gone:")
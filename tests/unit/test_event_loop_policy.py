@@ -0,0 +1,29 @@
+"""Unit tests for the optional uvloop event loop policy."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from src.cli.utils import server
+
+
+def test_policy_untouched_without_uvloop(monkeypatch):
+    """Without uvloop the default asyncio policy is kept."""
+    monkeypatch.setattr(server, "UVLOOP_AVAILABLE", False)
+    set_policy = MagicMock()
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", set_policy)
+
+    assert server.install_event_loop_policy() is False
+    set_policy.assert_not_called()
+
+
+def test_uvloop_policy_installed(monkeypatch):
+    """With uvloop available its policy replaces the default."""
+    fake_uvloop = MagicMock()
+    monkeypatch.setattr(server, "UVLOOP_AVAILABLE", True)
+    monkeypatch.setattr(server, "uvloop", fake_uvloop, raising=False)
+    monkeypatch.setattr(server.sys, "platform", "linux")
+    set_policy = MagicMock()
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", set_policy)
+
+    assert server.install_event_loop_policy() is True
+    set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
@@ -0,0 +1,47 @@
+"""Unit tests for form tool argument validation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.tools.form_tool_service import FormToolService
+
+
+def test_validate_form_data_normalizes_values():
+    """Scalar values are coerced to the strings the extension assigns."""
+    normalized, error = FormToolService._validate_form_data(
+        {"#name": "Ada", "#age": 36, "#agree": True}
+    )
+
+    assert error is None
+    assert normalized == {"#name": "Ada", "#age": "36", "#agree": "true"}
+
+
+@pytest.mark.parametrize(
+    "form_data, message",
+    [
+        (None, "'form_data' is required"),
+        (["#a"], "must be an object"),
+        ({" ": "x"}, "Invalid selector"),
+        ({"#a": {"nested": 1}}, "must be a string or number"),
+    ],
+)
+def test_validate_form_data_rejects_bad_input(form_data, message):
+    """Malformed form_data is rejected before any DOM command is sent."""
+    normalized, error = FormToolService._validate_form_data(form_data)
+
+    assert normalized is None
+    assert message in error
+
+
+@pytest.mark.asyncio
+async def test_fill_form_rejects_invalid_data_without_dom_call():
+    """Validation errors short-circuit before port resolution and fill_form."""
+    dom = MagicMock()
+    dom.fill_form = AsyncMock()
+    service = FormToolService(dom, port_resolver=MagicMock())
+
+    result = await service.handle_fill_form({"form_data": {"#a": [1]}})
+
+    assert result[0].text.startswith("Error: Value for '#a'")
+    dom.fill_form.assert_not_called()
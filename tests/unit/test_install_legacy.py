@@ -0,0 +1,221 @@
+"""Unit tests for the uninstall cleanup helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from src.cli.commands import install_legacy
+from src.cli.commands.install_legacy import (
+    confirm_removal,
+    create_backup,
+    format_size,
+    get_cleanup_summary,
+    get_data_directories,
+    get_directory_size,
+    remove_data_directories,
+    remove_in_background,
+    rmtree_parallel,
+)
+
+
+def test_get_directory_size(tmp_path):
+    """Nested file sizes are summed and symlinked directories are not walked."""
+    nested = tmp_path / "data" / "logs"
+    nested.mkdir(parents=True)
+    (nested / "a.log").write_bytes(b"x" * 100)
+    (tmp_path / "config.json").write_bytes(b"{}")
+    (tmp_path / "alias").symlink_to(nested, target_is_directory=True)
+
+    assert get_directory_size(tmp_path) == 102
+    assert get_directory_size(tmp_path / "missing") == 0
+
+
+def test_get_data_directories(tmp_path, monkeypatch):
+    """Existing data subdirectories come first, then their parents."""
+    home = tmp_path / "home"
+    (home / ".mcp-browser" / "logs").mkdir(parents=True)
+    (home / ".mcp-browser" / "config").write_text("not a directory")
+    project = tmp_path / "project"
+    (project / ".mcp-browser").mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.chdir(project)
+
+    assert get_data_directories() == [
+        home / ".mcp-browser" / "logs",
+        home / ".mcp-browser",
+        project / ".mcp-browser",
+    ]
+
+
+def test_rmtree_parallel(tmp_path):
+    """Every subtree and the root itself are removed."""
+    root = tmp_path / "ms-playwright"
+    for browser in ("chromium-1", "firefox-1", "webkit-1"):
+        (root / browser / "bin").mkdir(parents=True)
+        (root / browser / "bin" / "exe").write_bytes(b"x")
+    (root / ".links").write_text("")
+
+    rmtree_parallel(root)
+
+    assert not root.exists()
+
+
+def test_rmtree_parallel_refuses_symlink(tmp_path):
+    """A symlinked root is rejected without touching the linked directory."""
+    target = tmp_path / "relocated"
+    for browser in ("a", "b"):
+        (target / browser).mkdir(parents=True)
+    link = tmp_path / "ms-playwright"
+    link.symlink_to(target, target_is_directory=True)
+
+    with pytest.raises(OSError):
+        rmtree_parallel(link)
+
+    assert sorted(p.name for p in target.iterdir()) == ["a", "b"]
+
+
+def test_create_backup_copies_independent_files(tmp_path):
+    """Backed-up files match the originals without sharing their inodes."""
+    source = tmp_path / "data"
+    source.mkdir()
+    (source / "state.json").write_text('{"ok": true}')
+
+    assert create_backup([source], tmp_path / "backup")
+
+    copy = tmp_path / "backup" / "data" / "state.json"
+    assert copy.read_text() == '{"ok": true}'
+    assert copy.stat().st_ino != (source / "state.json").stat().st_ino
+
+
+def test_remove_in_background(tmp_path):
+    """The directory is moved aside at once and deleted by a child process."""
+    import time
+
+    target = tmp_path / ".mcp-browser"
+    (target / "logs").mkdir(parents=True)
+    (target / "logs" / "server.log").write_text("log")
+
+    doomed = remove_in_background(target)
+
+    assert not target.exists()
+    assert doomed.parent == tmp_path
+    deadline = time.monotonic() + 10
+    while doomed.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not doomed.exists()
+
+
+def test_remove_in_background_unlinks_symlink(tmp_path):
+    """A symlinked target loses only the link; the linked data stays."""
+    data = tmp_path / "elsewhere"
+    (data / "logs").mkdir(parents=True)
+    link = tmp_path / ".mcp-browser"
+    link.symlink_to(data, target_is_directory=True)
+
+    assert remove_in_background(link) == link
+
+    assert not link.is_symlink()
+    assert (data / "logs").is_dir()
+    assert [p.name for p in tmp_path.iterdir()] == ["elsewhere"]
+
+
+def test_background_removal_skips_nested_directories(tmp_path, monkeypatch):
+    """Only the top-level directory is moved aside when its children are listed."""
+    home = tmp_path / "home"
+    (home / ".mcp-browser" / "data").mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.chdir(tmp_path)
+    moved = []
+    monkeypatch.setattr(install_legacy, "remove_in_background", moved.append)
+
+    count, errors = remove_data_directories(backup=False, background=True)
+
+    assert moved == [home / ".mcp-browser"]
+    assert (count, errors) == (2, [])
+
+
+def test_cleanup_summary_counts_nested_directories_once(tmp_path, monkeypatch):
+    """Data subdirectories listed next to their parent are not sized twice."""
+    home = tmp_path / "home"
+    (home / ".mcp-browser" / "data").mkdir(parents=True)
+    (home / ".mcp-browser" / "data" / "db").write_bytes(b"x" * 1000)
+    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.chdir(tmp_path)
+
+    summary = get_cleanup_summary(False, True, False)
+
+    assert summary["directories"] == [
+        str(home / ".mcp-browser" / "data"),
+        str(home / ".mcp-browser"),
+    ]
+    assert summary["sizes"][str(home / ".mcp-browser")] == 1000
+    assert summary["total_size"] == 1000
+
+
+def test_confirm_removal(monkeypatch):
+    """The prompt names the operation and returns the user's answer."""
+    prompts = []
+
+    def confirm(text, default):
+        prompts.append((text, default))
+        return True
+
+    monkeypatch.setattr(install_legacy.click, "confirm", confirm)
+
+    assert confirm_removal(["/tmp/a"], "remove data") is True
+    assert prompts == [("Do you want to remove data?", False)]
+    assert confirm_removal([], "remove data") is False
+    assert len(prompts) == 1
+
+
+def test_format_size():
+    """Sizes pick their unit from the bit length and cap at TB."""
+    assert format_size(0) == "0.0 B"
+    assert format_size(1023) == "1023.0 B"
+    assert format_size(2048) == "2.0 KB"
+    assert format_size(1024**2 - 1) == "1024.0 KB"
+    assert format_size(3 * 1024**3) == "3.0 GB"
+    assert format_size(2 * 1024**5) == "2048.0 TB"
+
+
+def test_cleanup_summary_dedupes_symlinked_directories(tmp_path, monkeypatch):
+    """A local .mcp-browser symlinked to the global one is listed once."""
+    home = tmp_path / "home"
+    (home / ".mcp-browser").mkdir(parents=True)
+    (home / ".mcp-browser" / "state").write_bytes(b"x" * 10)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".mcp-browser").symlink_to(home / ".mcp-browser")
+    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.chdir(project)
+
+    summary = get_cleanup_summary(False, True, False)
+
+    assert summary["directories"] == [str(home / ".mcp-browser")]
+    assert summary["total_size"] == 10
+
+
+def test_uninstall_walks_cleanup_targets_once(tmp_path, monkeypatch):
+    """The preview summary is reused for the confirmation prompt."""
+    from click.testing import CliRunner
+
+    home = tmp_path / "home"
+    (home / ".mcp-browser" / "data").mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    real_summary = install_legacy.get_cleanup_summary
+
+    def counting_summary(*args):
+        calls.append(args)
+        return real_summary(*args)
+
+    monkeypatch.setattr(install_legacy, "get_cleanup_summary", counting_summary)
+
+    result = CliRunner().invoke(
+        install_legacy.uninstall, ["--clean-global"], input="n\n"
+    )
+
+    assert "Cleanup cancelled by user" in result.output
+    assert len(calls) == 1
+    assert (home / ".mcp-browser" / "data").is_dir()
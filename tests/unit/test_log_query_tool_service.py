@@ -0,0 +1,51 @@
+"""Unit tests for console log formatting."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.console_message import ConsoleLevel, ConsoleMessage
+from src.services.tools.log_query_tool_service import LogQueryToolService
+
+
+def test_format_log_messages():
+    """Timestamps keep millisecond precision and levels are upper-cased."""
+    messages = [
+        ConsoleMessage(
+            timestamp=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            level=ConsoleLevel.WARN,
+            message="careful",
+            port=8851,
+        ),
+        ConsoleMessage(
+            timestamp=datetime(2024, 1, 2, 13, 0, 0, 999),
+            level=ConsoleLevel.ERROR,
+            message="boom",
+            port=8851,
+            stack_trace="x" * 300,
+        ),
+    ]
+
+    text = LogQueryToolService()._format_log_messages(messages)
+
+    assert text.splitlines() == [
+        "Console logs (last 2):",
+        "",
+        "[03:04:05.678] [WARN] careful",
+        "[13:00:00.000] [ERROR] boom",
+        "  Stack: " + "x" * 200,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_level_filter_passed_as_frozenset():
+    """The level filter is turned into a set once, before the per-message checks."""
+    browser_service = MagicMock()
+    browser_service.query_logs = AsyncMock(return_value=[])
+    service = LogQueryToolService(browser_service)
+
+    await service.handle_query_logs(8851, level_filter=["error", "warn"])
+
+    level_filter = browser_service.query_logs.call_args.kwargs["level_filter"]
+    assert level_filter == frozenset({"error", "warn"})
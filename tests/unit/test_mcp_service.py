@@ -0,0 +1,310 @@
+"""Test MCP service tool dispatch."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.types import TextContent
+
+from src.services.mcp_service import MCPService
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool():
+    """Unknown tool names return an error message."""
+    service = MCPService()
+
+    result = await service._call_tool("browser_nope", {})
+
+    assert result[0].text == "Unknown tool: browser_nope"
+
+
+@pytest.mark.asyncio
+async def test_unknown_action():
+    """Unknown browser_action values return the list of valid actions."""
+    service = MCPService()
+
+    result = await service._handle_browser_action({"action": "teleport"})
+
+    assert len(result) == 1
+    assert "Unknown action: teleport" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_unknown_query():
+    """Unknown browser_query values return the list of valid queries."""
+    service = MCPService()
+
+    result = await service._handle_browser_query({"query": "everything"})
+
+    assert len(result) == 1
+    assert "Unknown query: everything" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_query_dispatch():
+    """browser_query routes to the matching handler."""
+    service = MCPService()
+
+    result = await service._tool_map["browser_query"]({"query": "capabilities"})
+
+    assert len(result) == 1
+    assert result[0].type == "text"
+
+
+def test_tool_catalog_is_static():
+    """The tool catalog is built once and lists all 5 consolidated tools."""
+    from src.services.mcp_service import _TOOLS
+
+    assert [tool.name for tool in _TOOLS] == [
+        "browser_action",
+        "browser_query",
+        "browser_screenshot",
+        "browser_form",
+        "browser_extract",
+        "browser_chain",
+    ]
+
+
+def test_service_has_no_instance_dict():
+    """MCPService declares __slots__ for its fixed attribute set."""
+    service = MCPService()
+
+    assert not hasattr(service, "__dict__")
+    assert service._tool_map["browser_form"] == service._handle_browser_form
+
+
+@pytest.mark.asyncio
+async def test_screenshot_fans_out_over_ports():
+    """A ports list captures every port and labels each result."""
+    service = MCPService()
+    service.screenshot_tool_service.handle_screenshot = AsyncMock(
+        side_effect=[
+            {"success": True, "data": "AAAA"},
+            {"success": False, "error": "no extension"},
+        ]
+    )
+
+    result = await service._handle_screenshot({"ports": [8851, 8852]})
+
+    assert [c.type for c in result] == ["text", "image", "text", "text"]
+    assert result[0].text == "Port 8851:"
+    assert result[2].text == "Port 8852:"
+    assert "no extension" in result[3].text
+
+
+@pytest.mark.asyncio
+async def test_fan_out_reports_cancelled_port():
+    """A port whose call was cancelled is reported rather than raising."""
+    service = MCPService()
+
+    async def handler(arguments):
+        if arguments["port"] == 8852:
+            raise asyncio.CancelledError()
+        return [TextContent(type="text", text="ok")]
+
+    result = await service._fan_out_ports(handler, {"ports": [8851, 8852]})
+
+    assert [c.text for c in result[:3]] == ["Port 8851:", "ok", "Port 8852:"]
+    assert result[3].text.startswith("Failed:")
+
+
+@pytest.mark.asyncio
+async def test_chain_reports_cancelled_step():
+    """A cancelled step is reported and its dependents are skipped."""
+    service = MCPService()
+    ran = []
+
+    async def fake_query(arguments):
+        raise asyncio.CancelledError()
+
+    async def fake_action(arguments):
+        ran.append(arguments)
+        return [TextContent(type="text", text="navigated")]
+
+    service._tool_map["browser_query"] = fake_query
+    service._tool_map["browser_action"] = fake_action
+
+    result = await service._handle_browser_chain(
+        {
+            "calls": [
+                {"name": "browser_query", "arguments": {"port": 8851}},
+                {
+                    "name": "browser_action",
+                    "arguments": {"port": 8851},
+                    "depends_on": [0],
+                },
+            ]
+        }
+    )
+
+    assert ran == []
+    assert result[0].text == "Step 0 (browser_query):"
+    assert result[1].text.startswith("Failed:")
+    assert result[3].text == "Failed: skipped, step 0 failed"
+
+
+@pytest.mark.asyncio
+async def test_unknown_form_action_and_extract_type():
+    """browser_form and browser_extract reject values outside their tables."""
+    service = MCPService()
+
+    form = await service._handle_browser_form({"action": "reset"})
+    extract = await service._handle_browser_extract({"extract": "pdf"})
+
+    assert "Unknown form action: reset" in form[0].text
+    assert "Unknown extract type: pdf" in extract[0].text
+
+
+@pytest.mark.asyncio
+async def test_stdout_frames_coalesced():
+    """Frames flushed within the delay reach stdout in one ordered write."""
+    from src.services.mcp_service import _CoalescingStdout
+
+    raw = AsyncMock()
+    stdout = _CoalescingStdout(raw)
+
+    for i in range(3):
+        await stdout.write(f'{{"id":{i}}}\n')
+        await stdout.flush()
+    raw.write.assert_not_called()
+
+    await asyncio.sleep(stdout.FLUSH_DELAY * 5)
+
+    raw.write.assert_awaited_once_with('{"id":0}\n{"id":1}\n{"id":2}\n')
+
+    await stdout.write("tail\n")
+    await stdout.aclose()
+    assert raw.write.call_args[0][0] == "tail\n"
+
+
+@pytest.mark.asyncio
+async def test_extract_all_runs_both_extractions():
+    """extract=all returns the article followed by the semantic DOM sections."""
+    service = MCPService()
+    service.port_resolver.resolve_port = lambda port: (8851, None)
+    service.content_extraction_tool_service.handle_extract_content = AsyncMock(
+        return_value={"formatted_text": "# Article"}
+    )
+    service.content_extraction_tool_service.handle_extract_semantic_dom = AsyncMock(
+        return_value={"formatted_text": "# Page", "sections": ["# Page", "## Links"]}
+    )
+
+    result = await service._handle_browser_extract({"extract": "all"})
+
+    assert [c.text for c in result] == ["# Article", "# Page", "## Links"]
+
+
+def test_tool_schemas_share_port_property():
+    """Every browser tool references the one shared port schema object."""
+    from src.services.mcp_service import _PORT_PROP, _TOOLS
+
+    browser_tools = [tool for tool in _TOOLS if tool.name != "browser_chain"]
+    assert all(
+        tool.inputSchema["properties"]["port"] is _PORT_PROP for tool in browser_tools
+    )
+
+
+@pytest.mark.asyncio
+async def test_chain_runs_independent_calls_concurrently():
+    """Independent steps overlap, dependents wait, and output keeps step order."""
+    service = MCPService()
+    events = []
+    release = asyncio.Event()
+
+    async def fake_query(arguments):
+        events.append(("start", arguments["port"]))
+        await release.wait()
+        return [TextContent(type="text", text=f"query {arguments['port']}")]
+
+    async def fake_action(arguments):
+        events.append(("action", arguments["port"]))
+        return [TextContent(type="text", text="navigated")]
+
+    service._tool_map["browser_query"] = fake_query
+    service._tool_map["browser_action"] = fake_action
+
+    task = asyncio.create_task(
+        service._handle_browser_chain(
+            {
+                "calls": [
+                    {"name": "browser_query", "arguments": {"port": 8851}},
+                    {"name": "browser_query", "arguments": {"port": 8852}},
+                    {
+                        "name": "browser_action",
+                        "arguments": {"port": 8851},
+                        "depends_on": [0],
+                    },
+                ]
+            }
+        )
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert events == [("start", 8851), ("start", 8852)]
+    release.set()
+    result = await task
+
+    assert events[-1] == ("action", 8851)
+    assert [c.text for c in result] == [
+        "Step 0 (browser_query):",
+        "query 8851",
+        "Step 1 (browser_query):",
+        "query 8852",
+        "Step 2 (browser_action):",
+        "navigated",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chain_locks_on_resolved_port():
+    """An auto-detected port and the same explicit port share one lock."""
+    service = MCPService()
+    service.port_resolver.resolve_port = lambda port: (port or 8851, None)
+    active = []
+    overlaps = []
+
+    async def fake_query(arguments):
+        active.append(arguments)
+        overlaps.append(len(active))
+        await asyncio.sleep(0)
+        active.remove(arguments)
+        return [TextContent(type="text", text="ok")]
+
+    service._tool_map["browser_query"] = fake_query
+
+    await service._handle_browser_chain(
+        {
+            "calls": [
+                {"name": "browser_query", "arguments": {}},
+                {"name": "browser_query", "arguments": {"port": 8851}},
+            ]
+        }
+    )
+
+    assert overlaps == [1, 1]
+    assert list(service._port_locks) == [8851]
+
+
+@pytest.mark.asyncio
+async def test_chain_rejects_forward_dependencies():
+    """depends_on may only reference earlier steps."""
+    service = MCPService()
+
+    result = await service._handle_browser_chain(
+        {"calls": [{"name": "browser_query", "depends_on": [1]}]}
+    )
+
+    assert "depends_on must list earlier steps" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_tools_list_carries_catalog_version():
+    """tools/list returns the static catalog tagged with its content hash."""
+    from src.services.mcp_service import _CATALOG_ETAG, _TOOLS
+
+    result = await MCPService()._list_tools()
+
+    assert result.tools == _TOOLS
+    assert result.meta == {"catalogVersion": _CATALOG_ETAG}
+    assert len(_CATALOG_ETAG) == 16
@@ -64,6 +64,30 @@ async def test_get_any_active_connection_no_active():
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_connection_or_any_active():
+    """Test combined lookup prefers the mapped port, then any active connection."""
+    browser_state = BrowserState()
+
+    conn1 = await browser_state.add_connection(
+        port=57803, server_port=8851, websocket=MagicMock()
+    )
+    await browser_state.add_connection(
+        port=57804, server_port=8852, websocket=MagicMock()
+    )
+
+    # Server port maps to its own client connection
+    result = await browser_state.get_connection_or_any_active(8852)
+    assert result is not None
+    assert result.port == 57804
+
+    # Inactive mapped connection falls back to another active one
+    conn1.disconnect()
+    result = await browser_state.get_connection_or_any_active(8851)
+    assert result is not None
+    assert result.port == 57804
+
+
 @pytest.mark.asyncio
 async def test_browser_service_connection_fallback_exact_match():
     """Test BrowserService._get_connection_with_fallback with exact match."""
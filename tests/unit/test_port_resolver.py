@@ -0,0 +1,69 @@
+"""Test port resolver daemon port caching."""
+
+from unittest.mock import patch
+
+from src.services.tools.port_resolver import PortResolver
+
+
+def test_explicit_port_passthrough():
+    """Explicit ports are returned unchanged without a registry lookup."""
+    resolver = PortResolver()
+
+    with patch.object(resolver, "_get_daemon_server") as lookup:
+        assert resolver.resolve_port(8851) == (8851, None)
+        lookup.assert_not_called()
+
+
+def test_daemon_port_cached_within_ttl():
+    """Back-to-back resolutions read the registry only once."""
+    resolver = PortResolver()
+
+    with patch.object(
+        resolver, "_get_daemon_server", return_value=(8851, 1234)
+    ) as lookup:
+        assert resolver.resolve_port(None) == (8851, None)
+        assert resolver.resolve_port(None) == (8851, None)
+        assert lookup.call_count == 1
+
+
+def test_expired_cache_revalidates_pid():
+    """After the TTL, a live daemon PID keeps the cache without a registry read."""
+    resolver = PortResolver()
+
+    with patch.object(
+        resolver, "_get_daemon_server", return_value=(8851, 1234)
+    ) as lookup:
+        resolver.resolve_port(None)
+        resolver._daemon_port_cached_at -= resolver.DAEMON_PORT_TTL + 1
+
+        with patch.object(resolver, "_is_daemon_alive", return_value=True):
+            assert resolver.resolve_port(None) == (8851, None)
+        assert lookup.call_count == 1
+
+        resolver._daemon_port_cached_at -= resolver.DAEMON_PORT_TTL + 1
+        lookup.return_value = (8852, 5678)
+        with patch.object(resolver, "_is_daemon_alive", return_value=False):
+            assert resolver.resolve_port(None) == (8852, None)
+        assert lookup.call_count == 2
+
+
+def test_no_daemon():
+    """No running daemon yields a helpful message."""
+    resolver = PortResolver()
+
+    with patch.object(resolver, "_get_daemon_server", return_value=None):
+        port, warning = resolver.resolve_port(None)
+
+    assert port is None
+    assert "mcp-browser start" in warning
+
+
+def test_cdp_port_redirects_to_daemon():
+    """The CDP port is swapped for the daemon port with a warning."""
+    resolver = PortResolver()
+
+    with patch.object(resolver, "_get_daemon_server", return_value=(8851, 1234)):
+        port, warning = resolver.resolve_port(PortResolver.CDP_DEFAULT_PORT)
+
+    assert port == 8851
+    assert "Using daemon port 8851" in warning
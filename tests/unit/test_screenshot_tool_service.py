@@ -0,0 +1,43 @@
+"""Unit tests for screenshot frame deduplication."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.tools.screenshot_tool_service import ScreenshotToolService
+
+
+def _service(*frames):
+    browser_service = MagicMock()
+    browser_service.capture_screenshot_via_extension = AsyncMock(
+        side_effect=[{"success": True, "data": frame} for frame in frames]
+    )
+    return ScreenshotToolService(browser_service)
+
+
+@pytest.mark.asyncio
+async def test_identical_frame_reported_unchanged():
+    """A repeat of the previous frame on the same port is not resent."""
+    service = _service("cG5nLTE=", "cG5nLTE=", "cG5nLTI=")
+
+    first = await service.handle_screenshot(8851)
+    second = await service.handle_screenshot(8851)
+    third = await service.handle_screenshot(8851)
+
+    assert first["data"] == "cG5nLTE="
+    assert second == {"success": True, "data": None, "unchanged": True, "error": None}
+    assert third["data"] == "cG5nLTI="
+
+
+@pytest.mark.asyncio
+async def test_force_and_navigation_bypass_dedup():
+    """force=True and a cleared hash both return the full image."""
+    service = _service("AAAA", "AAAA", "AAAA")
+
+    await service.handle_screenshot(8851)
+    forced = await service.handle_screenshot(8851, force=True)
+    service.clear_frame_hash(8851)
+    after_nav = await service.handle_screenshot(8851)
+
+    assert forced["data"] == "AAAA"
+    assert after_nav["data"] == "AAAA"
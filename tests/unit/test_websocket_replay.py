@@ -0,0 +1,34 @@
+"""Unit tests for WebSocket replay buffer lookups."""
+
+from src.services.websocket_service import WebSocketService
+
+
+def _service_with_messages(count: int) -> WebSocketService:
+    service = WebSocketService()
+    for i in range(count):
+        service._add_sequence({"type": "test", "data": i})
+    return service
+
+
+def test_messages_after_sequence_once_buffer_wraps():
+    """Replay starts right after the client's sequence, even past evictions."""
+    service = _service_with_messages(1200)  # sequences 201..1200 retained
+
+    assert service._get_messages_after_sequence(1195)[0]["sequence"] == 1196
+    assert len(service._get_messages_after_sequence(0)) == 1000
+    assert service._get_messages_after_sequence(1200) == []
+    assert [
+        m["sequence"] for m in service._get_messages_after_sequence(500, limit=3)
+    ] == [501, 502, 503]
+
+
+def test_messages_in_range_clamped_to_buffer():
+    """Ranges are inclusive and clipped to what is still buffered."""
+    service = _service_with_messages(1200)
+
+    assert [m["sequence"] for m in service._get_messages_in_range(199, 202)] == [
+        201,
+        202,
+    ]
+    assert service._get_messages_in_range(1300, 1400) == []
+    assert service._get_messages_in_range(600, 500) == []
@@ -0,0 +1,189 @@
+"""Unit tests for WebSocketService startup and built-in messages."""
+
+import json
+import socket
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import websocket_service
+from src.services.websocket_service import WebSocketService
+
+
+@pytest.mark.asyncio
+async def test_serve_uses_configured_limits():
+    """Queue, size and compression settings are forwarded to websockets.serve."""
+    service = WebSocketService(max_queue=64, compression="deflate")
+
+    with patch(
+        "src.services.websocket_service.websockets.serve", new=AsyncMock()
+    ) as serve:
+        await service.start()
+
+    kwargs = serve.call_args.kwargs
+    assert kwargs["max_queue"] == 64
+    assert kwargs["max_size"] == 2**20
+    assert kwargs["write_limit"] == 2**20
+    assert kwargs["compression"] == "deflate"
+
+
+@pytest.mark.asyncio
+async def test_start_skips_busy_ports_before_serving():
+    """Occupied ports are found by probing, so serve() runs only once."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+        busy.bind(("localhost", 0))
+        busy.listen()
+        taken = busy.getsockname()[1]
+        service = WebSocketService(start_port=taken, end_port=taken + 20)
+
+        with patch(
+            "src.services.websocket_service.websockets.serve", new=AsyncMock()
+        ) as serve:
+            port = await service.start()
+
+    serve.assert_awaited_once()
+    assert port > taken
+    assert serve.call_args.args[2] == port
+
+
+@pytest.mark.asyncio
+async def test_start_retries_once_when_probed_port_is_lost():
+    """A port grabbed between probe and serve() moves on to the next free one."""
+    service = WebSocketService()
+    serve = AsyncMock(side_effect=[OSError("in use"), object()])
+
+    with (
+        patch.object(WebSocketService, "_find_free_port", lambda self, first: first),
+        patch("src.services.websocket_service.websockets.serve", new=serve),
+    ):
+        port = await service.start()
+
+    assert port == service.start_port + 1
+    assert serve.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_builtin_messages_dispatched_by_table():
+    """Built-in message types are answered through the dispatch table."""
+    ws = object()
+
+    with patch.object(WebSocketService, "send_message", new=AsyncMock()) as send:
+        service = WebSocketService()
+        service.port = 8851
+        await service._handle_message(ws, '{"type": "heartbeat", "timestamp": 7.5}')
+        await service._handle_message(ws, '{"type": "server_info"}')
+
+    pong, info = (c.args[1] for c in send.call_args_list)
+    assert pong == {"type": "pong", "timestamp": 7.5}
+    assert info["type"] == "server_info_response"
+    assert info["port"] == 8851
+    assert info["version"] == websocket_service.__version__
+    assert info["project_path"] == service.project_identity["project_path"]
+
+
+def test_service_has_no_instance_dict():
+    """WebSocketService declares __slots__ for its fixed attribute set."""
+    assert not hasattr(WebSocketService(), "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_integer_heartbeat_answered_from_template():
+    """Integer heartbeats on JSON connections skip the JSON encoder."""
+    service = WebSocketService()
+    ws = AsyncMock()
+
+    with patch("src.services.websocket_service._json_dumps") as dumps:
+        await service._handle_message(
+            ws, '{"type": "heartbeat", "timestamp": 1700000000123}'
+        )
+
+    dumps.assert_not_called()
+    sent = ws.send.call_args.args[0]
+    assert json.loads(sent) == {"type": "pong", "timestamp": 1700000000123}
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_connections_concurrently():
+    """stop() closes every connection even when one close fails."""
+    service = WebSocketService()
+    service.server = AsyncMock()
+    service.server.close = lambda: None
+    good, bad = AsyncMock(), AsyncMock()
+    bad.close.side_effect = OSError("reset")
+    service._connections.update((good, bad))
+
+    await service.stop()
+
+    good.close.assert_awaited_once()
+    bad.close.assert_awaited_once()
+    assert not service._connections
+    assert service.server is None
+
+
+@pytest.mark.asyncio
+async def test_remote_address_captured_once_per_connection():
+    """Handlers get the peer address captured at connect time."""
+
+    class PeerlessWS:
+        @property
+        def remote_address(self):
+            raise AssertionError("remote_address read per message")
+
+    service = WebSocketService()
+    handler = AsyncMock()
+    service.register_message_handler("console", handler)
+
+    await service._handle_message(
+        PeerlessWS(), '{"type": "console"}', ("127.0.0.1", 57803)
+    )
+
+    assert handler.call_args.args[0]["_remote_address"] == ("127.0.0.1", 57803)
+
+
+@pytest.mark.asyncio
+async def test_relays_and_status_share_the_dispatch_table():
+    """Relayed commands and status queries resolve through one lookup."""
+    service = WebSocketService()
+    service.port = 8851
+    client, extension = AsyncMock(), AsyncMock()
+    service._connections.update((client, extension))
+
+    await service._handle_message(client, '{"type": "navigate", "url": "x"}')
+    await service._handle_message(client, '{"type": "get_server_status"}')
+
+    assert json.loads(extension.send.call_args.args[0])["type"] == "navigate"
+    status = json.loads(client.send.call_args.args[0])
+    assert status["type"] == "server_status_response"
+    assert status["port"] == 8851
+    assert status["active_connections"] == 2
+
+
+def test_find_free_port_reuses_time_wait_port():
+    """A port held only by a TIME_WAIT connection is still reported free."""
+    with socket.socket() as listener:
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        client = socket.create_connection(("127.0.0.1", port))
+        accepted, _ = listener.accept()
+        # Closing the server side first leaves the port in TIME_WAIT
+        accepted.close()
+        client.close()
+
+    service = WebSocketService(host="127.0.0.1", start_port=port, end_port=port)
+
+    assert service._find_free_port(port) == port
+
+
+def test_find_free_port_skips_listening_port():
+    """A port with a live listener is skipped for the next one in range."""
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        service = WebSocketService(
+            host="127.0.0.1", start_port=port, end_port=port + 50
+        )
+
+        assert service._find_free_port(port) > port
@@ -0,0 +1,120 @@
+"""Unit tests for WebSocket wire format negotiation."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import websocket_service
+from src.services.websocket_service import WebSocketService
+
+
+def _mock_ws():
+    ws = AsyncMock()
+    ws.remote_address = ("127.0.0.1", 57803)
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_connections_default_to_json():
+    """Connections that never negotiate keep receiving JSON text frames."""
+    service = WebSocketService()
+    ws = _mock_ws()
+
+    await service.send_message(ws, {"type": "pong", "timestamp": 1})
+
+    assert json.loads(ws.send.call_args[0][0]) == {"type": "pong", "timestamp": 1}
+
+
+@pytest.mark.asyncio
+async def test_hello_without_msgpack_falls_back_to_json(monkeypatch):
+    """Requesting msgpack without the library installed negotiates JSON."""
+    monkeypatch.setattr(websocket_service, "MSGPACK_AVAILABLE", False)
+    service = WebSocketService()
+    ws = _mock_ws()
+
+    await service._handle_message(ws, json.dumps({"type": "hello", "wire": "msgpack"}))
+
+    assert json.loads(ws.send.call_args[0][0]) == {"type": "hello_ack", "wire": "json"}
+    assert ws not in service._msgpack_connections
+
+
+@pytest.mark.asyncio
+async def test_hello_negotiates_msgpack():
+    """After negotiating msgpack, frames are decoded and sent as binary."""
+    msgpack = pytest.importorskip("msgpack")
+    service = WebSocketService()
+    ws = _mock_ws()
+
+    await service._handle_message(ws, json.dumps({"type": "hello", "wire": "msgpack"}))
+    assert ws in service._msgpack_connections
+
+    await service._handle_message(
+        ws, msgpack.packb({"type": "heartbeat", "timestamp": 42})
+    )
+
+    pong = ws.send.call_args[0][0]
+    assert isinstance(pong, bytes)
+    assert msgpack.unpackb(pong, raw=False) == {"type": "pong", "timestamp": 42}
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_json_codec_round_trip(monkeypatch, orjson_available):
+    """JSON frames round-trip identically with and without orjson."""
+    if orjson_available and not websocket_service.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(websocket_service, "ORJSON_AVAILABLE", orjson_available)
+    message = {"type": "console", "data": {"text": "héllo", "line": 3}, 7: None}
+
+    encoded = websocket_service._json_dumps(message)
+
+    assert isinstance(encoded, str)
+    assert websocket_service._json_loads(encoded) == json.loads(json.dumps(message))
+
+
+@pytest.mark.asyncio
+async def test_broadcast_json_only():
+    """Without msgpack connections a single JSON broadcast covers everyone."""
+    service = WebSocketService()
+    service._connections.update({_mock_ws(), _mock_ws()})
+
+    with patch.object(websocket_service.websockets, "broadcast") as broadcast:
+        await service.broadcast_message({"type": "tick"})
+
+    connections, frame = broadcast.call_args.args
+    broadcast.assert_called_once()
+    assert connections == service._connections
+    assert json.loads(frame) == {"type": "tick"}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_per_wire_format():
+    """JSON and msgpack connections each get one shared pre-encoded frame."""
+    msgpack = pytest.importorskip("msgpack")
+    service = WebSocketService()
+    text_ws, bin_ws = _mock_ws(), _mock_ws()
+    service._connections.update({text_ws, bin_ws})
+    service._msgpack_connections.add(bin_ws)
+
+    with patch.object(websocket_service.websockets, "broadcast") as broadcast:
+        await service.broadcast_message({"type": "tick"})
+
+    (text_conns, text_frame), (bin_conns, bin_frame) = [
+        c.args for c in broadcast.call_args_list
+    ]
+    assert text_conns == {text_ws} and json.loads(text_frame) == {"type": "tick"}
+    assert bin_conns == {bin_ws}
+    assert msgpack.unpackb(bin_frame, raw=False) == {"type": "tick"}
+
+
+@pytest.mark.asyncio
+async def test_binary_json_frames_decoded_as_json():
+    """UTF-8 JSON in a binary frame is parsed as JSON, not msgpack."""
+    service = WebSocketService()
+    ws = _mock_ws()
+
+    await service._handle_message(
+        ws, json.dumps({"type": "heartbeat", "timestamp": 9}).encode()
+    )
+
+    assert json.loads(ws.send.call_args[0][0]) == {"type": "pong", "timestamp": 9}